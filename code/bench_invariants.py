@@ -0,0 +1,89 @@
+"""
+Benchmark - batched stress invariants
+TKT4150 - Biomechanics
+
+Compares biomech.stress_invariants against the per-tensor approach used
+in ex2.1.2.py (np.trace, np.dot and np.linalg.det for every tensor).
+
+The per-tensor loop is timed on at most --loop-limit tensors and
+extrapolated linearly, since running it at N = 1e7 takes minutes.
+
+Usage:
+    python bench_invariants.py [--sizes 1e3 1e4 ...] [--loop-limit 10000]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from biomech import stress_invariants, tensor_to_voigt
+
+
+def per_tensor_invariants(tensors):
+    """Reference: the single-tensor calculation from ex2.1.2.py in a loop"""
+    out = np.empty((len(tensors), 3))
+    for k, T in enumerate(tensors):
+        I = np.trace(T)
+        II = 0.5 * (I**2 - np.trace(np.dot(T, T)))
+        III = np.linalg.det(T)
+        out[k] = I, II, III
+    return out
+
+
+def best_time(func, *args, repeat=3):
+    """Best wall time of several runs, in seconds"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def random_symmetric(n, rng):
+    """Random symmetric stress tensors, shape (n, 3, 3)"""
+    A = rng.normal(scale=50.0, size=(n, 3, 3))
+    return 0.5 * (A + np.swapaxes(A, -1, -2))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=float, nargs="+",
+                        default=[1e3, 1e4, 1e5, 1e6, 1e7])
+    parser.add_argument("--loop-limit", type=int, default=10_000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+
+    # Correctness check against the reference on a small batch
+    check = random_symmetric(100, rng)
+    reference = per_tensor_invariants(check)
+    batched = np.column_stack(stress_invariants(check))
+    voigt = np.column_stack(stress_invariants(tensor_to_voigt(check)))
+    assert np.allclose(batched, reference, rtol=1e-10, atol=1e-6)
+    assert np.allclose(voigt, reference, rtol=1e-10, atol=1e-6)
+
+    print(f"{'N':>10} {'loop [s]':>12} {'(3,3) [s]':>12} {'Voigt [s]':>12} "
+          f"{'speedup':>10}")
+    print("-" * 60)
+    for size in args.sizes:
+        n = int(size)
+        tensors = random_symmetric(n, rng)
+        voigt = tensor_to_voigt(tensors)
+
+        n_loop = min(n, args.loop_limit)
+        t_loop = best_time(per_tensor_invariants, tensors[:n_loop], repeat=1)
+        t_loop *= n / n_loop
+        t_full = best_time(stress_invariants, tensors)
+        t_voigt = best_time(stress_invariants, voigt)
+
+        marker = "*" if n_loop < n else " "
+        print(f"{n:>10d} {t_loop:>11.4f}{marker} {t_full:>12.4f} "
+              f"{t_voigt:>12.4f} {t_loop / t_voigt:>9.0f}x")
+
+    print("\n* extrapolated from the first", args.loop_limit, "tensors")
+
+
+if __name__ == "__main__":
+    main()
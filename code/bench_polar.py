@@ -0,0 +1,101 @@
+"""
+Benchmark - batched polar decomposition
+TKT4150 - Biomechanics
+
+Compares biomech.polar_decomposition against a loop of np.linalg.svd
+calls (F = W Σ Vᵀ, R = W Vᵀ, U = V Σ Vᵀ) and against one batched SVD
+call, for 2x2 and 3x3 deformation gradients.
+
+Usage:
+    python bench_polar.py [--sizes 1e3 1e4 ...] [--loop-limit 10000]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from biomech import polar_decomposition
+
+
+def svd_polar(F):
+    """Reference polar decomposition from an SVD of a single F"""
+    W, sigma, Vt = np.linalg.svd(F)
+    return W @ Vt, Vt.T @ np.diag(sigma) @ Vt
+
+
+def svd_loop(F):
+    """One np.linalg.svd call per tensor"""
+    R = np.empty_like(F)
+    U = np.empty_like(F)
+    for k in range(len(F)):
+        R[k], U[k] = svd_polar(F[k])
+    return R, U
+
+
+def svd_batched(F):
+    """One stacked np.linalg.svd call"""
+    W, sigma, Vt = np.linalg.svd(F)
+    R = W @ Vt
+    U = np.einsum('...ki,...k,...kj->...ij', Vt, sigma, Vt)
+    return R, U
+
+
+def best_time(func, *args, repeat=3):
+    """Best wall time of several runs, in seconds"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def random_deformation_gradients(n, dim, rng):
+    """Random F = I + H with det F > 0"""
+    F = np.eye(dim) + 0.2 * rng.normal(size=(n, dim, dim))
+    flip = np.linalg.det(F) < 0
+    F[flip, :, 0] *= -1
+    return F
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=float, nargs="+",
+                        default=[1e3, 1e4, 1e5, 1e6])
+    parser.add_argument("--loop-limit", type=int, default=10_000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+
+    for dim in (2, 3):
+        # Correctness check against the SVD reference
+        F = random_deformation_gradients(200, dim, rng)
+        R_ref, U_ref = svd_loop(F)
+        results = polar_decomposition(F, directions=False)
+        assert np.allclose(results['R'], R_ref, atol=1e-10)
+        assert np.allclose(results['U'], U_ref, atol=1e-10)
+
+        print(f"\n{dim}x{dim} deformation gradients")
+        print(f"{'N':>10} {'svd loop [s]':>14} {'svd batch [s]':>14} "
+              f"{'polar [s]':>12} {'vs loop':>9} {'vs batch':>9}")
+        print("-" * 74)
+        for size in args.sizes:
+            n = int(size)
+            F = random_deformation_gradients(n, dim, rng)
+
+            n_loop = min(n, args.loop_limit)
+            t_loop = best_time(svd_loop, F[:n_loop], repeat=1) * n / n_loop
+            t_batch = best_time(svd_batched, F)
+            t_polar = best_time(polar_decomposition, F, False)
+
+            marker = "*" if n_loop < n else " "
+            print(f"{n:>10d} {t_loop:>13.4f}{marker} {t_batch:>14.4f} "
+                  f"{t_polar:>12.4f} {t_loop / t_polar:>8.0f}x "
+                  f"{t_batch / t_polar:>8.1f}x")
+
+    print("\n* extrapolated from the first", args.loop_limit, "tensors")
+
+
+if __name__ == "__main__":
+    main()
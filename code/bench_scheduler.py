@@ -0,0 +1,117 @@
+"""
+Benchmark - process- and thread-pool scaling of batched load cases
+TKT4150 - Biomechanics
+
+Runs biomech.scheduler.run_batch (processes) or run_threaded (threads)
+over load cases x points tensors for an increasing number of workers and
+reports wall time, speedup and parallel efficiency against the serial
+analysis. Results are checked against the serial run.
+
+The speedup only shows scaling for worker counts up to the number of
+physical cores; beyond that, and on a single-CPU machine, it measures the
+scheduling overhead. No multi-core numbers are recorded here yet.
+
+Usage:
+    python bench_scheduler.py [--load-cases 200] [--points 50000]
+                              [--processes 1 2 4 ... 64] [--analysis stress]
+                              [--mode processes|threads] [--chunk-size N]
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+
+from biomech.scheduler import (
+    DEFAULT_THREAD_CHUNK_SIZE,
+    run_batch,
+    run_threaded,
+)
+
+
+def best_time(func, *args, repeat=3, **kwargs):
+    """Best wall time of several runs, in seconds"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args, **kwargs)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def default_process_counts():
+    """Powers of two up to the CPU count, plus the CPU count itself"""
+    cpus = os.cpu_count() or 1
+    counts = [2 ** k for k in range(cpus.bit_length()) if 2 ** k <= cpus]
+    return counts if counts[-1] == cpus else counts + [cpus]
+
+
+def random_load_cases(load_cases, points, analysis, rng):
+    """Symmetric stresses, or small displacement gradients for strains"""
+    if analysis == 'stress':
+        return rng.normal(0.0, 50.0, size=(load_cases, points, 6))
+    return rng.normal(0.0, 0.02, size=(load_cases, points, 3, 3))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--load-cases", type=int, default=200)
+    parser.add_argument("--points", type=int, default=50_000)
+    parser.add_argument("--processes", type=int, nargs="+",
+                        default=default_process_counts(),
+                        help="worker process or thread counts")
+    parser.add_argument("--analysis", default="stress",
+                        choices=["stress", "strain", "deformation"])
+    parser.add_argument("--mode", default="processes",
+                        choices=["processes", "threads"])
+    parser.add_argument("--chunk-size", type=int, default=None,
+                        help="tensors per task (default: per scheduler)")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.mode == "threads":
+        chunk_size = args.chunk_size or DEFAULT_THREAD_CHUNK_SIZE
+
+        def run(tensors, analysis, processes):
+            return run_threaded(tensors, analysis, workers=processes,
+                                chunk_size=chunk_size)
+    else:
+        def run(tensors, analysis, processes):
+            return run_batch(tensors, analysis, processes=processes,
+                             chunk_size=args.chunk_size)
+
+    rng = np.random.default_rng(0)
+    tensors = random_load_cases(args.load_cases, args.points, args.analysis,
+                                rng)
+    n = args.load_cases * args.points
+
+    reference = run_batch(tensors, args.analysis, processes=1)
+    t_serial = best_time(run_batch, tensors, args.analysis, processes=1,
+                         repeat=args.repeat)
+
+    print(f"{args.analysis} analysis, {args.load_cases} load cases x "
+          f"{args.points} points = {n} tensors, {os.cpu_count()} CPUs, "
+          f"{args.mode}")
+    if max(args.processes) > (os.cpu_count() or 1):
+        print("note: more workers than CPUs, speedups beyond the CPU count "
+              "show overhead only")
+    print(f"{'workers':>10} {'time [s]':>10} {'tensors/s':>12} "
+          f"{'speedup':>9} {'efficiency':>11}")
+    print("-" * 56)
+    print(f"{'serial':>10} {t_serial:>10.3f} {n / t_serial:>12.3g} "
+          f"{1.0:>8.2f}x {1.0:>10.0%}")
+
+    for processes in args.processes:
+        results = run(tensors, args.analysis, processes)
+        assert all(np.array_equal(results[name], reference[name])
+                   for name in reference)
+        t_pool = best_time(run, tensors, args.analysis, processes,
+                           repeat=args.repeat)
+        speedup = t_serial / t_pool
+        print(f"{processes:>10d} {t_pool:>10.3f} {n / t_pool:>12.3g} "
+              f"{speedup:>8.2f}x {speedup / processes:>10.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+TKT4150 Biomechanics - batched tensor analysis
+
+Reusable, vectorized versions of the calculations done for a single
+hard-coded tensor in the exercise scripts. All functions work on stacks
+of tensors, shape (N, 3, 3), or on Voigt arrays, shape (N, 6).
+"""
+
+from .anisotropy import (
+    AnisotropicElasticity,
+    bond_matrix,
+    fibre_frame,
+    orthotropic_stiffness,
+    rotate_stiffness,
+    transversely_isotropic_stiffness,
+)
+from .elasticity import (
+    IsotropicElasticity,
+    isotropic_compliance,
+    isotropic_stiffness,
+    lame_parameters,
+)
+from .failure import (
+    BONE_YIELD_STRENGTH,
+    evaluate_failure,
+    max_principal,
+    safety_factor,
+    tresca,
+    von_mises,
+    von_mises_principal,
+)
+from .hyperelastic import HolzapfelGasserOgden, MooneyRivlin, NeoHookean
+from .invariants import (
+    ENGINEERING_SHEAR,
+    VOIGT_ORDER,
+    as_voigt,
+    stress_invariants,
+    tensor_to_voigt,
+    voigt_index_products,
+    voigt_to_tensor,
+)
+from .kinematics import Kinematics
+from .materials import MaterialTable, material_property
+from .polar import (
+    polar_decomposition,
+    polar_factors,
+    principal_stretches,
+    right_stretch,
+)
+from .principal import (
+    deviatoric_invariants,
+    lode_angle,
+    principal_frame,
+    principal_values,
+)
+from .strain import (
+    analyze_deformation_measures,
+    analyze_strain_tensor,
+    displacement_gradient_to_strain,
+)
+from .stretch import (
+    circle_directions,
+    directional_stretch,
+    fibonacci_sphere,
+    stretch_extrema,
+)
+
+__all__ = [
+    "AnisotropicElasticity",
+    "BONE_YIELD_STRENGTH",
+    "ENGINEERING_SHEAR",
+    "HolzapfelGasserOgden",
+    "IsotropicElasticity",
+    "Kinematics",
+    "MaterialTable",
+    "MooneyRivlin",
+    "NeoHookean",
+    "VOIGT_ORDER",
+    "analyze_deformation_measures",
+    "analyze_strain_tensor",
+    "as_voigt",
+    "bond_matrix",
+    "circle_directions",
+    "deviatoric_invariants",
+    "directional_stretch",
+    "displacement_gradient_to_strain",
+    "evaluate_failure",
+    "fibonacci_sphere",
+    "fibre_frame",
+    "isotropic_compliance",
+    "isotropic_stiffness",
+    "lame_parameters",
+    "lode_angle",
+    "material_property",
+    "max_principal",
+    "orthotropic_stiffness",
+    "polar_decomposition",
+    "polar_factors",
+    "principal_frame",
+    "principal_stretches",
+    "principal_values",
+    "right_stretch",
+    "rotate_stiffness",
+    "safety_factor",
+    "stress_invariants",
+    "stretch_extrema",
+    "tensor_to_voigt",
+    "transversely_isotropic_stiffness",
+    "tresca",
+    "voigt_index_products",
+    "voigt_to_tensor",
+    "von_mises",
+    "von_mises_principal",
+]
@@ -0,0 +1,114 @@
+"""
+Command-line batch runner for the streaming analyses
+
+    python -m biomech stress stresses.npy -o stresses.jsonl
+    python -m biomech strain case1.csv case2.csv -o results/ --format npy
+    python -m biomech deformation gradients.h5 -o out.csv --quiet
+
+Analyses (see streaming.ANALYSES):
+- stress:       invariants, principal stresses, τ_max, von Mises (ex2.1.3.py)
+- strain:       small-strain analysis of ∇u (ex3.1.2a.py)
+- deformation:  Green-Lagrange strain analysis of H (ex3.2.a.py)
+
+stress accepts 9 or 6 (Voigt) components per tensor; strain and
+deformation need all 9 components of the gradient.
+
+Results are written at full precision as JSON Lines, CSV, .npy or HDF5,
+picked by the output suffix; the binary formats skip float formatting
+and are the fastest for large batches. With several inputs the output is
+a directory and each input gets <stem>.<analysis>.<format>. Progress and
+a summary go to stderr; --quiet prints nothing but errors.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from .streaming import ANALYSES, DEFAULT_CHUNK_SIZE, process_file
+
+OUTPUT_FORMATS = ("jsonl", "csv", "npy", "h5")
+
+
+def build_parser():
+    """Argument parser of the batch runner"""
+    parser = argparse.ArgumentParser(
+        prog="python -m biomech",
+        description="Run batched tensor analyses over input files and "
+                    "write structured results.")
+    parser.add_argument("analysis", choices=sorted(ANALYSES))
+    parser.add_argument("inputs", nargs="+", type=Path,
+                        help="tensor files (.csv, .npy, .h5 or .hdf5)")
+    parser.add_argument("-o", "--output", type=Path, required=True,
+                        help="result file, or directory for several inputs")
+    parser.add_argument("-f", "--format", choices=OUTPUT_FORMATS,
+                        default="jsonl",
+                        help="output format when writing to a directory "
+                             "(default: jsonl)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="tensors held in memory at a time "
+                             f"(default: {DEFAULT_CHUNK_SIZE})")
+    parser.add_argument("--dataset", default="tensors",
+                        help="dataset name for HDF5 input (default: tensors)")
+    parser.add_argument("-q", "--quiet", action="store_true",
+                        help="no progress or summary output")
+    return parser
+
+
+def output_paths(inputs, output, analysis, fmt):
+    """Pair every input file with its result file"""
+    if len(inputs) == 1 and not output.is_dir() and output.suffix:
+        return [(inputs[0], output)]
+    jobs = [(path, output / f"{path.stem}.{analysis}.{fmt}")
+            for path in inputs]
+    targets = [target for _, target in jobs]
+    duplicates = sorted({str(t) for t in targets if targets.count(t) > 1})
+    if duplicates:
+        raise ValueError(f"Inputs would overwrite each other's results: "
+                         f"{duplicates}")
+    output.mkdir(parents=True, exist_ok=True)
+    return jobs
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.chunk_size < 1:
+        print("error: --chunk-size must be positive", file=sys.stderr)
+        return 2
+
+    try:
+        jobs = output_paths(args.inputs, args.output, args.analysis,
+                            args.format)
+    except ValueError as error:
+        print(f"error: {error}", file=sys.stderr)
+        return 2
+
+    total = 0
+    start = time.perf_counter()
+    for input_path, output_path in jobs:
+        progress = None
+        if not args.quiet:
+            def progress(count, name=input_path.name):
+                print(f"\r{name}: {count} tensors", end="", file=sys.stderr)
+        try:
+            count = process_file(input_path, output_path, args.analysis,
+                                 args.chunk_size, args.dataset, progress)
+        except (OSError, ValueError, ImportError) as error:
+            if not args.quiet:
+                print(file=sys.stderr)
+            print(f"error: {input_path}: {error}", file=sys.stderr)
+            return 1
+        total += count
+        if not args.quiet:
+            print(f"\r{input_path.name}: {count} tensors -> {output_path}",
+                  file=sys.stderr)
+
+    if not args.quiet:
+        elapsed = time.perf_counter() - start
+        print(f"{args.analysis}: {total} tensors in {elapsed:.2f} s",
+              file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,258 @@
+"""
+Orthotropic and transversely isotropic linear elasticity
+
+Material constants are given in the material frame with axes 1, 2, 3. For
+transverse isotropy axis 3 is the symmetry axis, e.g. the long axis of
+cortical bone or a fibre direction. Stiffness and compliance matrices
+use the engineering Voigt convention of elasticity.py.
+
+Orientation is given per point as a rotation R whose columns are the
+material axes in global coordinates, x = R x', or as fibre directions
+(see fibre_frame). A symmetric tensor then transforms as A = R A' Rᵀ and
+in Voigt form as σ = K σ' with the 6x6 Bond matrix K, so
+
+    C = K C' Kᵀ
+
+bond_matrix() builds K for a whole batch of rotations from gathered
+products of rotation components, without forming 3x3x3x3 tensors.
+AnisotropicElasticity avoids per-point 6x6 matrices altogether: strains
+are rotated into the material frame, multiplied by the material
+stiffness and rotated back.
+"""
+
+from functools import cached_property
+
+import numpy as np
+
+from .invariants import (
+    ENGINEERING_SHEAR,
+    VOIGT_COLS,
+    VOIGT_ROWS,
+    as_voigt,
+    tensor_to_voigt,
+    voigt_index_products,
+    voigt_to_tensor,
+)
+from .materials import material_property
+
+_SHEAR = VOIGT_ROWS != VOIGT_COLS
+
+
+def orthotropic_compliance(E1, E2, E3, nu12, nu13, nu23, G12, G13, G23):
+    """
+    Orthotropic compliance matrix in the material frame
+
+    ν_ij is the contraction in direction j for a stress in direction i,
+    with ν_ij / E_i = ν_ji / E_j. All constants may be arrays.
+
+    Returns:
+    (..., 6, 6) array
+    """
+    E1, E2, E3, nu12, nu13, nu23, G12, G13, G23 = np.broadcast_arrays(
+        *[np.asarray(value, dtype=float)
+          for value in (E1, E2, E3, nu12, nu13, nu23, G12, G13, G23)])
+    compliance = np.zeros(E1.shape + (6, 6))
+    compliance[..., 0, 0] = 1 / E1
+    compliance[..., 1, 1] = 1 / E2
+    compliance[..., 2, 2] = 1 / E3
+    compliance[..., 0, 1] = compliance[..., 1, 0] = -nu12 / E1
+    compliance[..., 0, 2] = compliance[..., 2, 0] = -nu13 / E1
+    compliance[..., 1, 2] = compliance[..., 2, 1] = -nu23 / E2
+    compliance[..., 3, 3] = 1 / G23
+    compliance[..., 4, 4] = 1 / G13
+    compliance[..., 5, 5] = 1 / G12
+    return compliance
+
+
+def orthotropic_stiffness(E1, E2, E3, nu12, nu13, nu23, G12, G13, G23):
+    """
+    Orthotropic stiffness matrix in the material frame
+
+    Parameters as for orthotropic_compliance().
+
+    Returns:
+    (..., 6, 6) array
+    """
+    compliance = orthotropic_compliance(E1, E2, E3, nu12, nu13, nu23,
+                                        G12, G13, G23)
+    stiffness = np.zeros_like(compliance)
+    # The normal block inverts on its own; the shear terms are uncoupled
+    stiffness[..., :3, :3] = np.linalg.inv(compliance[..., :3, :3])
+    stiffness[..., [3, 4, 5], [3, 4, 5]] = 1 / compliance[..., [3, 4, 5],
+                                                          [3, 4, 5]]
+    return stiffness
+
+
+def transversely_isotropic_constants(E_axial, E_transverse, nu_axial,
+                                     nu_transverse, G_axial):
+    """
+    Orthotropic constants of a transversely isotropic material
+
+    Parameters:
+    E_axial: Young's modulus along the symmetry axis 3
+    E_transverse: Young's modulus in the transverse 1-2 plane
+    nu_axial: ν_31, transverse contraction for axial stress
+    nu_transverse: ν_12, in-plane Poisson's ratio
+    G_axial: shear modulus G_13 = G_23
+
+    Returns:
+    Dictionary of the keyword arguments of orthotropic_stiffness()
+    """
+    E_transverse = np.asarray(E_transverse, dtype=float)
+    nu_13 = nu_axial * E_transverse / E_axial
+    return {
+        'E1': E_transverse, 'E2': E_transverse, 'E3': E_axial,
+        'nu12': nu_transverse, 'nu13': nu_13, 'nu23': nu_13,
+        'G12': E_transverse / (2 * (1 + nu_transverse)),
+        'G13': G_axial, 'G23': G_axial,
+    }
+
+
+def transversely_isotropic_stiffness(E_axial, E_transverse, nu_axial,
+                                     nu_transverse, G_axial):
+    """
+    Transversely isotropic stiffness matrix, symmetry axis 3
+
+    Parameters as for transversely_isotropic_constants().
+
+    Returns:
+    (..., 6, 6) array
+    """
+    return orthotropic_stiffness(**transversely_isotropic_constants(
+        E_axial, E_transverse, nu_axial, nu_transverse, G_axial))
+
+
+def fibre_frame(fibres, transverse=None):
+    """
+    Material frames with axis 3 along the fibre direction
+
+    Parameters:
+    fibres: (..., 3) fibre directions, any length
+    transverse: optional (..., 3) directions for material axis 1,
+                projected onto the plane normal to the fibre; by default
+                the global axis least aligned with the fibre is used
+
+    Returns:
+    (..., 3, 3) rotations with the material axes as columns
+    """
+    e3 = np.asarray(fibres, dtype=float)
+    e3 = e3 / np.linalg.norm(e3, axis=-1, keepdims=True)
+    if transverse is None:
+        transverse = np.eye(3)[np.argmin(np.abs(e3), axis=-1)]
+    transverse = np.asarray(transverse, dtype=float)
+    e1 = transverse - np.sum(transverse * e3, axis=-1, keepdims=True) * e3
+    e1 = e1 / np.linalg.norm(e1, axis=-1, keepdims=True)
+    e2 = np.cross(e3, e1)
+    return np.stack([e1, e2, e3], axis=-1)
+
+
+def bond_matrix(rotations):
+    """
+    6x6 Bond matrices K with voigt(R A Rᵀ) = K voigt(A)
+
+    Voigt vectors hold stress (tensor) shear components, so K rotates
+    stresses and K⁻ᵀ rotates engineering strains.
+
+    Parameters:
+    rotations: (..., 3, 3) rotation matrices
+
+    Returns:
+    (..., 6, 6) array
+    """
+    direct, crossed = voigt_index_products(rotations)
+    return direct + _SHEAR * crossed
+
+
+def rotate_stiffness(stiffness, rotations):
+    """
+    Stiffness matrices in global coordinates, C = K C' Kᵀ
+
+    Parameters:
+    stiffness: (..., 6, 6) material-frame stiffness
+    rotations: (..., 3, 3) rotations, broadcast against stiffness
+
+    Returns:
+    (..., 6, 6) array
+    """
+    K = bond_matrix(rotations)
+    return K @ np.asarray(stiffness, dtype=float) @ np.swapaxes(K, -1, -2)
+
+
+class AnisotropicElasticity:
+    """
+    Linear elasticity with a material-frame stiffness and per-point
+    orientation
+
+    Parameters:
+    stiffness: (6, 6) material-frame stiffness shared by all points,
+               per-point (..., 6, 6), or one per material (M, 6, 6)
+               with material_ids
+    rotations: optional (..., 3, 3) material frames, see fibre_frame()
+    material_ids: optional material ID per point
+
+    Strains and stresses are (..., 3, 3) or Voigt (..., 6) with tensor
+    shear components, and results are returned in the layout of the input.
+
+    Example:
+    >>> C = transversely_isotropic_stiffness(20e3, 12e3, 0.3, 0.4, 4.5e3)
+    >>> bone = AnisotropicElasticity(C, fibre_frame(axis))
+    >>> T = bone.stress(E)
+    """
+
+    def __init__(self, stiffness, rotations=None, material_ids=None):
+        stiffness = np.asarray(stiffness, dtype=float)
+        if stiffness.shape[-2:] != (6, 6):
+            raise ValueError(f"Expected a (..., 6, 6) stiffness, "
+                             f"got shape {stiffness.shape}")
+        if material_ids is not None:
+            if stiffness.ndim == 2:
+                # One stiffness for every point, broadcast as it is
+                material_ids = None
+            elif stiffness.ndim != 3:
+                raise ValueError(
+                    f"With material_ids the stiffness must be (6, 6) or "
+                    f"one per material (M, 6, 6), got shape "
+                    f"{stiffness.shape}")
+        factor = ENGINEERING_SHEAR
+        # Act on tensor shear components: σ = C (f ε), ε = (S σ) / f.
+        # Inverted per material before gathering per point.
+        stiffness_t = np.swapaxes(stiffness * factor, -1, -2)
+        compliance_t = np.swapaxes(
+            np.linalg.inv(stiffness) / factor[:, None], -1, -2)
+        self.material_stiffness = material_property(stiffness, material_ids)
+        self._stiffness_t = material_property(stiffness_t, material_ids)
+        self._compliance_t = material_property(compliance_t, material_ids)
+        self.rotations = (None if rotations is None
+                          else np.asarray(rotations, dtype=float))
+
+    @cached_property
+    def stiffness(self):
+        """Global engineering Voigt stiffness, (..., 6, 6)"""
+        if self.rotations is None:
+            return self.material_stiffness
+        return rotate_stiffness(self.material_stiffness, self.rotations)
+
+    def _apply(self, tensors, matrix_t):
+        tensors = np.asarray(tensors, dtype=float)
+        full = tensors.shape[-1] != 6
+        voigt = as_voigt(tensors)
+        R = self.rotations
+        if R is not None:
+            local = np.swapaxes(R, -1, -2) @ voigt_to_tensor(voigt) @ R
+            voigt = tensor_to_voigt(local)
+        if matrix_t.ndim == 2:
+            result = voigt @ matrix_t
+        else:
+            result = np.einsum('...j,...jk->...k', voigt, matrix_t)
+        if R is None:
+            return voigt_to_tensor(result) if full else result
+        result = R @ voigt_to_tensor(result) @ np.swapaxes(R, -1, -2)
+        return result if full else tensor_to_voigt(result)
+
+    def stress(self, strain):
+        """Stress from small strain, T = C E"""
+        return self._apply(strain, self._stiffness_t)
+
+    def strain(self, stress):
+        """Small strain from stress, E = C⁻¹ T"""
+        return self._apply(stress, self._compliance_t)
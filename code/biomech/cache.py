@@ -0,0 +1,309 @@
+"""
+Memoized analysis results keyed by tensor content
+
+An AnalysisCache maps (analysis, tensor bytes, options) to the result
+dictionary of an analysis such as strain.analyze_strain_tensor() or
+streaming.stress_analysis(). Keys are BLAKE2b digests of the cache format
+version, the analysis name and version, the dtype, shape and raw bytes of
+the float64 input and the sorted keyword options (array options by
+their dtype, shape and bytes too), so equal tensors hit the cache however
+they were built.
+
+Analyses are identified by name, never by object identity: the built-in
+ones by their CACHED_ANALYSES name, module-level functions by their
+qualified name, and anything else (lambdas, closures) only with an
+explicit name=. CACHE_VERSION is bumped whenever a built-in analysis
+changes its results; pass version= for your own analyses, so stored
+results of older code are not served.
+
+Results live in a bounded in-memory LRU tier and, with a directory, in an
+on-disk tier of biomech-<key>.npz files (nested dictionaries flattened to
+"outer/inner" names, no pickling) that survives between sessions:
+
+    cache = AnalysisCache(maxsize=256, directory='~/.cache/tkt4150')
+    results = cache.analyze(analyze_strain_tensor, strains)
+    cache.cache_info()  # CacheInfo(hits=..., misses=..., disk_hits=..., ...)
+
+Cached arrays are returned read-only, since every hit shares them.
+"""
+
+import hashlib
+import os
+import re
+import tempfile
+import threading
+from collections import OrderedDict, namedtuple
+from pathlib import Path
+
+import numpy as np
+
+from .streaming import ANALYSES
+from .strain import analyze_deformation_measures, analyze_strain_tensor
+
+DEFAULT_MAXSIZE = 128
+
+# Part of every key; bump when a built-in analysis or the file layout
+# changes, so results stored by older versions are recomputed
+CACHE_VERSION = 1
+
+_FILE_PREFIX = "biomech-"
+_FILE_PATTERN = re.compile(r"biomech-[0-9a-f]{32}\.npz")
+
+# Named analyses in addition to the streaming columns (streaming.ANALYSES)
+CACHED_ANALYSES = dict(ANALYSES,
+                       deformation_measures=analyze_deformation_measures,
+                       strain_tensor=analyze_strain_tensor)
+
+CacheInfo = namedtuple("CacheInfo",
+                       ["hits", "misses", "disk_hits", "maxsize", "currsize"])
+CacheInfo.__doc__ = """
+Cache statistics: hits counts every lookup served from either tier, of
+which disk_hits came from the on-disk tier; currsize is the number of
+entries in memory.
+"""
+
+_SEPARATOR = "/"
+
+
+def _resolve_analysis(analysis, name=None):
+    """Function and stable name of a named or callable analysis"""
+    if callable(analysis):
+        if name is not None:
+            return analysis, name
+        for registered, function in CACHED_ANALYSES.items():
+            if function is analysis:
+                return function, registered
+        qualname = getattr(analysis, "__qualname__", None)
+        if qualname is None or "<" in qualname:
+            # Lambdas and closures share qualified names across definitions
+            raise ValueError(f"{analysis!r} has no unique qualified name; "
+                             f"pass name= to cache it")
+        return analysis, f"{analysis.__module__}.{qualname}"
+    if name is not None:
+        raise ValueError("name= is only used with callable analyses")
+    try:
+        return CACHED_ANALYSES[analysis], analysis
+    except KeyError:
+        raise ValueError(f"Unknown analysis '{analysis}', "
+                         f"expected one of {sorted(CACHED_ANALYSES)}") \
+            from None
+
+
+def tensor_key(name, tensors, **options):
+    """
+    Hex digest identifying an analysis of the given tensors
+
+    Parameters:
+    name: analysis name
+    tensors: array-like, hashed as contiguous float64
+    options: keyword options of the analysis; arrays and sequences of
+             numbers are hashed by dtype, shape and raw bytes, other values
+             by repr(), which must be stable
+
+    Returns:
+    32-character hexadecimal string
+    """
+    tensors = np.ascontiguousarray(tensors, dtype=np.float64)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"v{CACHE_VERSION}:{name}".encode())
+    digest.update(repr((tensors.dtype.str, tensors.shape)).encode())
+    digest.update(tensors)
+    for option, value in sorted(options.items()):
+        digest.update(f"{option}=".encode())
+        _update_option(digest, value)
+    return digest.hexdigest()
+
+
+def _update_option(digest, value):
+    """Hash an option; repr() of large arrays is truncated with '...'"""
+    if isinstance(value, (np.ndarray, list, tuple)):
+        try:
+            array = np.asarray(value)
+        except ValueError:
+            array = None
+        if array is not None and array.dtype != object:
+            digest.update(repr((array.dtype.str, array.shape)).encode())
+            digest.update(np.ascontiguousarray(array).tobytes())
+            digest.update(b";")
+            return
+    digest.update(repr(value).encode() + b";")
+
+
+def _freeze(results):
+    """Read-only array copies of a (nested) result dictionary"""
+    if isinstance(results, dict):
+        return {name: _freeze(values) for name, values in results.items()}
+    frozen = np.array(results)
+    frozen.flags.writeable = False
+    return frozen
+
+
+def _flatten_results(results, prefix=""):
+    flat = {}
+    for name, values in results.items():
+        if _SEPARATOR in name:
+            raise ValueError(f"Result names may not contain "
+                             f"'{_SEPARATOR}': {name!r}")
+        if isinstance(values, dict):
+            flat.update(_flatten_results(values, prefix + name + _SEPARATOR))
+        else:
+            flat[prefix + name] = values
+    return flat
+
+
+def _nest_results(flat):
+    results = {}
+    for path, values in flat.items():
+        *parents, name = path.split(_SEPARATOR)
+        node = results
+        for parent in parents:
+            node = node.setdefault(parent, {})
+        node[name] = values
+    return results
+
+
+class AnalysisCache:
+    """
+    Bounded LRU cache of analysis results with an optional disk tier
+
+    Parameters:
+    maxsize: maximum number of results kept in memory
+    directory: optional directory of the on-disk tier; entries there are
+               never evicted, use cache_clear(disk=True) to remove them
+    version: optional tag of the calling code, e.g. a tool version, mixed
+             into every key so results of older code are not reused
+
+    Lookups and updates are thread-safe; an analysis that misses is run
+    outside the lock, so concurrent misses on the same key may both
+    compute it.
+    """
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE, directory=None, version=None):
+        if maxsize < 0:
+            raise ValueError(f"maxsize must be non-negative, got {maxsize}")
+        self.maxsize = maxsize
+        self.version = version
+        self.directory = (None if directory is None
+                          else Path(directory).expanduser())
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._disk_hits = 0
+
+    def _path(self, key):
+        return self.directory / f"{_FILE_PREFIX}{key}.npz"
+
+    def _remember(self, key, results):
+        if self.maxsize == 0:
+            return
+        self._entries[key] = results
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def _load(self, key):
+        path = self._path(key)
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                flat = {name: data[name] for name in data.files}
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            # Truncated or foreign file, recompute and overwrite it
+            return None
+        return _freeze(_nest_results(flat))
+
+    def _save(self, key, results):
+        handle, temporary = tempfile.mkstemp(prefix=_FILE_PREFIX,
+                                             suffix=".tmp",
+                                             dir=self.directory)
+        try:
+            with os.fdopen(handle, "wb") as stream:
+                np.savez(stream, **_flatten_results(results))
+            os.replace(temporary, self._path(key))
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+    def get(self, key):
+        """Cached results for a key, or None; counts a hit or a miss"""
+        with self._lock:
+            results = self._entries.get(key)
+            if results is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return results
+        results = None if self.directory is None else self._load(key)
+        with self._lock:
+            if results is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._disk_hits += 1
+            self._remember(key, results)
+        return results
+
+    def put(self, key, results):
+        """Store results under a key and return the read-only copy"""
+        results = _freeze(results)
+        if self.directory is not None:
+            self._save(key, results)
+        with self._lock:
+            self._remember(key, results)
+        return results
+
+    def _key(self, name, tensors, options):
+        if self.version is not None:
+            name = f"{name}@{self.version}"
+        return tensor_key(name, tensors, **options)
+
+    def analyze(self, analysis, tensors, *, name=None, **options):
+        """
+        Results of analysis(tensors, **options), computed at most once
+
+        Parameters:
+        analysis: name in CACHED_ANALYSES or a function; lambdas and
+                  closures need an explicit name
+        tensors: input array of the analysis
+        name: key name of a callable analysis, overriding its qualified
+              name; include a version when the implementation changes
+        options: keyword options passed on and included in the key
+
+        Returns:
+        Result dictionary with read-only arrays
+        """
+        function, name = _resolve_analysis(analysis, name)
+        key = self._key(name, tensors, options)
+        results = self.get(key)
+        if results is None:
+            results = self.put(key, function(tensors, **options))
+        return results
+
+    def wrap(self, analysis, name=None):
+        """Memoized version of an analysis, called as f(tensors, **options)"""
+        function, name = _resolve_analysis(analysis, name)
+
+        def cached(tensors, **options):
+            return self.analyze(function, tensors, name=name, **options)
+
+        cached.__name__ = getattr(function, "__name__", name)
+        cached.__doc__ = function.__doc__
+        return cached
+
+    def cache_info(self):
+        """Hit and miss statistics, as a CacheInfo"""
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._disk_hits,
+                             self.maxsize, len(self._entries))
+
+    def cache_clear(self, disk=False):
+        """Empty the memory tier and reset statistics, optionally the disk"""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._disk_hits = 0
+        if disk and self.directory is not None:
+            # Only files written by the cache, never others in the folder
+            for path in self.directory.glob(f"{_FILE_PREFIX}*.npz"):
+                if _FILE_PATTERN.fullmatch(path.name):
+                    path.unlink(missing_ok=True)
@@ -0,0 +1,131 @@
+"""
+Parameter sweeps of homogeneous plane deformation
+
+Vectorized version of homogeneous_deformation_analysis() in
+ex3.2.a-deformation.py. Instead of one value of the shear parameter a,
+every function takes a stack of deformation gradients F, shape (N, 2, 2),
+and evaluates all cases at once:
+
+- deformed corners of the unit square ABCD (one matrix product)
+- stretches along the diagonals AC and BD
+- shear strain γ = π/2 - α between the deformed X1 and X2 axes
+- Green-Lagrange strain E and principal stretches
+
+Results are returned as a columnar table: a dictionary of (N,) arrays,
+which can be written with streaming.CsvResultWriter or NpyResultWriter.
+"""
+
+import numpy as np
+
+from .polar import principal_stretches
+
+# Corners A, B, C, D of the unit square in the reference configuration
+UNIT_SQUARE = np.array([
+    [0., 0.],
+    [1., 0.],
+    [1., 1.],
+    [0., 1.],
+])
+CORNER_LABELS = ('A', 'B', 'C', 'D')
+
+
+def shear_deformation_gradient(a):
+    """
+    F for x1 = X1 + a X2, x2 = (1 + a) X2
+
+    Parameters:
+    a: scalar or (N,) array of deformation parameters
+
+    Returns:
+    (2, 2) or (N, 2, 2) array
+    """
+    a = np.asarray(a, dtype=float)
+    F = np.zeros(a.shape + (2, 2))
+    F[..., 0, 0] = 1
+    F[..., 0, 1] = a
+    F[..., 1, 1] = 1 + a
+    return F
+
+
+def deform_points(F, points):
+    """
+    Map reference points through homogeneous deformations, x = F X
+
+    Parameters:
+    F: (..., d, d) deformation gradients
+    points: (P, d) reference coordinates
+
+    Returns:
+    (..., P, d) deformed coordinates
+    """
+    return np.asarray(points) @ np.swapaxes(np.asarray(F), -1, -2)
+
+
+def _segment_stretch(reference, deformed, start, end):
+    """Stretch of the segment start -> end for every case"""
+    length_0 = np.linalg.norm(reference[end] - reference[start])
+    length = np.linalg.norm(deformed[..., end, :] - deformed[..., start, :],
+                            axis=-1)
+    return length / length_0
+
+
+def deformation_sweep(F, corners=UNIT_SQUARE):
+    """
+    Evaluate the square-deformation analysis for every F at once
+
+    Parameters:
+    F: (N, 2, 2) deformation gradients
+    corners: (4, 2) reference corners A, B, C, D
+
+    Returns:
+    Dictionary of (N,) columns
+    """
+    F = np.asarray(F, dtype=float).reshape(-1, 2, 2)
+    deformed = deform_points(F, corners)
+
+    # Angle between the deformed X1 and X2 axes (columns of F)
+    g1, g2 = F[:, :, 0], F[:, :, 1]
+    cos_alpha = (np.einsum('ni,ni->n', g1, g2)
+                 / (np.linalg.norm(g1, axis=-1) * np.linalg.norm(g2, axis=-1)))
+    gamma = np.pi/2 - np.arccos(np.clip(cos_alpha, -1.0, 1.0))
+
+    C = np.swapaxes(F, -1, -2) @ F
+    E = 0.5 * (C - np.eye(2))
+    stretches = principal_stretches(C)
+
+    table = {
+        'F11': F[:, 0, 0],
+        'F12': F[:, 0, 1],
+        'F21': F[:, 1, 0],
+        'F22': F[:, 1, 1],
+    }
+    for i, label in enumerate(CORNER_LABELS):
+        table[f'x_{label}'] = deformed[:, i, 0]
+        table[f'y_{label}'] = deformed[:, i, 1]
+    table.update({
+        'stretch_AC': _segment_stretch(corners, deformed, 0, 2),
+        'stretch_BD': _segment_stretch(corners, deformed, 1, 3),
+        'shear_strain': gamma,
+        'E11': E[:, 0, 0],
+        'E12': E[:, 0, 1],
+        'E22': E[:, 1, 1],
+        'max_stretch': stretches[:, 0],
+        'min_stretch': stretches[:, 1],
+    })
+    return table
+
+
+def shear_parameter_sweep(a_values):
+    """
+    Sweep the shear parameter a of x1 = X1 + a X2, x2 = (1 + a) X2
+
+    Parameters:
+    a_values: (N,) array of deformation parameters
+
+    Returns:
+    Dictionary of (N,) columns, starting with 'a'
+    """
+    a_values = np.asarray(a_values, dtype=float).ravel()
+    table = {'a': a_values}
+    table.update(deformation_sweep(shear_deformation_gradient(a_values)))
+    return table
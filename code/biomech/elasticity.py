@@ -0,0 +1,265 @@
+"""
+Isotropic linear elasticity (Hooke's law) for batches of tensors
+
+With Young's modulus η and Poisson's ratio ν (exercise 4):
+
+    E = (1+ν)/η T - ν/η tr(T) I
+    T = η/(1+ν) (E + ν/(1-2ν) tr(E) I)
+
+Plane stress (T_i3 = 0) and plane strain (E_i3 = 0) reduce this to the
+in-plane components α, β = 1, 2:
+
+    plane stress:  T_αβ = η/(1+ν) (E_αβ + ν/(1-ν) E_ρρ δ_αβ)
+                   E_33 = -ν/(1-ν) E_ρρ
+    plane strain:  T_αβ = η/(1+ν) (E_αβ + ν/(1-2ν) E_ρρ δ_αβ)
+                   T_33 = ν T_ρρ
+
+Stiffness and compliance matrices use the engineering Voigt convention,
+σ = C [ε11, ε22, ε33, γ23, γ13, γ12] with γ = 2ε, in the order of
+VOIGT_ORDER (3D) or PLANE_VOIGT_ORDER (plane modes). Strain arrays passed
+to IsotropicElasticity hold tensor components, like as_voigt() and
+tensor_to_voigt(); the factor 2 on the shear strains is folded into the
+precomputed matrices, so each call is one batched matrix product.
+
+η and ν may also vary per point, or come from a MaterialTable indexed by
+material ID (see materials.py).
+"""
+
+from functools import cached_property
+
+import numpy as np
+
+from .invariants import ENGINEERING_SHEAR, tensor_to_voigt, voigt_to_tensor
+from .materials import material_property
+
+MODES = ('3d', 'plane_stress', 'plane_strain')
+PLANE_VOIGT_ORDER = ("11", "22", "12")
+
+# Factor between engineering and tensor shear strain per Voigt component
+_SHEAR_FACTOR = {
+    '3d': ENGINEERING_SHEAR,
+    'plane_stress': np.array([1., 1., 2.]),
+    'plane_strain': np.array([1., 1., 2.]),
+}
+
+
+def _check_mode(mode):
+    if mode not in MODES:
+        raise ValueError(f"Unknown mode '{mode}', expected one of {MODES}")
+
+
+def lame_parameters(eta, nu):
+    """
+    Lamé parameters λ and μ (shear modulus) from η and ν
+
+    Returns:
+    lam, mu
+    """
+    eta = np.asarray(eta, dtype=float)
+    nu = np.asarray(nu, dtype=float)
+    return eta * nu / ((1 + nu) * (1 - 2*nu)), eta / (2 * (1 + nu))
+
+
+def isotropic_stiffness(eta, nu, mode='3d'):
+    """
+    Isotropic stiffness matrix in engineering Voigt notation
+
+    Parameters:
+    eta: Young's modulus, scalar or array
+    nu: Poisson's ratio, scalar or array
+    mode: '3d', 'plane_stress' or 'plane_strain'
+
+    Returns:
+    (..., 6, 6) matrices for '3d', (..., 3, 3) for the plane modes, with
+    the broadcast shape of eta and nu as batch shape
+    """
+    _check_mode(mode)
+    lam, mu = lame_parameters(eta, nu)
+    if mode == 'plane_stress':
+        lam = 2 * mu * lam / (lam + 2 * mu)
+
+    n = len(_SHEAR_FACTOR[mode])
+    normal = 3 if mode == '3d' else 2
+    stiffness = np.zeros(lam.shape + (n, n))
+    stiffness[..., :normal, :normal] = lam[..., None, None]
+    stiffness[..., range(normal), range(normal)] += 2 * mu[..., None]
+    stiffness[..., range(normal, n), range(normal, n)] = mu[..., None]
+    return stiffness
+
+
+def isotropic_compliance(eta, nu, mode='3d'):
+    """
+    Isotropic compliance matrix in engineering Voigt notation
+
+    Parameters:
+    eta: Young's modulus, scalar or array
+    nu: Poisson's ratio, scalar or array
+    mode: '3d', 'plane_stress' or 'plane_strain'
+
+    Returns:
+    (..., 6, 6) matrices for '3d', (..., 3, 3) for the plane modes, with
+    the broadcast shape of eta and nu as batch shape
+    """
+    _check_mode(mode)
+    eta, nu = np.broadcast_arrays(np.asarray(eta, dtype=float),
+                                  np.asarray(nu, dtype=float))
+    diagonal, coupling = _compliance_coefficients(eta, nu, mode)
+
+    n = len(_SHEAR_FACTOR[mode])
+    normal = 3 if mode == '3d' else 2
+    compliance = np.zeros(eta.shape + (n, n))
+    compliance[..., :normal, :normal] = -coupling[..., None, None]
+    compliance[..., range(normal), range(normal)] += diagonal[..., None]
+    compliance[..., range(normal, n), range(normal, n)] = \
+        2 * (1 + nu[..., None]) / eta[..., None]
+    return compliance
+
+
+def _stiffness_coefficients(eta, nu, mode):
+    """(2μ, c) such that T = 2μ E + c tr(E) I on the modelled components"""
+    lam, mu = lame_parameters(eta, nu)
+    if mode == 'plane_stress':
+        lam = 2 * mu * lam / (lam + 2 * mu)
+    return 2 * mu, lam
+
+
+def _compliance_coefficients(eta, nu, mode):
+    """(a, b) such that E = a T - b tr(T) I on the modelled components"""
+    eta = np.asarray(eta, dtype=float)
+    nu = np.asarray(nu, dtype=float)
+    if mode == 'plane_strain':
+        return (1 + nu) / eta, (1 + nu) * nu / eta
+    return (1 + nu) / eta, nu / eta
+
+
+class IsotropicElasticity:
+    """
+    Hooke's law with precomputed stiffness and compliance
+
+    Parameters:
+    eta: Young's modulus, scalar or per-point array
+    nu: Poisson's ratio, -1 < ν < 0.5, scalar or per-point array
+    mode: '3d', 'plane_stress' or 'plane_strain'
+    material_ids: optional material ID per point; eta and nu are then one
+                  value per material (see materials.py)
+
+    Tensors are (..., 3, 3) or Voigt (..., 6) in 3D, and (..., 2, 2) or
+    (..., 3) ordered as PLANE_VOIGT_ORDER in the plane modes. Results are
+    returned in the same layout as the input. The plane modes reject
+    (..., 3, 3) arrays rather than read them as rows of Voigt components.
+
+    With scalar properties each call is one matrix product with the
+    precomputed matrices. With per-point properties the closed form
+    T = 2μ E + c tr(E) I is evaluated with per-point coefficients, which
+    broadcast against the batch shape of the field; the (..., 6, 6)
+    matrices are only built when the stiffness or compliance attribute
+    is accessed.
+
+    Example:
+    >>> bone = IsotropicElasticity(eta=17e3, nu=0.3)
+    >>> T = bone.stress(E)
+    """
+
+    def __init__(self, eta, nu, mode='3d', material_ids=None):
+        _check_mode(mode)
+        eta = material_property(eta, material_ids)
+        nu = material_property(nu, material_ids)
+        if np.any(eta <= 0):
+            raise ValueError("Young's modulus must be positive")
+        if np.any((nu <= -1) | (nu >= 0.5)):
+            raise ValueError("Poisson's ratio must satisfy -1 < ν < 0.5")
+        self.eta = eta
+        self.nu = nu
+        self.mode = mode
+        self.dim = 3 if mode == '3d' else 2
+        self.homogeneous = eta.ndim == 0 and nu.ndim == 0
+
+        if self.homogeneous:
+            # Act on tensor shear components: σ = C (f ε), ε = (S σ) / f
+            factor = _SHEAR_FACTOR[mode]
+            self._stiffness_t = (self.stiffness * factor).T
+            self._compliance_t = (self.compliance / factor[:, None]).T
+        else:
+            self._stiffness_c = _stiffness_coefficients(eta, nu, mode)
+            self._compliance_c = _compliance_coefficients(eta, nu, mode)
+
+    @classmethod
+    def from_table(cls, table, material_ids, mode='3d'):
+        """Per-point elasticity from the 'eta' and 'nu' columns of a table"""
+        return cls(table['eta'], table['nu'], mode, material_ids)
+
+    @cached_property
+    def stiffness(self):
+        """Engineering Voigt stiffness matrix, (..., 6, 6) or (..., 3, 3)"""
+        return isotropic_stiffness(self.eta, self.nu, self.mode)
+
+    @cached_property
+    def compliance(self):
+        """Engineering Voigt compliance matrix, (..., 6, 6) or (..., 3, 3)"""
+        return isotropic_compliance(self.eta, self.nu, self.mode)
+
+    def _to_voigt(self, tensors):
+        tensors = np.asarray(tensors, dtype=float)
+        size = len(_SHEAR_FACTOR[self.mode])
+        if tensors.shape[-2:] == (self.dim, self.dim):
+            if self.dim == 3:
+                return tensor_to_voigt(tensors), True
+            return tensors[..., [0, 1, 0], [0, 1, 1]], True
+        # In the plane modes a trailing (3, 3) is a 3D tensor, not three
+        # rows of in-plane Voigt components
+        if tensors.shape[-1] == size and tensors.shape[-2:] != (3, 3):
+            return tensors, False
+        raise ValueError(
+            f"Expected (..., {self.dim}, {self.dim}) or (..., {size}) "
+            f"array for mode '{self.mode}', got shape {tensors.shape}")
+
+    def _from_voigt(self, voigt, full):
+        if not full:
+            return voigt
+        if self.dim == 3:
+            return voigt_to_tensor(voigt)
+        tensors = np.empty(voigt.shape[:-1] + (2, 2))
+        tensors[..., 0, 0] = voigt[..., 0]
+        tensors[..., 1, 1] = voigt[..., 1]
+        tensors[..., 0, 1] = tensors[..., 1, 0] = voigt[..., 2]
+        return tensors
+
+    def _trace_form(self, voigt, scale, trace_scale, sign):
+        """scale * A + sign * trace_scale * tr(A) I on Voigt components"""
+        normal = self.dim
+        trace = voigt[..., :normal].sum(axis=-1)
+        result = scale[..., None] * voigt
+        result[..., :normal] += sign * (trace_scale * trace)[..., None]
+        return result
+
+    def stress(self, strain):
+        """Stress from small strain, T = C E"""
+        voigt, full = self._to_voigt(strain)
+        if self.homogeneous:
+            return self._from_voigt(voigt @ self._stiffness_t, full)
+        return self._from_voigt(
+            self._trace_form(voigt, *self._stiffness_c, 1), full)
+
+    def strain(self, stress):
+        """Small strain from stress, E = S T"""
+        voigt, full = self._to_voigt(stress)
+        if self.homogeneous:
+            return self._from_voigt(voigt @ self._compliance_t, full)
+        return self._from_voigt(
+            self._trace_form(voigt, *self._compliance_c, -1), full)
+
+    def out_of_plane(self, strain):
+        """
+        Out-of-plane component of a plane state from the in-plane strain
+
+        Returns:
+        E_33 for plane stress, T_33 for plane strain, shape (...)
+        """
+        if self.mode == '3d':
+            raise ValueError("out_of_plane() needs a plane mode")
+        voigt, _ = self._to_voigt(strain)
+        trace = voigt[..., 0] + voigt[..., 1]
+        if self.mode == 'plane_stress':
+            return -self.nu / (1 - self.nu) * trace
+        lam, _ = lame_parameters(self.eta, self.nu)
+        return lam * trace
@@ -0,0 +1,120 @@
+"""
+Failure criteria for stress fields
+
+Equivalent stresses and safety factors for whole batches of stress states,
+given either as full tensors (..., 3, 3), Voigt arrays (..., 6) or
+principal stresses (..., 3).
+
+- von Mises:      σ_vm = √(3 J2)
+- Tresca:         σ_tr = σ_max - σ_min  (= 2 τ_max)
+- Max principal:  σ_mp = max |σ_i|      (Rankine)
+- Safety factor:  n = σ_yield / σ_eq
+"""
+
+import numpy as np
+
+from .invariants import as_voigt
+from .materials import material_property
+from .principal import principal_values
+
+# Yield strength of cortical bone used in exercise 3.1.1b (MPa)
+BONE_YIELD_STRENGTH = 130.0
+
+
+def von_mises(tensors):
+    """
+    Von Mises equivalent stress straight from the tensor components
+
+    σ_vm² = 0.5 * [(σ11-σ22)² + (σ22-σ33)² + (σ33-σ11)²]
+            + 3 * (σ12² + σ23² + σ13²)
+
+    Parameters:
+    tensors: (..., 3, 3) or (..., 6) array
+
+    Returns:
+    array with the batch shape of the input
+    """
+    s11, s22, s33, s23, s13, s12 = np.moveaxis(as_voigt(tensors), -1, 0)
+    return np.sqrt(0.5 * ((s11 - s22)**2 + (s22 - s33)**2 + (s33 - s11)**2)
+                   + 3 * (s12*s12 + s23*s23 + s13*s13))
+
+
+def von_mises_principal(principal_stresses):
+    """
+    Von Mises equivalent stress from principal stresses, shape (..., 3)
+    """
+    s1, s2, s3 = np.moveaxis(np.asarray(principal_stresses), -1, 0)
+    return np.sqrt(((s1 - s2)**2 + (s2 - s3)**2 + (s3 - s1)**2) / 2)
+
+
+def tresca(principal_stresses):
+    """
+    Tresca equivalent stress σ_max - σ_min from principal stresses (..., 3)
+
+    The principal stresses do not need to be sorted.
+    """
+    principal_stresses = np.asarray(principal_stresses)
+    return principal_stresses.max(axis=-1) - principal_stresses.min(axis=-1)
+
+
+def max_principal(principal_stresses):
+    """
+    Largest principal stress magnitude max |σ_i| from (..., 3) input
+    """
+    return np.abs(np.asarray(principal_stresses)).max(axis=-1)
+
+
+def safety_factor(equivalent_stress, yield_strength=BONE_YIELD_STRENGTH):
+    """
+    Safety factor σ_yield / σ_eq, infinite where the stress is zero
+
+    yield_strength may be a scalar or an array broadcast against the field.
+    """
+    equivalent_stress = np.asarray(equivalent_stress, dtype=float)
+    yield_strength = np.asarray(yield_strength, dtype=float)
+    shape = np.broadcast(equivalent_stress, yield_strength).shape
+    return np.divide(yield_strength, equivalent_stress,
+                     out=np.full(shape, np.inf),
+                     where=equivalent_stress != 0)
+
+
+def evaluate_failure(stresses, yield_strength=BONE_YIELD_STRENGTH,
+                     principal=False, material_ids=None):
+    """
+    Evaluate all failure criteria for a stress field in one pass
+
+    Parameters:
+    stresses: (..., 3, 3) or (..., 6) stress array, or (..., 3) principal
+              stresses when principal=True
+    yield_strength: scalar or array broadcast against the field (MPa); with
+                    material_ids one value per material or a MaterialTable
+                    with a 'yield_strength' column
+    principal: interpret the last axis as principal stresses
+    material_ids: optional material ID per point (see materials.py)
+
+    Returns:
+    Dictionary of fields with the batch shape of the input
+    """
+    yield_strength = material_property(yield_strength, material_ids,
+                                       'yield_strength')
+    if principal:
+        principal_stresses = np.asarray(stresses, dtype=float)
+        sigma_vm = von_mises_principal(principal_stresses)
+    else:
+        principal_stresses = principal_values(stresses)
+        sigma_vm = von_mises(stresses)
+
+    sigma_tr = tresca(principal_stresses)
+    sigma_mp = max_principal(principal_stresses)
+
+    return {
+        'von_mises': sigma_vm,
+        'tresca': sigma_tr,
+        'max_principal': sigma_mp,
+        'safety_factor': {
+            'von_mises': safety_factor(sigma_vm, yield_strength),
+            'tresca': safety_factor(sigma_tr, yield_strength),
+            'max_principal': safety_factor(sigma_mp, yield_strength),
+        },
+        'safe': sigma_vm < yield_strength,
+    }
@@ -0,0 +1,208 @@
+"""
+Reusable figure templates for repeated plots of many stress states
+
+A template builds its figure, axes, labels, limits and legends once. For
+every new stress state only the line data and the changing texts are
+updated, and frames are exported by blitting the changing artists onto a
+cached background instead of redrawing the whole 3D scene.
+
+    template = PrincipalDirectionsTemplate(show_shear=True)
+    template.export_frames(stresses, output_dir='frames')
+"""
+
+import numpy as np
+
+from .principal import principal_frame
+from .rendering import resolve_output_dir
+
+SUBSCRIPTS = "₁₂₃"
+PRINCIPAL_COLORS = ('red', 'blue', 'green')
+SHEAR_COLORS = ('orange', 'purple')
+
+
+def max_shear_directions(directions):
+    """
+    Directions of maximum shear, (n1 ± n3) / √2, for (..., 3, 3) triads
+
+    Returns:
+    (..., 3, 2) array with the two directions as columns
+    """
+    n1 = directions[..., :, 0]
+    n3 = directions[..., :, 2]
+    return np.stack([n1 + n3, n1 - n3], axis=-1) / np.sqrt(2)
+
+
+class PrincipalDirectionsTemplate:
+    """
+    3D plot of principal directions (and optionally max shear directions)
+    seen from several viewing angles
+
+    Parameters:
+    views: sequence of (elev, azim) per subplot, None for the default view
+    titles: format strings per subplot; may use {sigma1}, {sigma2},
+            {sigma3} and {tau_max}
+    show_shear: also draw the two maximum shear directions
+    legend_values: show the principal stresses in the legend; with False
+                   the legends are static and stay in the cached background,
+                   which roughly halves the time per frame
+    figsize: figure size in inches
+    unit: stress unit used in the legend
+    """
+
+    def __init__(self, views=(None, (30, 45)), titles=None, show_shear=False,
+                 legend_values=True, figsize=(12, 5), unit='MPa'):
+        import matplotlib.pyplot as plt
+
+        if titles is None:
+            titles = [f'Principal Directions - View {k + 1}'
+                      for k in range(len(views))]
+
+        self.fig = plt.figure(figsize=figsize)
+        self.titles = list(titles)
+        self.show_shear = show_shear
+        self.legend_values = legend_values
+        self.unit = unit
+        self.axes = []
+        self.principal_lines = []
+        self.shear_lines = []
+        self.legends = []
+        self._background = None
+
+        for k, view in enumerate(views):
+            ax = self.fig.add_subplot(1, len(views), k + 1, projection='3d')
+
+            lines = [ax.plot([0, 0], [0, 0], [0, 0],
+                             color=PRINCIPAL_COLORS[i], linewidth=3,
+                             marker='o', markersize=8,
+                             label=f'n{SUBSCRIPTS[i]}')[0]
+                     for i in range(3)]
+            self.principal_lines.append(lines)
+
+            if show_shear:
+                shear = [ax.plot([0, 0], [0, 0], [0, 0],
+                                 color=SHEAR_COLORS[i], linewidth=2,
+                                 marker='s', markersize=6, linestyle='--',
+                                 label=f'Max shear dir {i + 1}')[0]
+                         for i in range(2)]
+                self.shear_lines.append(shear)
+
+            ax.set_xlabel('x₁')
+            ax.set_ylabel('x₂')
+            ax.set_zlabel('x₃')
+            ax.set_title(self.titles[k])
+            self.legends.append(ax.legend())
+            ax.grid(True)
+
+            # Set equal aspect ratio
+            max_range = 1.0
+            ax.set_xlim([-max_range, max_range])
+            ax.set_ylim([-max_range, max_range])
+            ax.set_zlim([-max_range, max_range])
+
+            if view is not None:
+                ax.view_init(elev=view[0], azim=view[1])
+            self.axes.append(ax)
+
+        self.fig.tight_layout()
+
+    def _changing_artists(self):
+        """Artists that differ between stress states"""
+        artists = []
+        for k, ax in enumerate(self.axes):
+            artists.extend(self.principal_lines[k])
+            if self.show_shear:
+                artists.extend(self.shear_lines[k])
+            if self.legend_values:
+                artists.append(self.legends[k])
+            artists.append(ax.title)
+        return artists
+
+    def update(self, values, directions):
+        """
+        Show a new stress state
+
+        Parameters:
+        values: (3,) principal stresses, largest first
+        directions: (3, 3) principal directions as columns
+        """
+        values = np.asarray(values)
+        directions = np.asarray(directions)
+        fields = {
+            'sigma1': values[0],
+            'sigma2': values[1],
+            'sigma3': values[2],
+            'tau_max': 0.5 * (values[0] - values[2]),
+        }
+        shear = max_shear_directions(directions) if self.show_shear else None
+
+        for k, ax in enumerate(self.axes):
+            for i, line in enumerate(self.principal_lines[k]):
+                n = directions[:, i]
+                line.set_data_3d([0, n[0]], [0, n[1]], [0, n[2]])
+                if self.legend_values:
+                    self.legends[k].get_texts()[i].set_text(
+                        f'n{SUBSCRIPTS[i]} (σ{SUBSCRIPTS[i]}={values[i]:.0f} '
+                        f'{self.unit})')
+            if self.show_shear:
+                for i, line in enumerate(self.shear_lines[k]):
+                    s = shear[:, i]
+                    line.set_data_3d([0, s[0]], [0, s[1]], [0, s[2]])
+            ax.set_title(self.titles[k].format(**fields))
+
+    def _cache_background(self):
+        """Draw everything except the changing artists and keep the pixels"""
+        artists = self._changing_artists()
+        for artist in artists:
+            artist.set_visible(False)
+        self.fig.canvas.draw()
+        self._background = self.fig.canvas.copy_from_bbox(self.fig.bbox)
+        for artist in artists:
+            artist.set_visible(True)
+
+    def render(self):
+        """
+        Blit the current state onto the cached background
+
+        Returns:
+        (height, width, 4) uint8 RGBA image of the figure
+        """
+        canvas = self.fig.canvas
+        if self._background is None:
+            self._cache_background()
+        canvas.restore_region(self._background)
+        for artist in self._changing_artists():
+            artist.axes.draw_artist(artist)
+        return np.asarray(canvas.buffer_rgba())
+
+    def export_frames(self, stresses, output_dir=None,
+                      pattern='principal_directions_{:05d}.png',
+                      compress_level=1):
+        """
+        Write one PNG image per stress state
+
+        Principal values and directions are computed for the whole batch in
+        one call; each frame then only updates and blits the changing
+        artists. Frames use the figure dpi and are stored as RGB.
+
+        Parameters:
+        stresses: (N, 3, 3) or (N, 6) symmetric stress tensors
+        output_dir: output directory (see rendering.resolve_output_dir)
+        pattern: file name pattern formatted with the frame index
+        compress_level: PNG compression (0-9); at high levels encoding
+                        takes longer than rendering the frame
+
+        Returns:
+        List of written file paths
+        """
+        from PIL import Image
+
+        output_dir = resolve_output_dir(output_dir)
+        values, directions = principal_frame(stresses)
+        paths = []
+        for k in range(len(values)):
+            self.update(values[k], directions[k])
+            path = output_dir / pattern.format(k)
+            Image.fromarray(self.render()[..., :3]).save(
+                path, compress_level=compress_level)
+            paths.append(path)
+        return paths
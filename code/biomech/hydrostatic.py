@@ -0,0 +1,117 @@
+"""
+Hydrostatic blood pressure over body geometry
+
+Exercise 4 gives p(z) = ρ g z + p0 with z the depth below the reference
+point (the heart) where p = p0. For points x and a unit gravity
+direction ĝ the depth is z = (x - x₀) · ĝ, so
+
+    p(x) = p0 + ρ g (x - x₀) · ĝ
+
+Body coordinates are x to the left, y anterior and z towards the head.
+Posture is set by the gravity direction: (0, 0, -1) standing upright,
+(0, -1, 0) lying supine. posture_gravity() gives the direction for any
+tilt about the left-right axis, and several postures can be evaluated at
+once as a (K, N) field.
+
+SI units throughout: positions in m, pressures in Pa.
+
+    p = hydrostatic_pressure(points, posture_gravity([0, 90]), p0=13e3)
+    results = vessel_wall_stress(points, radius, thickness, ...)
+"""
+
+import numpy as np
+
+from .pressure_vessel import vessel_stress
+
+BLOOD_DENSITY = 1000.0  # kg/m³, as in exercise 4
+GRAVITY = 9.81  # m/s²
+
+STANDING = np.array([0., 0., -1.])
+SUPINE = np.array([0., -1., 0.])
+PRONE = np.array([0., 1., 0.])
+
+
+def posture_gravity(tilt):
+    """
+    Gravity directions in body coordinates for tilts about the x axis
+
+    Parameters:
+    tilt: scalar or (K,) angles in degrees; 0 standing, 90 supine,
+          -90 prone, 180 upside down (head-down)
+
+    Returns:
+    (3,) or (K, 3) unit vectors
+    """
+    angle = np.radians(np.asarray(tilt, dtype=float))
+    return np.stack([np.zeros_like(angle), -np.sin(angle), -np.cos(angle)],
+                    axis=-1)
+
+
+def hydrostatic_pressure(points, gravity=STANDING, p0=0.0,
+                         reference_point=(0., 0., 0.), density=BLOOD_DENSITY,
+                         g=GRAVITY):
+    """
+    Hydrostatic pressure p0 + ρ g (x - x₀) · ĝ at every point
+
+    Parameters:
+    points: (N, 3) positions, e.g. a point cloud or vessel centreline
+    gravity: (3,) gravity direction, or (K, 3) for K postures at once;
+             normalised internally
+    p0: pressure at the reference point, scalar or per-point array (for
+        example arterial and venous reference pressures per vessel)
+    reference_point: (3,) position where p = p0, e.g. the heart
+    density: fluid density ρ
+    g: gravitational acceleration
+
+    Returns:
+    (N,) pressures, or (K, N) for K gravity directions
+    """
+    points = np.asarray(points, dtype=float)
+    gravity = np.asarray(gravity, dtype=float)
+    gravity = gravity / np.linalg.norm(gravity, axis=-1, keepdims=True)
+    offsets = points - np.asarray(reference_point, dtype=float)
+    depth = (gravity @ offsets.T) if gravity.ndim == 2 else offsets @ gravity
+    return p0 + density * g * depth
+
+
+def segment_midpoints(centreline):
+    """
+    Midpoints and lengths of the segments of centreline polylines
+
+    Parameters:
+    centreline: (..., M, 3) ordered points along each vessel
+
+    Returns:
+    midpoints: (..., M - 1, 3)
+    lengths: (..., M - 1)
+    """
+    centreline = np.asarray(centreline, dtype=float)
+    steps = np.diff(centreline, axis=-2)
+    return (centreline[..., :-1, :] + 0.5 * steps,
+            np.linalg.norm(steps, axis=-1))
+
+
+def vessel_wall_stress(points, radius, thickness, gravity=STANDING, p0=0.0,
+                       reference_point=(0., 0., 0.), density=BLOOD_DENSITY,
+                       g=GRAVITY, **options):
+    """
+    Wall stresses of vessel segments loaded by the hydrostatic pressure
+
+    The pressure field goes straight into vessel_stress() as an array;
+    with K gravity directions every result column has shape (K, N).
+
+    Parameters:
+    points: (N, 3) segment positions, e.g. from segment_midpoints()
+    radius, thickness: (N,) segment radii and wall thicknesses
+    gravity, p0, reference_point, density, g: see hydrostatic_pressure()
+    options: keyword arguments of vessel_stress(), e.g. method='lame'
+             or yield_strength
+
+    Returns:
+    Dictionary of result columns, including 'pressure'
+    """
+    pressure = hydrostatic_pressure(points, gravity, p0, reference_point,
+                                    density, g)
+    results = {'pressure': pressure}
+    results.update(vessel_stress(radius, thickness, pressure, **options))
+    return results
@@ -0,0 +1,404 @@
+"""
+Hyperelastic soft-tissue models for batches of deformation gradients
+
+Each model is a strain energy W(Ī1, Ī2, J, Ī4, Ī6, ...) of the isochoric
+invariants
+
+    Ī1 = J^(-2/3) I1,   Ī2 = J^(-4/3) I2,   Ī4 = J^(-2/3) a₀·C a₀
+
+with a volumetric part U(J) = κ/2 (J - 1)²:
+
+    NeoHookean             W = μ/2 (Ī1 - 3) + U
+    MooneyRivlin           W = c10 (Ī1 - 3) + c01 (Ī2 - 3) + U
+    HolzapfelGasserOgden   W = μ/2 (Ī1 - 3)
+                               + Σ k1/(2k2) [exp(k2 Ēᵢ²) - 1] + U
+                           Ēᵢ = d (Ī1 - 3) + (1 - 3d) (Ī4ᵢ - 1),
+                           fibres only carry load in tension (Ēᵢ > 0)
+
+Stress and tangent follow from the derivatives of W with respect to the
+invariants y = (I1, I2, I3, I4, ...) of C:
+
+    S = 2 Σ W_a ∂I_a/∂C
+    ℂ = 2 ∂S/∂C = 4 Σ W_ab ∂I_a/∂C ⊗ ∂I_b/∂C + 4 Σ W_a ∂²I_a/∂C∂C
+
+A model only provides W and its first and second derivatives in the
+isochoric invariants; the chain rule to y, stress and tangent are shared.
+
+model.evaluate(F) returns a HyperelasticResponse whose quantities are
+cached properties, so the invariants and energy derivatives are computed
+once per evaluation and reused by S, σ and the tangent:
+
+    response = model.evaluate(F)
+    response.S, response.tangent
+
+Tangents are (..., 6, 6) matrices in the engineering Voigt convention of
+elasticity.py, ΔS = ℂ ΔE with ΔE = [ΔE11, ΔE22, ΔE33, 2ΔE23, 2ΔE13, 2ΔE12].
+"""
+
+from abc import ABC, abstractmethod
+from functools import cached_property
+
+import numpy as np
+
+from .anisotropy import bond_matrix
+from .invariants import (
+    VOIGT_COLS,
+    VOIGT_ROWS,
+    tensor_to_voigt,
+    voigt_index_products,
+    voigt_to_tensor,
+)
+from .kinematics import Kinematics
+from .materials import material_property
+
+_IDENTITY_VOIGT = np.array([1., 1., 1., 0., 0., 0.])
+
+# Symmetric fourth-order identity acting on engineering Voigt strains
+_SYMMETRIC_IDENTITY = np.diag([1., 1., 1., 0.5, 0.5, 0.5])
+
+
+def _symmetric_product(A):
+    """Voigt matrix of (A ⊙ A)_ijkl = ½ (A_ik A_jl + A_il A_jk)"""
+    direct, crossed = voigt_index_products(A)
+    return 0.5 * (direct + crossed)
+
+
+class HyperelasticResponse(Kinematics):
+    """
+    Stress and tangent of a hyperelastic model for a batch of F
+
+    Created by Hyperelastic.evaluate(). Every quantity is a cached
+    property; the kinematic ones (C, J, F_inv, ...) come from Kinematics.
+    """
+
+    def __init__(self, model, F):
+        super().__init__(F)
+        if self.dim != 3:
+            raise ValueError(f"Hyperelastic models need (..., 3, 3) F, "
+                             f"got shape {self.F.shape}")
+        self.model = model
+
+    # -------------------------------------------------------------------------
+    # Invariants
+    # -------------------------------------------------------------------------
+
+    @cached_property
+    def C_inv(self):
+        """Inverse right Cauchy-Green tensor F⁻¹F⁻ᵀ"""
+        return self.F_inv @ np.swapaxes(self.F_inv, -1, -2)
+
+    @cached_property
+    def fibre_tensors(self):
+        """Structural tensors a₀ ⊗ a₀ in Voigt form, (..., m, 6)"""
+        a = self.model.fibres
+        return a[..., VOIGT_ROWS] * a[..., VOIGT_COLS]
+
+    @cached_property
+    def invariants(self):
+        """y = (I1, I2, I3, I4, ...) stacked along the last axis"""
+        C = tensor_to_voigt(self.C)
+        I1 = C[..., 0] + C[..., 1] + C[..., 2]
+        CC = np.sum(C[..., :3]**2, axis=-1) + 2 * np.sum(C[..., 3:]**2,
+                                                          axis=-1)
+        invariants = [I1, 0.5 * (I1**2 - CC), self.J**2]
+        if self.model.fibres is not None:
+            weights = self.fibre_tensors * [1, 1, 1, 2, 2, 2]
+            I4 = np.einsum('...i,...ki->...k', C, weights)
+            invariants.extend(np.moveaxis(I4, -1, 0))
+        return np.stack(np.broadcast_arrays(*invariants), axis=-1)
+
+    @cached_property
+    def isochoric_invariants(self):
+        """x = (Ī1, Ī2, J, Ī4, ...) stacked along the last axis"""
+        y = self.invariants
+        J = np.broadcast_to(self.J, y.shape[:-1])
+        scale = J**(-2/3)
+        x = y * scale[..., None]
+        x[..., 1] *= scale
+        x[..., 2] = J
+        return x
+
+    @cached_property
+    def _chain_rule(self):
+        """
+        Sparse derivatives of x with respect to y
+
+        x_a depends on y_a and I3 only, so ∂x/∂y is a diagonal plus the
+        I3 column, and ∂²x_a/∂y∂y only has the entries (a, I3) and
+        (I3, I3).
+
+        Returns:
+        diagonal ∂x_a/∂y_a, column ∂x_a/∂I3, mixed ∂²x_a/∂y_a∂I3 and
+        second ∂²x_a/∂I3², each (..., n)
+        """
+        x = self.isochoric_invariants
+        I3 = self.invariants[..., 2, None]
+        a13 = I3**(-1/3)
+        scale = np.ones(x.shape[-1])
+        scale[1] = 2
+
+        diagonal = np.broadcast_to(a13, x.shape).copy()
+        diagonal[..., 1] = a13[..., 0]**2
+        diagonal[..., 2] = 0.5 / x[..., 2]
+        column = -scale * x / (3 * I3)
+        column[..., 2] = 0
+        mixed = -scale * diagonal / (3 * I3)
+        mixed[..., 2] = 0
+        second = scale * (scale + 3) * x / (9 * I3**2)
+        second[..., 2] = -0.25 / (I3[..., 0] * x[..., 2])
+        return diagonal, column, mixed, second
+
+    @cached_property
+    def _energy(self):
+        return self.model.energy(self.isochoric_invariants)
+
+    @cached_property
+    def energy(self):
+        """Strain energy per unit reference volume W"""
+        return self._energy[0]
+
+    @cached_property
+    def _first_derivatives(self):
+        """∂W/∂y, (..., n)"""
+        _, W_x, _ = self._energy
+        diagonal, column, _, _ = self._chain_rule
+        W_y = W_x * diagonal
+        W_y[..., 2] += np.sum(W_x * column, axis=-1)
+        return W_y
+
+    @cached_property
+    def _second_derivatives(self):
+        """∂²W/∂y∂y, (..., n, n)"""
+        _, W_x, W_xx = self._energy
+        diagonal, column, mixed, second = self._chain_rule
+        # ∂x/∂y = D + c e₃ᵀ with D diagonal and c the I3 column
+        W_yy = diagonal[..., :, None] * W_xx * diagonal[..., None, :]
+        W_c = (W_xx @ column[..., None])[..., 0]
+        # Σ_a W_x_a ∂²x_a/∂y∂y, non-zero only in row/column I3
+        coupling = diagonal * W_c + W_x * mixed
+        W_yy[..., :, 2] += coupling
+        W_yy[..., 2, :] += coupling
+        W_yy[..., 2, 2] += np.sum(column * W_c + W_x * second, axis=-1)
+        return W_yy
+
+    @cached_property
+    def _invariant_gradients(self):
+        """∂I_a/∂C in Voigt form, (..., n, 6)"""
+        y = self.invariants
+        C = tensor_to_voigt(self.C)
+        gradients = [np.broadcast_to(_IDENTITY_VOIGT, C.shape),
+                     y[..., 0, None] * _IDENTITY_VOIGT - C,
+                     y[..., 2, None] * tensor_to_voigt(self.C_inv)]
+        if self.model.fibres is not None:
+            shape = C.shape[:-1] + self.fibre_tensors.shape[-2:]
+            fibres = np.broadcast_to(self.fibre_tensors, shape)
+            gradients.extend(np.moveaxis(fibres, -2, 0))
+        return np.stack(np.broadcast_arrays(*gradients), axis=-2)
+
+    # -------------------------------------------------------------------------
+    # Stress and tangent
+    # -------------------------------------------------------------------------
+
+    @cached_property
+    def S_voigt(self):
+        """Second Piola-Kirchhoff stress in Voigt form, (..., 6)"""
+        W_y = self._first_derivatives
+        y = self.invariants
+        # S = 2 [(W_1 + I1 W_2) I - W_2 C + I3 W_3 C⁻¹ + Σ W_4 a₀ ⊗ a₀]
+        S = -W_y[..., 1, None] * tensor_to_voigt(self.C)
+        S[..., :3] += (W_y[..., 0] + y[..., 0] * W_y[..., 1])[..., None]
+        S += (y[..., 2] * W_y[..., 2])[..., None] * tensor_to_voigt(self.C_inv)
+        if self.model.fibres is not None:
+            S += np.einsum('...k,...ki->...i', W_y[..., 3:],
+                           self.fibre_tensors)
+        return 2 * S
+
+    @cached_property
+    def S(self):
+        """Second Piola-Kirchhoff stress, (..., 3, 3)"""
+        return voigt_to_tensor(self.S_voigt)
+
+    @cached_property
+    def cauchy(self):
+        """Cauchy stress σ = J⁻¹ F S Fᵀ, (..., 3, 3)"""
+        return (self.F @ self.S @ np.swapaxes(self.F, -1, -2)
+                / self.J[..., None, None])
+
+    @cached_property
+    def tangent(self):
+        """Material tangent ℂ = ∂S/∂E, (..., 6, 6)"""
+        W_y = self._first_derivatives
+        W_yy = self._second_derivatives
+        G = self._invariant_gradients
+        C_inv = tensor_to_voigt(self.C_inv)
+        I3 = self.invariants[..., 2]
+
+        tangent = np.swapaxes(G, -1, -2) @ (W_yy @ G)
+        # W_2 (I ⊗ I - 𝕀), the second derivative of I2
+        W_2 = W_y[..., 1, None]
+        tangent[..., :3, :3] += W_2[..., None]
+        tangent[..., range(6), range(6)] -= W_2 * np.diag(_SYMMETRIC_IDENTITY)
+        # I3 W_3 (C⁻¹ ⊗ C⁻¹ - C⁻¹ ⊙ C⁻¹), the second derivative of I3
+        volumetric = C_inv[..., :, None] * C_inv[..., None, :]
+        volumetric -= _symmetric_product(self.C_inv)
+        volumetric *= (W_y[..., 2] * I3)[..., None, None]
+        tangent += volumetric
+        tangent *= 4
+        return tangent
+
+    @cached_property
+    def spatial_tangent(self):
+        """Spatial tangent c = J⁻¹ (F F ℂ F F), (..., 6, 6)"""
+        K = bond_matrix(self.F)
+        return (K @ self.tangent @ np.swapaxes(K, -1, -2)
+                / self.J[..., None, None])
+
+
+class Hyperelastic(ABC):
+    """
+    Base class of the hyperelastic models
+
+    Subclasses implement isochoric_energy(x) for x = (Ī1, Ī2, J, Ī4, ...)
+    returning W and its first and second derivatives with respect to x.
+    The volumetric part κ/2 (J - 1)² is added here.
+
+    Parameters:
+    kappa: bulk modulus, scalar or per-point array
+    fibres: optional (m, 3) or per-point (..., m, 3) fibre directions in
+            the reference configuration
+    material_ids: optional material ID per point; material parameters are
+                  then one value per material (see materials.py)
+    """
+
+    def __init__(self, kappa, fibres=None, material_ids=None):
+        self.material_ids = material_ids
+        self.kappa = self._parameter(kappa)
+        if fibres is not None:
+            fibres = np.asarray(fibres, dtype=float)
+            fibres = fibres / np.linalg.norm(fibres, axis=-1, keepdims=True)
+        self.fibres = fibres
+
+    def _parameter(self, value):
+        return material_property(value, self.material_ids)
+
+    def energy(self, x):
+        """W, ∂W/∂x and ∂²W/∂x∂x for stacked isochoric invariants x"""
+        W, W_x, W_xx = self.isochoric_energy(x)
+        J = x[..., 2]
+        W = W + 0.5 * self.kappa * (J - 1)**2
+        W_x[..., 2] += self.kappa * (J - 1)
+        W_xx[..., 2, 2] += self.kappa
+        return W, W_x, W_xx
+
+    @abstractmethod
+    def isochoric_energy(self, x):
+        """W, ∂W/∂x and ∂²W/∂x∂x of the isochoric part, without κ"""
+
+    @staticmethod
+    def _zeros(x):
+        return np.zeros(x.shape), np.zeros(x.shape + (x.shape[-1],))
+
+    def evaluate(self, F):
+        """Response for a batch of deformation gradients, (..., 3, 3)"""
+        return HyperelasticResponse(self, F)
+
+    def stress(self, F):
+        """Second Piola-Kirchhoff stress S, (..., 3, 3)"""
+        return self.evaluate(F).S
+
+    def cauchy(self, F):
+        """Cauchy stress σ, (..., 3, 3)"""
+        return self.evaluate(F).cauchy
+
+    def tangent(self, F):
+        """Material tangent ∂S/∂E, (..., 6, 6)"""
+        return self.evaluate(F).tangent
+
+
+class NeoHookean(Hyperelastic):
+    """
+    Compressible neo-Hookean model, W = μ/2 (Ī1 - 3) + κ/2 (J - 1)²
+
+    Parameters:
+    mu: shear modulus
+    kappa: bulk modulus
+    """
+
+    def __init__(self, mu, kappa, material_ids=None):
+        super().__init__(kappa, material_ids=material_ids)
+        self.mu = self._parameter(mu)
+
+    def isochoric_energy(self, x):
+        W_x, W_xx = self._zeros(x)
+        W_x[..., 0] = 0.5 * self.mu
+        return 0.5 * self.mu * (x[..., 0] - 3), W_x, W_xx
+
+
+class MooneyRivlin(Hyperelastic):
+    """
+    Compressible Mooney-Rivlin model,
+    W = c10 (Ī1 - 3) + c01 (Ī2 - 3) + κ/2 (J - 1)²
+
+    Parameters:
+    c10, c01: material constants, μ = 2 (c10 + c01)
+    kappa: bulk modulus
+    """
+
+    def __init__(self, c10, c01, kappa, material_ids=None):
+        super().__init__(kappa, material_ids=material_ids)
+        self.c10 = self._parameter(c10)
+        self.c01 = self._parameter(c01)
+
+    def isochoric_energy(self, x):
+        W_x, W_xx = self._zeros(x)
+        W_x[..., 0] = self.c10
+        W_x[..., 1] = self.c01
+        W = self.c10 * (x[..., 0] - 3) + self.c01 * (x[..., 1] - 3)
+        return W, W_x, W_xx
+
+
+class HolzapfelGasserOgden(Hyperelastic):
+    """
+    Holzapfel-Gasser-Ogden model for fibre-reinforced tissue (arteries,
+    ligaments) with dispersed collagen fibre families
+
+    Parameters:
+    mu: shear modulus of the ground matrix
+    k1: fibre stiffness (stress units)
+    k2: dimensionless fibre nonlinearity
+    kappa: bulk modulus
+    fibres: (m, 3) or (..., m, 3) mean fibre directions, reference frame
+    dispersion: fibre dispersion d in [0, 1/3]; 0 for aligned fibres,
+                1/3 for isotropic distribution
+    """
+
+    def __init__(self, mu, k1, k2, kappa, fibres, dispersion=0.0,
+                 material_ids=None):
+        super().__init__(kappa, fibres=fibres, material_ids=material_ids)
+        self.mu = self._parameter(mu)
+        self.k1 = self._parameter(k1)
+        self.k2 = self._parameter(k2)
+        self.dispersion = self._parameter(dispersion)
+
+    def isochoric_energy(self, x):
+        W_x, W_xx = self._zeros(x)
+        d = self.dispersion
+        mu, k1, k2 = self.mu, self.k1, self.k2
+
+        W = 0.5 * mu * (x[..., 0] - 3)
+        W_x[..., 0] = 0.5 * mu
+        for a in range(3, x.shape[-1]):
+            strain = d * (x[..., 0] - 3) + (1 - 3*d) * (x[..., a] - 1)
+            strain = np.maximum(strain, 0.0)
+            exponential = np.exp(k2 * strain**2)
+            W = W + k1 / (2*k2) * (exponential - 1)
+            first = k1 * strain * exponential
+            second = np.where(strain > 0,
+                              k1 * exponential * (1 + 2*k2 * strain**2), 0.0)
+
+            W_x[..., 0] += first * d
+            W_x[..., a] = first * (1 - 3*d)
+            W_xx[..., 0, 0] += second * d * d
+            W_xx[..., 0, a] = W_xx[..., a, 0] = second * d * (1 - 3*d)
+            W_xx[..., a, a] = second * (1 - 3*d)**2
+        return W, W_x, W_xx
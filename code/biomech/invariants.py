@@ -0,0 +1,136 @@
+"""
+Stress and strain invariants for batches of 3x3 tensors
+
+I1 = tr(T)
+I2 = 0.5 * (tr(T)^2 - tr(T T))
+I3 = det(T)
+
+The invariants are evaluated component-wise from closed-form expressions,
+so no matrix product or LU determinant is formed per tensor.
+
+Voigt arrays use the component order (11, 22, 33, 23, 13, 12).
+"""
+
+import numpy as np
+
+VOIGT_ORDER = ("11", "22", "33", "23", "13", "12")
+
+# Row/column index of each Voigt component in the full tensor
+VOIGT_ROWS = np.array([0, 1, 2, 1, 0, 0])
+VOIGT_COLS = np.array([0, 1, 2, 2, 2, 1])
+
+# Engineering strains from tensor components, γ = 2ε for the shears
+ENGINEERING_SHEAR = np.array([1., 1., 1., 2., 2., 2.])
+
+# Flat (row * 3 + column) indices of A_pr, A_qs, A_ps, A_qr for Voigt row
+# (p, q) and column (r, s)
+_PR = VOIGT_ROWS[:, None] * 3 + VOIGT_ROWS[None, :]
+_QS = VOIGT_COLS[:, None] * 3 + VOIGT_COLS[None, :]
+_PS = VOIGT_ROWS[:, None] * 3 + VOIGT_COLS[None, :]
+_QR = VOIGT_COLS[:, None] * 3 + VOIGT_ROWS[None, :]
+
+
+def tensor_to_voigt(tensors):
+    """
+    Convert symmetric tensors to Voigt notation
+
+    Parameters:
+    tensors: (..., 3, 3) array
+
+    Returns:
+    (..., 6) array ordered as VOIGT_ORDER
+    """
+    tensors = np.asarray(tensors, dtype=float)
+    return tensors[..., VOIGT_ROWS, VOIGT_COLS]
+
+
+def voigt_to_tensor(voigt):
+    """
+    Convert Voigt arrays back to full symmetric tensors
+
+    Parameters:
+    voigt: (..., 6) array ordered as VOIGT_ORDER
+
+    Returns:
+    (..., 3, 3) array
+    """
+    voigt = np.asarray(voigt, dtype=float)
+    tensors = np.empty(voigt.shape[:-1] + (3, 3), dtype=voigt.dtype)
+    tensors[..., VOIGT_ROWS, VOIGT_COLS] = voigt
+    tensors[..., VOIGT_COLS, VOIGT_ROWS] = voigt
+    return tensors
+
+
+def voigt_index_products(tensors):
+    """
+    Component products for every pair of Voigt components
+
+    For Voigt row (p, q) and column (r, s) the products A_pr A_qs and
+    A_ps A_qr are gathered with flat indices, without forming 3x3x3x3
+    tensors. They build Bond matrices and symmetric products A ⊙ A.
+
+    Parameters:
+    tensors: (..., 3, 3) array A
+
+    Returns:
+    direct, crossed: (..., 6, 6) arrays of A_pr A_qs and A_ps A_qr
+    """
+    tensors = np.asarray(tensors, dtype=float)
+    flat = tensors.reshape(tensors.shape[:-2] + (9,))
+    return (np.take(flat, _PR, axis=-1) * np.take(flat, _QS, axis=-1),
+            np.take(flat, _PS, axis=-1) * np.take(flat, _QR, axis=-1))
+
+
+def as_voigt(tensors):
+    """
+    Return a Voigt view of the input, accepting (..., 3, 3) or (..., 6)
+    """
+    tensors = np.asarray(tensors, dtype=float)
+    if tensors.shape[-1] == 6:
+        return tensors
+    if tensors.shape[-2:] == (3, 3):
+        return tensor_to_voigt(tensors)
+    raise ValueError(
+        f"Expected (..., 3, 3) or (..., 6) array, got shape {tensors.shape}"
+    )
+
+
+def stress_invariants(tensors):
+    """
+    Compute I1, I2 and I3 for a batch of tensors in one pass
+
+    Full (..., 3, 3) input is not assumed to be symmetric, so the same
+    function works for displacement and deformation gradients. Voigt
+    (..., 6) input is symmetric by construction.
+
+    Parameters:
+    tensors: (..., 3, 3) or (..., 6) array
+
+    Returns:
+    I1, I2, I3: arrays with the batch shape of the input
+    """
+    tensors = np.asarray(tensors, dtype=float)
+
+    if tensors.shape[-1] == 6:
+        s11, s22, s33, s23, s13, s12 = np.moveaxis(tensors, -1, 0)
+        I1 = s11 + s22 + s33
+        I2 = s11*s22 + s22*s33 + s33*s11 - s12*s12 - s23*s23 - s13*s13
+        I3 = (s11*s22*s33 + 2*s12*s23*s13
+              - s11*s23*s23 - s22*s13*s13 - s33*s12*s12)
+        return I1, I2, I3
+
+    if tensors.shape[-2:] != (3, 3):
+        raise ValueError(
+            f"Expected (..., 3, 3) or (..., 6) array, got shape {tensors.shape}"
+        )
+
+    t11, t12, t13 = tensors[..., 0, 0], tensors[..., 0, 1], tensors[..., 0, 2]
+    t21, t22, t23 = tensors[..., 1, 0], tensors[..., 1, 1], tensors[..., 1, 2]
+    t31, t32, t33 = tensors[..., 2, 0], tensors[..., 2, 1], tensors[..., 2, 2]
+
+    I1 = t11 + t22 + t33
+    I2 = t11*t22 + t22*t33 + t33*t11 - t12*t21 - t23*t32 - t13*t31
+    I3 = (t11*(t22*t33 - t23*t32)
+          - t12*(t21*t33 - t23*t31)
+          + t13*(t21*t32 - t22*t31))
+    return I1, I2, I3
@@ -0,0 +1,150 @@
+"""
+Finite-strain kinematics for batches of deformation gradients
+
+For F with shape (..., d, d), d = 2 or 3:
+
+    J = det(F)
+    C = FᵀF                  right Cauchy-Green tensor
+    b = FFᵀ                  left Cauchy-Green tensor
+    E = 0.5 * (C - I)        Green-Lagrange strain
+    e = 0.5 * (I - b⁻¹)      Almansi strain, with b⁻¹ = F⁻ᵀF⁻¹
+    F = R U                  polar decomposition (closed form with an SVD
+                             fallback at extreme stretches, see polar.py)
+    ln U                     logarithmic (Hencky) strain
+
+Every quantity is a cached property, so asking for E after C, or for R
+after U, reuses what has already been computed for the same F.
+"""
+
+from functools import cached_property
+
+import numpy as np
+
+from .polar import polar_factors, principal_stretches
+
+
+class Kinematics:
+    """
+    Strain and rotation measures derived from a batch of deformation gradients
+
+    Parameters:
+    F: (..., 3, 3) or (..., 2, 2) array
+
+    Example:
+    >>> kin = Kinematics.from_displacement_gradient(H)
+    >>> kin.E, kin.e, kin.J
+    """
+
+    def __init__(self, F):
+        F = np.asarray(F, dtype=float)
+        if F.ndim < 2 or F.shape[-1] != F.shape[-2] or F.shape[-1] not in (2, 3):
+            raise ValueError(f"Expected (..., 3, 3) or (..., 2, 2) array, "
+                             f"got shape {F.shape}")
+        self.F = F
+        self.dim = F.shape[-1]
+        self.identity = np.eye(self.dim)
+
+    @classmethod
+    def from_displacement_gradient(cls, H):
+        """Build from the displacement gradient H = ∂u/∂X, F = I + H"""
+        H = np.asarray(H, dtype=float)
+        return cls(H + np.eye(H.shape[-1]))
+
+    # -------------------------------------------------------------------------
+    # Volume change and inverse
+    # -------------------------------------------------------------------------
+
+    @cached_property
+    def J(self):
+        """Volume ratio det(F)"""
+        F = self.F
+        if self.dim == 2:
+            return F[..., 0, 0] * F[..., 1, 1] - F[..., 0, 1] * F[..., 1, 0]
+        return np.einsum('...i,...i->...', F[..., 0, :],
+                         np.cross(F[..., 1, :], F[..., 2, :]))
+
+    @cached_property
+    def F_inv(self):
+        """Inverse deformation gradient from the adjugate, adj(F) / J"""
+        F = self.F
+        adjugate = np.empty_like(F)
+        if self.dim == 2:
+            adjugate[..., 0, 0] = F[..., 1, 1]
+            adjugate[..., 0, 1] = -F[..., 0, 1]
+            adjugate[..., 1, 0] = -F[..., 1, 0]
+            adjugate[..., 1, 1] = F[..., 0, 0]
+        else:
+            rows = F[..., 0, :], F[..., 1, :], F[..., 2, :]
+            for i in range(3):
+                adjugate[..., :, i] = np.cross(rows[(i + 1) % 3],
+                                               rows[(i + 2) % 3])
+        return adjugate / self.J[..., np.newaxis, np.newaxis]
+
+    # -------------------------------------------------------------------------
+    # Deformation tensors and strains
+    # -------------------------------------------------------------------------
+
+    @cached_property
+    def C(self):
+        """Right Cauchy-Green tensor FᵀF"""
+        return np.einsum('...ki,...kj->...ij', self.F, self.F)
+
+    @cached_property
+    def b(self):
+        """Left Cauchy-Green tensor FFᵀ"""
+        return np.einsum('...ik,...jk->...ij', self.F, self.F)
+
+    @cached_property
+    def b_inv(self):
+        """Inverse left Cauchy-Green tensor F⁻ᵀF⁻¹"""
+        return np.einsum('...ki,...kj->...ij', self.F_inv, self.F_inv)
+
+    @cached_property
+    def E(self):
+        """Green-Lagrange strain 0.5 * (C - I)"""
+        return 0.5 * (self.C - self.identity)
+
+    @cached_property
+    def e(self):
+        """Almansi strain 0.5 * (I - b⁻¹)"""
+        return 0.5 * (self.identity - self.b_inv)
+
+    # -------------------------------------------------------------------------
+    # Polar decomposition and logarithmic strain
+    # -------------------------------------------------------------------------
+
+    @cached_property
+    def principal_stretches(self):
+        """Principal stretches λᵢ = √(eigenvalues of C), largest first"""
+        return principal_stretches(self.C)
+
+    @cached_property
+    def _polar_factors(self):
+        return polar_factors(self.F, self.C, self.principal_stretches)
+
+    @cached_property
+    def U(self):
+        """Right stretch tensor U = √C, in closed form"""
+        return self._polar_factors[2]
+
+    @cached_property
+    def U_inv(self):
+        """Inverse right stretch tensor U⁻¹"""
+        return self._polar_factors[3]
+
+    @cached_property
+    def R(self):
+        """Rotation tensor R = F U⁻¹"""
+        return self._polar_factors[1]
+
+    @cached_property
+    def V(self):
+        """Left stretch tensor V = R U Rᵀ"""
+        return np.einsum('...ik,...kl,...jl->...ij', self.R, self.U, self.R)
+
+    @cached_property
+    def log_strain(self):
+        """Logarithmic (Hencky) strain ln U = Σ ln(λᵢ) Nᵢ⊗Nᵢ"""
+        eigenvalues, N = np.linalg.eigh(self.C)
+        return np.einsum('...ik,...k,...jk->...ij', N,
+                         0.5 * np.log(eigenvalues), N)
@@ -0,0 +1,123 @@
+"""
+Material property fields for heterogeneous models
+
+Material properties (Young's modulus η, Poisson's ratio ν, yield
+strength, ...) can be given to the constitutive and failure evaluators in
+three ways:
+
+1. a scalar, as for a single material
+2. a per-point array broadcast against the batch shape of the field
+3. a compact property table plus a material ID per point
+
+    table = MaterialTable(['cortical', 'trabecular'],
+                          eta=[17e3, 1e3], nu=[0.3, 0.3],
+                          yield_strength=[130, 10])
+    elastic = IsotropicElasticity.from_table(table, material_ids)
+    results = evaluate_failure(stresses, table, material_ids=material_ids)
+
+With IDs the table is gathered once per call (values[material_ids]), so a
+multi-material model is evaluated in one vectorized pass without masking
+and copying per material group.
+"""
+
+import numpy as np
+
+
+class MaterialTable:
+    """
+    Compact table of material properties indexed by material ID
+
+    Parameters:
+    names: material names, one per row; defaults to '0', '1', ...
+    properties: one sequence per property with one value per material
+
+    Material IDs are row indices into the table.
+    """
+
+    def __init__(self, names=None, **properties):
+        if not properties:
+            raise ValueError("MaterialTable needs at least one property")
+        self.properties = {key: np.asarray(values, dtype=float).ravel()
+                           for key, values in properties.items()}
+        sizes = {len(values) for values in self.properties.values()}
+        if len(sizes) != 1:
+            raise ValueError(f"All properties need one value per material, "
+                             f"got lengths {sorted(sizes)}")
+        size = sizes.pop()
+        if names is None:
+            names = [str(k) for k in range(size)]
+        if len(names) != size:
+            raise ValueError(f"Expected {size} material names, "
+                             f"got {len(names)}")
+        self.names = list(names)
+
+    @classmethod
+    def from_records(cls, records):
+        """
+        Build from a mapping of material name to property dictionary
+
+        >>> MaterialTable.from_records({'cortical': {'eta': 17e3, 'nu': 0.3}})
+        """
+        names = list(records)
+        keys = list(records[names[0]])
+        return cls(names, **{key: [records[name][key] for name in names]
+                             for key in keys})
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, key):
+        return key in self.properties
+
+    def __getitem__(self, key):
+        return self.properties[key]
+
+    def material_id(self, name):
+        """Row index of a material name"""
+        return self.names.index(name)
+
+    def lookup(self, key, material_ids):
+        """
+        Per-point values of one property
+
+        Parameters:
+        key: property name
+        material_ids: integer array of row indices, any shape
+
+        Returns:
+        Array with the shape of material_ids
+        """
+        if key not in self.properties:
+            raise KeyError(f"Material property '{key}' not in table, "
+                           f"available: {sorted(self.properties)}")
+        return self.properties[key][np.asarray(material_ids, dtype=np.intp)]
+
+    def field(self, material_ids):
+        """Per-point arrays of every property, as a dictionary"""
+        return {key: self.lookup(key, material_ids)
+                for key in self.properties}
+
+
+def material_property(values, material_ids=None, key=None):
+    """
+    Resolve a material property to a scalar or per-point array
+
+    Parameters:
+    values: scalar (shared by every material), per-point array,
+            per-material array (with material_ids) or MaterialTable
+            (with material_ids and key)
+    material_ids: integer array of material IDs per point
+    key: property name used when values is a MaterialTable
+
+    Returns:
+    Array that broadcasts against the batch shape of the field
+    """
+    if isinstance(values, MaterialTable):
+        if material_ids is None:
+            raise ValueError("A MaterialTable needs material_ids")
+        return values.lookup(key, material_ids)
+    values = np.asarray(values, dtype=float)
+    if material_ids is None or values.ndim == 0:
+        # A scalar is shared by all materials and broadcasts as it is
+        return values
+    return values[np.asarray(material_ids, dtype=np.intp)]
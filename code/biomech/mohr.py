@@ -0,0 +1,110 @@
+"""
+Mohr's circles for batches of 3D stress states
+
+With principal stresses σ1 ≥ σ2 ≥ σ3 the three Mohr circles have
+
+    circle 13: centre (σ1 + σ3)/2, radius (σ1 - σ3)/2   (outer circle)
+    circle 12: centre (σ1 + σ2)/2, radius (σ1 - σ2)/2
+    circle 23: centre (σ2 + σ3)/2, radius (σ2 - σ3)/2
+
+All admissible (σ_n, τ_n) pairs lie inside the outer circle and outside
+the two inner ones. The renderer draws every circle of every stress state
+as one LineCollection, so overlaying thousands of states is a single
+artist.
+"""
+
+import numpy as np
+
+from .principal import principal_values
+from .traction import normal_shear
+
+CIRCLE_PAIRS = ((0, 2), (0, 1), (1, 2))
+
+
+def mohr_circles(stresses):
+    """
+    Centres and radii of the three Mohr circles of each stress state
+
+    Parameters:
+    stresses: (..., 3, 3) or (..., 6) symmetric stress tensors
+
+    Returns:
+    centres, radii: (..., 3) arrays ordered as circles 13, 12, 23
+    """
+    principal = principal_values(stresses)
+    first = principal[..., [i for i, _ in CIRCLE_PAIRS]]
+    second = principal[..., [j for _, j in CIRCLE_PAIRS]]
+    return 0.5 * (first + second), 0.5 * (first - second)
+
+
+def mohr_points(stresses, normals=None):
+    """
+    Normal and shear stress (σ_n, τ_n) on planes with the given normals
+
+    Parameters:
+    stresses: (..., 3, 3) or (..., 6) symmetric stress tensors
+    normals: (K, 3) plane normals, defaults to the coordinate axes so the
+             points belong to the current x₁, x₂, x₃ planes
+
+    Returns:
+    sigma_n, tau_n: (..., K) arrays, tau_n ≥ 0
+    """
+    if normals is None:
+        normals = np.eye(3)
+    return normal_shear(stresses, normals)
+
+
+def circle_segments(centres, radii, n_points=181):
+    """
+    Polyline vertices of circles in the (σ, τ) plane
+
+    Parameters:
+    centres, radii: arrays of the same shape
+    n_points: vertices per circle
+
+    Returns:
+    (M, n_points, 2) array with M = centres.size
+    """
+    angle = np.linspace(0, 2*np.pi, n_points)
+    centres = np.asarray(centres, dtype=float).reshape(-1, 1)
+    radii = np.asarray(radii, dtype=float).reshape(-1, 1)
+    return np.stack([centres + radii * np.cos(angle),
+                     radii * np.sin(angle)], axis=-1)
+
+
+def plot_mohr_circles(ax, stresses, n_points=181, show_points=True,
+                      colors=('b', 'g', 'r'), **line_kwargs):
+    """
+    Draw the Mohr circles of many stress states as one LineCollection
+
+    Parameters:
+    ax: matplotlib Axes
+    stresses: (..., 3, 3) or (..., 6) symmetric stress tensors
+    n_points: vertices per circle
+    show_points: also mark the (σ, ±τ) points of the x₁, x₂, x₃ planes
+    colors: colours of circles 13, 12, 23
+    line_kwargs: passed to LineCollection
+
+    Returns:
+    The LineCollection
+    """
+    from matplotlib.collections import LineCollection
+
+    centres, radii = mohr_circles(stresses)
+    segments = circle_segments(centres, radii, n_points)
+    circle_colors = np.resize(np.asarray(colors, dtype=object), len(segments))
+
+    line_kwargs.setdefault('linewidths', 2)
+    collection = LineCollection(segments, colors=list(circle_colors),
+                                **line_kwargs)
+    ax.add_collection(collection)
+
+    if show_points:
+        sigma_n, tau_n = mohr_points(stresses)
+        sigma_n, tau_n = sigma_n.ravel(), tau_n.ravel()
+        ax.scatter(np.concatenate([sigma_n, sigma_n]),
+                   np.concatenate([tau_n, -tau_n]),
+                   color='k', s=12, zorder=3)
+
+    ax.autoscale_view()
+    return collection
@@ -0,0 +1,223 @@
+"""
+Closed-form polar decomposition F = R U for batches of 2x2 and 3x3 F
+
+The right stretch tensor is evaluated directly from C = FᵀF without an
+SVD or a general eigen-solver:
+
+2D:  U = (C + √(det C) I) / √(tr C + 2√(det C))
+     U⁻¹ = (tr U I - U) / det U
+
+3D:  (Hoger & Carlson, 1984) with the principal stretches λᵢ from the
+     closed-form eigenvalues of C and
+         i1 = λ1 + λ2 + λ3,  i2 = λ1λ2 + λ2λ3 + λ3λ1,  i3 = λ1λ2λ3
+     U   = [-C² + (i1² - i2) C + i1 i3 I] / (i1 i2 - i3)
+     U⁻¹ = [C - i1 U + i2 I] / i3
+
+The denominator i1 i2 - i3 = (λ1+λ2)(λ2+λ3)(λ3+λ1) is always positive,
+so repeated stretches need no special treatment. R = F U⁻¹.
+
+The closed form goes through C = FᵀF and C², so its error grows roughly
+with (λ1/λd)⁴ eps: about 1e-13 in R at a stretch ratio of 10, but 1e-1
+at 1e4, and it divides by zero near 1e6. polar_factors() and
+polar_decomposition() therefore decompose points with λ1/λd above
+_MAX_STRETCH_RATIO by an SVD of F instead; right_stretch() alone is meant
+for well-conditioned C.
+"""
+
+import numpy as np
+
+from .invariants import tensor_to_voigt
+from .principal import principal_frame, principal_values
+
+# Largest stretch ratio λ1/λd decomposed in closed form; the error in R
+# stays below about 1e-11 up to here
+_MAX_STRETCH_RATIO = 20.0
+
+
+def right_cauchy_green(F):
+    """C = FᵀF for (..., d, d) arrays"""
+    return np.swapaxes(F, -1, -2) @ F
+
+
+def principal_stretches(C):
+    """
+    Principal stretches from C, largest first
+
+    Parameters:
+    C: (..., 2, 2) or (..., 3, 3) right Cauchy-Green tensors
+
+    Returns:
+    (..., d) array of stretches
+    """
+    C = np.asarray(C, dtype=float)
+    if C.shape[-1] == 2:
+        mean = 0.5 * (C[..., 0, 0] + C[..., 1, 1])
+        radius = np.hypot(0.5 * (C[..., 0, 0] - C[..., 1, 1]), C[..., 0, 1])
+        squared = np.stack([mean + radius, mean - radius], axis=-1)
+    else:
+        squared = principal_values(tensor_to_voigt(C))
+    return np.sqrt(np.maximum(squared, 0.0))
+
+
+def right_stretch(C, stretches=None):
+    """
+    Right stretch tensor U = √C and its inverse in closed form
+
+    Accurate for stretch ratios λ1/λd up to about _MAX_STRETCH_RATIO; use
+    polar_factors() for deformation gradients that may exceed it.
+
+    Parameters:
+    C: (..., 2, 2) or (..., 3, 3) right Cauchy-Green tensors
+    stretches: optional principal stretches of C, reused if already known
+
+    Returns:
+    U, U_inv: arrays with the shape of C
+    """
+    C = np.asarray(C, dtype=float)
+    identity = np.eye(C.shape[-1])
+
+    if C.shape[-1] == 2:
+        root_det = np.sqrt(C[..., 0, 0] * C[..., 1, 1]
+                           - C[..., 0, 1] * C[..., 1, 0])
+        scale = np.sqrt(C[..., 0, 0] + C[..., 1, 1] + 2 * root_det)
+        U = (C + root_det[..., None, None] * identity) / scale[..., None, None]
+        trace_U = U[..., 0, 0] + U[..., 1, 1]
+        U_inv = (trace_U[..., None, None] * identity - U) \
+            / root_det[..., None, None]
+        return U, U_inv
+
+    if stretches is None:
+        stretches = principal_stretches(C)
+    l1, l2, l3 = np.moveaxis(stretches, -1, 0)
+    i1 = l1 + l2 + l3
+    i2 = l1*l2 + l2*l3 + l3*l1
+    i3 = l1 * l2 * l3
+
+    U = (-(C @ C)
+         + (i1*i1 - i2)[..., None, None] * C
+         + (i1*i3)[..., None, None] * identity) \
+        / (i1*i2 - i3)[..., None, None]
+    U_inv = (C - i1[..., None, None] * U + i2[..., None, None] * identity) \
+        / i3[..., None, None]
+    return U, U_inv
+
+
+def _ill_conditioned(stretches):
+    """Points whose stretch ratio is too large for the closed form"""
+    # Written so that NaN and zero stretches also count as ill-conditioned
+    return ~(stretches[..., 0] <= _MAX_STRETCH_RATIO * stretches[..., -1])
+
+
+def _svd_factors(F):
+    """Stretches, R, U and U⁻¹ from the SVD F = W Σ Vᵀ"""
+    W, sigma, Vt = np.linalg.svd(F)
+    V = np.swapaxes(Vt, -1, -2)
+    return (sigma, W @ Vt, (V * sigma[..., None, :]) @ Vt,
+            (V / sigma[..., None, :]) @ Vt)
+
+
+def polar_factors(F, C=None, stretches=None):
+    """
+    Principal stretches and the factors of F = R U, with an SVD fallback
+
+    Points with a stretch ratio λ1/λd up to _MAX_STRETCH_RATIO use the
+    closed form of right_stretch(). The rest, where the closed form loses
+    accuracy or divides by zero, are decomposed by an SVD of F.
+
+    Parameters:
+    F: (..., 2, 2) or (..., 3, 3) deformation gradients with det F > 0
+    C: optional FᵀF, reused if already known
+    stretches: optional principal stretches of C, reused if already known
+
+    Returns:
+    stretches: (..., d) principal stretches, largest first
+    R, U, U_inv: arrays with the shape of F
+    """
+    F = np.asarray(F, dtype=float)
+    if C is None:
+        C = right_cauchy_green(F)
+    if stretches is None:
+        stretches = principal_stretches(C)
+    ill = _ill_conditioned(stretches)
+    if ill.any():
+        # Keep the closed form finite at the points replaced below
+        C = np.where(ill[..., None, None], np.eye(F.shape[-1]), C)
+        stretches = np.where(ill[..., None], 1.0, stretches)
+    U, U_inv = right_stretch(C, stretches)
+    R = F @ U_inv
+    if ill.any():
+        stretches[ill], R[ill], U[ill], U_inv[ill] = _svd_factors(F[ill])
+    return stretches, R, U, U_inv
+
+
+def rotation_angle(R):
+    """
+    Rotation angle of 2x2 or 3x3 rotation tensors, in radians
+
+    2D angles are signed in (-π, π]; 3D angles are in [0, π].
+    """
+    R = np.asarray(R)
+    if R.shape[-1] == 2:
+        return np.arctan2(R[..., 1, 0], R[..., 0, 0])
+    cos_angle = 0.5 * (R[..., 0, 0] + R[..., 1, 1] + R[..., 2, 2] - 1)
+    return np.arccos(np.clip(cos_angle, -1.0, 1.0))
+
+
+def rotation_axis(R):
+    """Unit rotation axis of 3x3 rotation tensors from their skew part"""
+    R = np.asarray(R)
+    axis = np.stack([R[..., 2, 1] - R[..., 1, 2],
+                     R[..., 0, 2] - R[..., 2, 0],
+                     R[..., 1, 0] - R[..., 0, 1]], axis=-1)
+    norm = np.linalg.norm(axis, axis=-1, keepdims=True)
+    return np.divide(axis, norm, out=np.zeros_like(axis), where=norm > 0)
+
+
+def polar_decomposition(F, directions=True):
+    """
+    Polar decomposition F = R U with principal stretches and directions
+
+    Parameters:
+    F: (..., 2, 2) or (..., 3, 3) deformation gradients with det F > 0
+    directions: also return Lagrangian and Eulerian principal directions
+
+    Returns:
+    Dictionary with
+    'R', 'U', 'U_inv': (..., d, d) arrays
+    'stretches': (..., d) principal stretches, largest first
+    'rotation_angle': (...) rotation angle in radians
+    'rotation_axis': (..., 3) unit axis (3D only)
+    'lagrangian_directions': (..., d, d) eigenvectors Nᵢ of U as columns
+    'eulerian_directions': (..., d, d) nᵢ = R Nᵢ as columns
+    """
+    F = np.asarray(F, dtype=float)
+    dim = F.shape[-1]
+    if F.shape[-2:] not in ((2, 2), (3, 3)):
+        raise ValueError(f"Expected (..., 3, 3) or (..., 2, 2) array, "
+                         f"got shape {F.shape}")
+
+    C = right_cauchy_green(F)
+    stretches, R, U, U_inv = polar_factors(F, C)
+
+    results = {
+        'R': R,
+        'U': U,
+        'U_inv': U_inv,
+        'stretches': stretches,
+        'rotation_angle': rotation_angle(R),
+    }
+    if dim == 3:
+        results['rotation_axis'] = rotation_axis(R)
+
+    if directions:
+        if dim == 2:
+            phi = 0.5 * np.arctan2(2 * C[..., 0, 1], C[..., 0, 0] - C[..., 1, 1])
+            cos_phi, sin_phi = np.cos(phi), np.sin(phi)
+            N = np.stack([np.stack([cos_phi, -sin_phi], axis=-1),
+                          np.stack([sin_phi, cos_phi], axis=-1)], axis=-2)
+        else:
+            _, N = principal_frame(C)
+        results['lagrangian_directions'] = N
+        results['eulerian_directions'] = R @ N
+
+    return results
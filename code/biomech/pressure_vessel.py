@@ -0,0 +1,185 @@
+"""
+Wall stresses of pressurised cylindrical vessel segments
+
+Laplace's law for a thin-walled cylinder with radius r, wall thickness t
+and pressure difference Δp = p_i - p_o across the wall
+(ex3.1.3c-free-body-diagram.py):
+
+    σ_θ = Δp r / t,     σ_z = Δp r / (2t) (closed ends),     σ_r = 0
+
+The thick-walled (Lamé) solution with inner radius a = r and outer radius
+b = r + t evaluates the stresses at radius ρ through the wall:
+
+    σ_r = A - B/ρ²,     σ_θ = A + B/ρ²,     σ_z = A (closed ends)
+    A = (p_i a² - p_o b²) / (b² - a²),     B = (p_i - p_o) a² b² / (b² - a²)
+
+All inputs broadcast, so a whole arterial tree of segments is evaluated in
+one pass. process_vessel_file() streams segment tables from disk in
+chunks and writes the result columns with the streaming writers.
+"""
+
+import numpy as np
+
+from .failure import von_mises_principal
+from .materials import material_property
+from .streaming import (
+    DEFAULT_CHUNK_SIZE,
+    iter_row_chunks,
+    open_result_writer,
+)
+
+METHODS = ('thin', 'lame')
+WALL_POSITIONS = {'inner': 0.0, 'mid': 0.5, 'outer': 1.0}
+
+
+def _wall_fraction(position):
+    if isinstance(position, str):
+        try:
+            return WALL_POSITIONS[position]
+        except KeyError:
+            raise ValueError(f"Unknown wall position '{position}', expected "
+                             f"one of {sorted(WALL_POSITIONS)} or a number "
+                             f"in [0, 1]") from None
+    return np.asarray(position, dtype=float)
+
+
+def thin_wall_stress(radius, thickness, pressure, external_pressure=0.0,
+                     closed_ends=True):
+    """
+    Laplace-law wall stresses of thin-walled cylinders
+
+    Parameters:
+    radius, thickness, pressure: arrays of segment radii r, wall
+                                 thicknesses t and internal pressures
+    external_pressure: pressure outside the vessel
+    closed_ends: include the axial stress from the pressure on the ends
+
+    Returns:
+    hoop, axial, radial: arrays with the broadcast shape of the inputs
+    """
+    radius = np.asarray(radius, dtype=float)
+    thickness = np.asarray(thickness, dtype=float)
+    pressure = np.asarray(pressure, dtype=float)
+    hoop = (pressure - external_pressure) * radius / thickness
+    axial = 0.5 * hoop if closed_ends else np.zeros_like(hoop)
+    return hoop, axial, np.zeros_like(hoop)
+
+
+def lame_stress(radius, thickness, pressure, external_pressure=0.0,
+                closed_ends=True, position='inner'):
+    """
+    Lamé wall stresses of thick-walled cylinders
+
+    Parameters:
+    radius: inner radii a
+    thickness: wall thicknesses t, outer radius b = a + t
+    pressure: internal pressures
+    external_pressure: pressure outside the vessel
+    closed_ends: include the axial stress from the pressure on the ends
+    position: 'inner', 'mid', 'outer' or the fraction of the wall
+              thickness from the inner surface; the hoop and von Mises
+              stresses are largest at the inner surface
+
+    Returns:
+    hoop, axial, radial: arrays with the broadcast shape of the inputs
+    """
+    a = np.asarray(radius, dtype=float)
+    b = a + np.asarray(thickness, dtype=float)
+    pressure = np.asarray(pressure, dtype=float)
+    rho = a + _wall_fraction(position) * (b - a)
+
+    a2, b2 = a * a, b * b
+    A = (pressure * a2 - external_pressure * b2) / (b2 - a2)
+    B_rho = (pressure - external_pressure) * a2 * b2 / ((b2 - a2) * rho * rho)
+    hoop = A + B_rho
+    axial = A * np.ones_like(hoop) if closed_ends else np.zeros_like(hoop)
+    return hoop, axial, A - B_rho
+
+
+def vessel_stress(radius, thickness, pressure, method='thin',
+                  external_pressure=0.0, closed_ends=True, position='inner',
+                  yield_strength=None, material_ids=None):
+    """
+    Wall stresses, von Mises stress and utilisation of vessel segments
+
+    Parameters:
+    radius, thickness, pressure: (N,) arrays of segments; r is the inner
+                                 radius for the Lamé solution
+    method: 'thin' (Laplace's law) or 'lame' (thick-walled)
+    external_pressure: pressure outside the vessel
+    closed_ends: include the axial stress from the pressure on the ends
+    position: wall position for the Lamé solution, see lame_stress()
+    yield_strength: optional allowable stress, scalar, per segment, or
+                    per material / MaterialTable with material_ids
+    material_ids: optional material ID per segment
+
+    Returns:
+    Dictionary of columns 'hoop', 'axial', 'radial', 'von_mises' and,
+    with a yield strength, 'utilisation' = σ_vm / σ_yield. For thin walls
+    the utilisation is also the ratio of required to actual thickness.
+    """
+    if method == 'thin':
+        hoop, axial, radial = thin_wall_stress(
+            radius, thickness, pressure, external_pressure, closed_ends)
+    elif method == 'lame':
+        hoop, axial, radial = lame_stress(
+            radius, thickness, pressure, external_pressure, closed_ends,
+            position)
+    else:
+        raise ValueError(f"Unknown method '{method}', expected one of "
+                         f"{METHODS}")
+
+    sigma_vm = von_mises_principal(np.stack([hoop, axial, radial], axis=-1))
+    results = {
+        'hoop': hoop,
+        'axial': axial,
+        'radial': radial,
+        'von_mises': sigma_vm,
+    }
+    if yield_strength is not None:
+        yield_strength = material_property(yield_strength, material_ids,
+                                           'yield_strength')
+        results['utilisation'] = sigma_vm / yield_strength
+    return results
+
+
+def process_vessel_file(input_path, output_path,
+                        chunk_size=DEFAULT_CHUNK_SIZE, dataset="segments",
+                        **options):
+    """
+    Stream a table of vessel segments through vessel_stress()
+
+    The input has one segment per row with the columns radius, thickness,
+    pressure and, optionally, an integer material ID (used with a
+    per-material yield_strength or MaterialTable).
+
+    Parameters:
+    input_path: segment table (.csv, .npy, .h5 or .hdf5)
+    output_path: result file (.csv, .npy, .h5 or .hdf5)
+    chunk_size: number of segments held in memory at a time
+    dataset: dataset name for HDF5 input
+    options: keyword arguments of vessel_stress()
+
+    Returns:
+    Number of segments processed
+    """
+    writer = open_result_writer(output_path)
+    count = 0
+    try:
+        for rows in iter_row_chunks(input_path, chunk_size, dataset):
+            if rows.shape[1] not in (3, 4):
+                raise ValueError(f"Expected 3 or 4 columns per segment, "
+                                 f"got {rows.shape[1]}")
+            if rows.shape[1] == 4:
+                options['material_ids'] = rows[:, 3].astype(np.intp)
+            writer.write(vessel_stress(rows[:, 0], rows[:, 1], rows[:, 2],
+                                       **options))
+            count += len(rows)
+        if count == 0:
+            # Empty input still gets the header / column layout
+            empty = np.empty(0)
+            options['material_ids'] = np.empty(0, dtype=np.intp)
+            writer.write(vessel_stress(empty, empty, empty, **options))
+    finally:
+        writer.close()
+    return count
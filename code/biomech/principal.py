@@ -0,0 +1,145 @@
+"""
+Principal values of symmetric 3x3 tensors
+
+Uses the trigonometric (Lode angle) solution of the characteristic
+polynomial σ³ - I1σ² + I2σ - I3 = 0. For a symmetric tensor all three
+roots are real, and with
+
+    m  = I1 / 3
+    J2 = 0.5 * s:s,   J3 = det(s),   s = T - m I
+    cos(3θ) = (3√3 / 2) * J3 / J2^(3/2),   0 ≤ θ ≤ π/3
+
+the principal values are
+
+    σ1 = m + 2√(J2/3) cos(θ)
+    σ2 = m + 2√(J2/3) cos(θ - 2π/3)
+    σ3 = m + 2√(J2/3) cos(θ + 2π/3)
+
+which are already in descending order. Near a repeated root the cubic is
+flat, so the two coalescing values are accurate to about √eps relative to
+the tensor magnitude; the arccos argument is clipped so the result always
+stays real.
+"""
+
+import numpy as np
+
+from .invariants import as_voigt, voigt_to_tensor
+
+# Size of J2 relative to m² + J2 below which the tensor is treated as
+# hydrostatic; scale-free, so tiny tensors keep their principal values
+_HYDROSTATIC_TOL = 1e-28
+
+
+def deviatoric_invariants(tensors):
+    """
+    Mean value and deviatoric invariants J2, J3 of symmetric tensors
+
+    J2 and J3 are computed from the deviator components directly rather
+    than from I1, I2, I3, which avoids cancellation when the mean stress
+    is large compared to the deviatoric part.
+
+    Parameters:
+    tensors: (..., 3, 3) or (..., 6) array
+
+    Returns:
+    mean, J2, J3: arrays with the batch shape of the input
+    """
+    s11, s22, s33, s23, s13, s12 = np.moveaxis(as_voigt(tensors), -1, 0)
+    mean = (s11 + s22 + s33) / 3
+    d11, d22, d33 = s11 - mean, s22 - mean, s33 - mean
+
+    J2 = ((d11 - d22)**2 + (d22 - d33)**2 + (d33 - d11)**2) / 6 \
+        + s23*s23 + s13*s13 + s12*s12
+    J3 = (d11*d22*d33 + 2*s12*s23*s13
+          - d11*s23*s23 - d22*s13*s13 - d33*s12*s12)
+    return mean, J2, J3
+
+
+def lode_angle(J2, J3, mean=0.0):
+    """
+    Lode angle θ in [0, π/3] from the deviatoric invariants
+
+    The argument of arccos is clipped to [-1, 1] so that round-off for
+    (nearly) repeated roots never produces NaN. Hydrostatic states, where
+    J2 is negligible against m² + J2 for the mean value m, get θ = 0; the
+    test is relative, so it does not depend on the units or scale of the
+    tensor.
+    """
+    J2 = np.asarray(J2, dtype=float)
+    J3 = np.asarray(J3, dtype=float)
+    mean = np.asarray(mean, dtype=float)
+    denominator = J2 * np.sqrt(J2)
+    tiny = (J2 <= _HYDROSTATIC_TOL * (mean * mean + J2)) | (denominator == 0)
+    ratio = np.divide(1.5 * np.sqrt(3.0) * J3, denominator,
+                      out=np.zeros(np.broadcast(J2, J3, mean).shape),
+                      where=~tiny)
+    return np.arccos(np.clip(ratio, -1.0, 1.0)) / 3
+
+
+def principal_values(tensors):
+    """
+    Principal values of a batch of symmetric tensors
+
+    Parameters:
+    tensors: (..., 3, 3) or (..., 6) array, symmetric
+
+    Returns:
+    (..., 3) array of real principal values, sorted largest first
+    """
+    mean, J2, J3 = deviatoric_invariants(tensors)
+    theta = lode_angle(J2, J3, mean)
+    radius = 2 * np.sqrt(J2 / 3)
+
+    values = np.empty(np.shape(mean) + (3,))
+    values[..., 0] = mean + radius * np.cos(theta)
+    values[..., 1] = mean + radius * np.cos(theta - 2*np.pi/3)
+    values[..., 2] = mean + radius * np.cos(theta + 2*np.pi/3)
+    return values
+
+
+def principal_frame(tensors, reference=None):
+    """
+    Principal values and a consistent principal frame for symmetric tensors
+
+    The eigen-decomposition is done for the whole stack at once, and the
+    ascending order returned by eigh is reversed with a slice, so there is
+    no per-tensor sorting or fancy indexing.
+
+    Signs are fixed so the triads can be interpolated between points:
+    - without a reference, the largest component of n1 and n2 is positive
+    - with a reference triad, n1 and n2 point into the same half-space as
+      the corresponding reference directions (e.g. a neighbouring element)
+    n3 is always n1 × n2, so every triad is right-handed.
+
+    Parameters:
+    tensors: (..., 3, 3) or (..., 6) array, symmetric
+    reference: optional (3, 3) or (..., 3, 3) array with reference
+               directions as columns, broadcast against the batch
+
+    Returns:
+    values: (..., 3) array, sorted largest first
+    directions: (..., 3, 3) array, directions[..., :, i] belongs to values[..., i]
+    """
+    tensors = np.asarray(tensors, dtype=float)
+    if tensors.shape[-1] == 6:
+        tensors = voigt_to_tensor(tensors)
+
+    eigenvalues, eigenvectors = np.linalg.eigh(tensors)
+    values = eigenvalues[..., ::-1]
+    directions = eigenvectors[..., ::-1].copy()
+
+    n1 = directions[..., :, 0]
+    n2 = directions[..., :, 1]
+    if reference is None:
+        for n in (n1, n2):
+            largest = np.argmax(np.abs(n), axis=-1)[..., np.newaxis]
+            sign = np.sign(np.take_along_axis(n, largest, axis=-1))
+            n *= sign
+    else:
+        reference = np.asarray(reference, dtype=float)
+        for i, n in enumerate((n1, n2)):
+            dot = np.sum(n * reference[..., :, i], axis=-1)[..., np.newaxis]
+            n *= np.where(dot < 0, -1.0, 1.0)
+
+    directions[..., :, 2] = np.cross(n1, n2)
+    return values, directions
@@ -0,0 +1,163 @@
+"""
+Figure output for interactive and headless runs
+
+Interactive runs show figures as before. Headless runs (a non-interactive
+backend such as Agg, e.g. MPLBACKEND=Agg) save every figure to the output
+directory instead of blocking on a GUI window.
+
+Output directory, in order of precedence:
+1. the output_dir argument
+2. the TKT4150_OUTPUT_DIR environment variable
+3. the images/ folder of the repository
+
+Many figures can be rendered in parallel with render_figures(), one
+figure per worker process:
+
+    def plot_case(stresses):
+        fig, ax = plt.subplots()
+        plot_mohr_circles(ax, stresses)
+        return fig
+
+    jobs = [FigureJob(plot_case, (stresses,), f'case{k}.png')
+            for k, stresses in enumerate(load_cases)]
+    render_figures(jobs, output_dir='report', processes=8)
+
+Builders are pickled by name, so they must be module-level functions
+that return a Figure. They may live in an importable module, or in the
+script being run if it starts its work under an
+`if __name__ == "__main__":` guard. ex3.1.3c-free-body-diagram.py renders
+its two diagrams this way.
+
+matplotlib is only imported once a backend is queried or a figure is
+handled, so importing this module stays cheap for batch workers.
+"""
+
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+OUTPUT_DIR_ENV = "TKT4150_OUTPUT_DIR"
+DEFAULT_OUTPUT_DIR = Path(__file__).resolve().parents[2] / "images"
+DEFAULT_DPI = 300
+
+_NON_INTERACTIVE_BACKENDS = ("agg", "cairo", "pdf", "pgf", "ps", "svg",
+                             "template")
+
+FigureJob = namedtuple("FigureJob", ["builder", "args", "filename", "kwargs"],
+                       defaults=[None])
+FigureJob.__doc__ = """
+A figure to render: builder(*args, **kwargs) must return a Figure that is
+saved as filename in the output directory.
+"""
+
+
+def resolve_output_dir(output_dir=None):
+    """Resolve the output directory and make sure it exists"""
+    if output_dir is None:
+        output_dir = os.environ.get(OUTPUT_DIR_ENV, DEFAULT_OUTPUT_DIR)
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    return output_dir
+
+
+def is_headless():
+    """True when the active matplotlib backend cannot open windows"""
+    import matplotlib
+
+    return matplotlib.get_backend().lower() in _NON_INTERACTIVE_BACKENDS
+
+
+def use_headless(output_dir=None):
+    """
+    Switch to the Agg backend, optionally setting the output directory
+
+    The output directory is stored in the environment so worker processes
+    started afterwards use the same one.
+    """
+    import matplotlib
+
+    matplotlib.use("Agg")
+    if output_dir is not None:
+        os.environ[OUTPUT_DIR_ENV] = str(output_dir)
+
+
+def save_figure(fig, filename, output_dir=None, dpi=DEFAULT_DPI):
+    """Save a figure into the output directory and return its path"""
+    target = resolve_output_dir(output_dir) / filename
+    fig.savefig(target, dpi=dpi, bbox_inches='tight')
+    return target
+
+
+def finish_figure(fig, filename=None, always_save=False, dpi=DEFAULT_DPI):
+    """
+    Show a finished figure, or save and close it when running headless
+
+    Parameters:
+    fig: matplotlib Figure
+    filename: file name inside the output directory
+    always_save: also save when running interactively
+
+    Returns:
+    Path of the saved figure, or None
+    """
+    import matplotlib.pyplot as plt
+
+    target = None
+    if filename is not None and (always_save or is_headless()):
+        target = save_figure(fig, filename, dpi=dpi)
+
+    if is_headless():
+        plt.close(fig)
+    else:
+        plt.show()
+    return target
+
+
+def _init_worker():
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+
+def _render_job(job, output_dir, dpi):
+    import matplotlib.pyplot as plt
+
+    fig = job.builder(*job.args, **(job.kwargs or {}))
+    try:
+        return save_figure(fig, job.filename, output_dir, dpi)
+    finally:
+        plt.close(fig)
+
+
+def render_figures(jobs, output_dir=None, processes=None, dpi=DEFAULT_DPI):
+    """
+    Render figures headless in a process pool, one figure per task
+
+    Parameters:
+    jobs: iterable of FigureJob
+    output_dir: output directory (see resolve_output_dir)
+    processes: number of worker processes, defaults to the CPU count;
+               1 renders serially in the current process, without
+               changing its matplotlib backend
+    dpi: resolution of the saved figures
+
+    Returns:
+    List of saved file paths, in the order of the jobs
+    """
+    jobs = list(jobs)
+    output_dir = resolve_output_dir(output_dir)
+
+    if processes == 1 or len(jobs) <= 1:
+        # Keep the caller's backend; savefig renders through Agg for the
+        # file format anyway, and ioff() stops figures popping up
+        import matplotlib.pyplot as plt
+
+        with plt.ioff():
+            return [_render_job(job, output_dir, dpi) for job in jobs]
+
+    with ProcessPoolExecutor(max_workers=processes,
+                             initializer=_init_worker) as pool:
+        futures = [pool.submit(_render_job, job, output_dir, dpi)
+                   for job in jobs]
+        return [future.result() for future in futures]
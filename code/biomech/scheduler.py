@@ -0,0 +1,266 @@
+"""
+Process- and thread-pool schedulers for large batches of load cases
+
+Runs a batched analysis (streaming.ANALYSES or any picklable function
+returning a dictionary of result columns) over tensor arrays that are too
+large, or too many, for one core. The input tensors are copied once into
+a multiprocessing.shared_memory block; workers attach to it when the pool
+starts, receive only (start, stop) index ranges, and write their rows
+into one shared output block per result array. Results may be nested
+dictionaries with any trailing shape and dtype, like those of
+failure.evaluate_failure() or principal values (n, 3). No tensor data is
+pickled.
+
+Load cases are batch dimensions, e.g. (frames, points, 3, 3) stresses
+over a gait cycle, and every result column keeps that batch shape:
+
+    results = run_batch(stresses, 'stress', processes=64)
+    results['von_mises'].shape  # (frames, points)
+
+The chunks are independent, but the speedup is bounded by memory
+bandwidth, pool start-up and the number of chunks per worker, and has
+only been measured on a single CPU so far. Measure it on the target
+machine with bench_scheduler.py before choosing the number of processes.
+
+For mid-sized batches (1e4-1e6 tensors) the process start-up and copies
+cost more than they save. run_threaded() instead splits the batch into
+cache-sized chunks and runs them on a thread pool in the same process;
+the NumPy ufuncs and LAPACK calls of the batched kernels release the GIL,
+so the chunks can run in parallel on several cores. It also accepts the
+nested results of strain.analyze_strain_tensor() and
+analyze_deformation_measures():
+
+    results = run_threaded(strains, analyze_strain_tensor, workers=8)
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .streaming import ANALYSES, DEFAULT_CHUNK_SIZE
+
+# Chunks per worker when the chunk size is not given, for load balancing
+CHUNKS_PER_WORKER = 4
+
+# Tensors per thread task; the inputs, outputs and temporaries of a
+# chunk stay within a typical L2 cache
+DEFAULT_THREAD_CHUNK_SIZE = 4096
+
+# Shared blocks and array views of the current worker process
+_worker = {}
+
+
+def _resolve_analysis(analysis):
+    if callable(analysis):
+        return analysis
+    try:
+        return ANALYSES[analysis]
+    except KeyError:
+        raise ValueError(f"Unknown analysis '{analysis}', "
+                         f"expected one of {sorted(ANALYSES)}") from None
+
+
+def _flatten(tensors):
+    """Split (..., 3, 3) or (..., 6) into the batch shape and (N, ...) rows"""
+    tensors = np.asarray(tensors, dtype=float)
+    if tensors.shape[-1] == 6:
+        batch_shape = tensors.shape[:-1]
+        return batch_shape, tensors.reshape((-1, 6))
+    if tensors.shape[-2:] == (3, 3):
+        batch_shape = tensors.shape[:-2]
+        return batch_shape, tensors.reshape((-1, 3, 3))
+    raise ValueError(f"Expected (..., 3, 3) or (..., 6) tensors, "
+                     f"got {tensors.shape}")
+
+
+def _empty_rows(template, n):
+    """Output arrays for n rows shaped like a chunk's (nested) results"""
+    if isinstance(template, dict):
+        return {name: _empty_rows(values, n)
+                for name, values in template.items()}
+    template = np.asarray(template)
+    return np.empty((n,) + template.shape[1:], dtype=template.dtype)
+
+
+def _store_rows(output, results, start, stop):
+    if isinstance(output, dict):
+        for name, values in output.items():
+            _store_rows(values, results[name], start, stop)
+    else:
+        output[start:stop] = results
+
+
+def _batch_rows(results, batch_shape):
+    """Reshape leading (N,) row axes back to the batch shape"""
+    if isinstance(results, dict):
+        return {name: _batch_rows(values, batch_shape)
+                for name, values in results.items()}
+    results = np.asarray(results)
+    return results.reshape(batch_shape + results.shape[1:])
+
+
+def _leaves(results, path=()):
+    """(path, array) pairs of the arrays in a (nested) result dictionary"""
+    if isinstance(results, dict):
+        for name, values in results.items():
+            yield from _leaves(values, path + (name,))
+    else:
+        yield path, np.asarray(results)
+
+
+def _nest(leaves):
+    """Inverse of _leaves()"""
+    results = {}
+    for path, values in leaves:
+        node = results
+        for name in path[:-1]:
+            node = node.setdefault(name, {})
+        node[path[-1]] = values
+    return results
+
+
+def _attach(name, shape, dtype):
+    block = shared_memory.SharedMemory(name=name)
+    return block, np.ndarray(shape, dtype=dtype, buffer=block.buf)
+
+
+def _init_worker(input_spec, output_specs, analyze):
+    input_block, tensors = _attach(*input_spec)
+    blocks = [input_block]
+    leaves = []
+    for path, spec in output_specs:
+        block, values = _attach(*spec)
+        blocks.append(block)
+        leaves.append((path, values))
+    _worker.update(blocks=blocks, tensors=tensors, results=_nest(leaves),
+                   analyze=analyze)
+
+
+def _run_chunk(start, stop):
+    results = _worker['analyze'](_worker['tensors'][start:stop])
+    _store_rows(_worker['results'], results, start, stop)
+    return stop - start
+
+
+def default_chunk_size(n, processes):
+    """Chunk size giving every worker several chunks, at most the default"""
+    per_chunk = -(-n // (processes * CHUNKS_PER_WORKER))
+    return max(1, min(DEFAULT_CHUNK_SIZE, per_chunk))
+
+
+def run_batch(tensors, analysis='stress', processes=None, chunk_size=None):
+    """
+    Run a batched analysis over a process pool with shared-memory buffers
+
+    Parameters:
+    tensors: (..., 3, 3) or (..., 6) array; leading axes are load cases
+             and points
+    analysis: 'stress', 'strain', 'deformation' or a module-level function
+              mapping (n, 3, 3) / (n, 6) arrays to a dictionary, possibly
+              nested, of arrays with n rows, e.g. failure.evaluate_failure
+    processes: number of worker processes, defaults to the CPU count;
+               1 runs the analysis in the current process
+    chunk_size: tensors per task, see default_chunk_size()
+
+    Returns:
+    Dictionary of the analysis with the batch shape of the input in front
+    of every array
+    """
+    analyze = _resolve_analysis(analysis)
+    batch_shape, rows = _flatten(tensors)
+    n = len(rows)
+    processes = processes or os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = default_chunk_size(n, processes)
+
+    if processes == 1 or n <= chunk_size:
+        return _batch_rows(analyze(rows), batch_shape)
+
+    # One shared block per result array, shaped and typed like the
+    # results of a single row
+    layout = list(_leaves(_empty_rows(analyze(rows[:1]), 0)))
+    blocks = []
+    views = []
+    try:
+        input_block = shared_memory.SharedMemory(create=True,
+                                                 size=max(rows.nbytes, 1))
+        blocks.append(input_block)
+        np.ndarray(rows.shape, dtype=np.float64,
+                   buffer=input_block.buf)[:] = rows
+        output_specs = []
+        for path, empty in layout:
+            shape = (n,) + empty.shape[1:]
+            size = max(int(np.prod(shape)) * empty.itemsize, 1)
+            block = shared_memory.SharedMemory(create=True, size=size)
+            blocks.append(block)
+            views.append((path, np.ndarray(shape, dtype=empty.dtype,
+                                           buffer=block.buf)))
+            output_specs.append((path, (block.name, shape, empty.dtype.str)))
+
+        initargs = ((input_block.name, rows.shape, np.float64),
+                    output_specs, analyze)
+        with ProcessPoolExecutor(max_workers=processes,
+                                 initializer=_init_worker,
+                                 initargs=initargs) as pool:
+            futures = [pool.submit(_run_chunk, start,
+                                   min(start + chunk_size, n))
+                       for start in range(0, n, chunk_size)]
+            for future in futures:
+                future.result()
+        results = _nest((path, values.copy()) for path, values in views)
+    finally:
+        # Views into the blocks must be released before closing them
+        views = None
+        for block in blocks:
+            block.close()
+            block.unlink()
+    return _batch_rows(results, batch_shape)
+
+
+def run_threaded(tensors, analysis='stress', workers=None,
+                 chunk_size=DEFAULT_THREAD_CHUNK_SIZE):
+    """
+    Run a batched analysis in cache-sized chunks on a thread pool
+
+    Parameters:
+    tensors: (..., 3, 3) or (..., 6) array; leading axes are load cases
+             and points
+    analysis: 'stress', 'strain', 'deformation' or a function mapping
+              (n, 3, 3) / (n, 6) arrays to a dictionary, possibly nested,
+              of arrays with n rows, e.g. strain.analyze_strain_tensor
+    workers: number of threads, defaults to the CPU count; 1 runs the
+             chunks one after another in the calling thread
+    chunk_size: tensors per task
+
+    Returns:
+    Dictionary of the analysis with the batch shape of the input in front
+    of every array
+    """
+    analyze = _resolve_analysis(analysis)
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    batch_shape, rows = _flatten(tensors)
+    n = len(rows)
+    if n <= chunk_size:
+        return _batch_rows(analyze(rows), batch_shape)
+
+    first = analyze(rows[:chunk_size])
+    output = _empty_rows(first, n)
+    _store_rows(output, first, 0, chunk_size)
+
+    def run_chunk(start):
+        stop = min(start + chunk_size, n)
+        _store_rows(output, analyze(rows[start:stop]), start, stop)
+
+    starts = range(chunk_size, n, chunk_size)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for start in starts:
+            run_chunk(start)
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for _ in pool.map(run_chunk, starts):
+                pass
+    return _batch_rows(output, batch_shape)
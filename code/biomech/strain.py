@@ -0,0 +1,110 @@
+"""
+Strain analysis of displacement gradients
+
+Batched versions of the strain calculations in ex3.1.2a.py (small
+strain) and ex3.2.a.py (finite strain). Every function takes a single
+3x3 tensor or a stack (..., 3, 3) and returns arrays with the batch shape
+of the input, so the exercise scripts and batch workers share one
+implementation without importing any plotting code.
+"""
+
+import numpy as np
+
+from .invariants import stress_invariants
+from .kinematics import Kinematics
+from .principal import principal_frame
+
+
+def displacement_gradient_to_strain(displacement_gradient):
+    """
+    Small strain tensor ε = 0.5 * (∇u + (∇u)ᵀ)
+
+    Parameters:
+    displacement_gradient: (..., 3, 3) array ∇u
+
+    Returns:
+    (..., 3, 3) strain tensors
+    """
+    grad_u = np.asarray(displacement_gradient, dtype=float)
+    return 0.5 * (grad_u + np.swapaxes(grad_u, -1, -2))
+
+
+def _engineering_strains(strain):
+    """Normal strains (11, 22, 33) and shear strains γ = 2ε (12, 23, 13)"""
+    normal = np.diagonal(strain, axis1=-2, axis2=-1)
+    shear = 2 * np.stack([strain[..., 0, 1], strain[..., 1, 2],
+                          strain[..., 0, 2]], axis=-1)
+    return normal, shear
+
+
+def analyze_strain_tensor(strain_tensor):
+    """
+    Principal strains, invariants and engineering strains
+
+    Parameters:
+    strain_tensor: (..., 3, 3) symmetric strain tensors
+
+    Returns:
+    Dictionary with the batch shape of the input:
+    'strain_tensor', 'principal_strains' (..., 3), 'principal_directions'
+    (..., 3, 3) as columns, 'invariants' {'I1', 'I2', 'I3'},
+    'volumetric_strain', 'deviatoric_strain', 'engineering_strains'
+    (..., 3), 'shear_strains' (..., 3) ordered (12, 23, 13) and
+    'max_shear_strain'
+    """
+    strain_tensor = np.asarray(strain_tensor, dtype=float)
+    principal_strains, principal_directions = principal_frame(strain_tensor)
+    I1, I2, I3 = stress_invariants(strain_tensor)
+
+    volumetric_strain = I1 / 3
+    deviatoric_strain = (strain_tensor
+                         - volumetric_strain[..., None, None] * np.eye(3))
+    engineering_strains, shear_strains = _engineering_strains(strain_tensor)
+
+    return {
+        'strain_tensor': strain_tensor,
+        'principal_strains': principal_strains,
+        'principal_directions': principal_directions,
+        'invariants': {'I1': I1, 'I2': I2, 'I3': I3},
+        'volumetric_strain': volumetric_strain,
+        'deviatoric_strain': deviatoric_strain,
+        'engineering_strains': engineering_strains,
+        'shear_strains': shear_strains,
+        'max_shear_strain': 0.5 * (principal_strains[..., 0]
+                                   - principal_strains[..., 2]),
+    }
+
+
+def analyze_deformation_measures(displacement_gradient):
+    """
+    Finite-strain measures of a displacement gradient H = ∂u/∂X
+
+    Parameters:
+    displacement_gradient: (..., 3, 3) array H
+
+    Returns:
+    Dictionary with the batch shape of the input:
+    'displacement_gradient', 'green_lagrange_strain' E, 'almansi_strain'
+    e, 'principal_strains' (..., 3) and 'principal_directions' of E,
+    'strain_invariants' (..., 3) as (I1, I2, I3) of E, and
+    'engineering_strains' {'normal', 'shear', 'max_shear'} with the shear
+    strains ordered (12, 23, 13) and max_shear = E₁ - E₃
+    """
+    kinematics = Kinematics.from_displacement_gradient(displacement_gradient)
+    E = kinematics.E
+    principal_strains, principal_directions = principal_frame(E)
+    normal, shear = _engineering_strains(E)
+
+    return {
+        'displacement_gradient': kinematics.F - np.eye(3),
+        'green_lagrange_strain': E,
+        'almansi_strain': kinematics.e,
+        'principal_strains': principal_strains,
+        'principal_directions': principal_directions,
+        'strain_invariants': np.stack(stress_invariants(E), axis=-1),
+        'engineering_strains': {
+            'normal': normal,
+            'shear': shear,
+            'max_shear': principal_strains[..., 0] - principal_strains[..., 2],
+        },
+    }
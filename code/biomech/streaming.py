@@ -0,0 +1,466 @@
+"""
+Streaming post-processing of large tensor result files
+
+Reads stress or displacement-gradient tensors from disk in fixed-size
+chunks, runs the batched analyses on each chunk and appends the results
+to the output file, so peak memory is set by the chunk size and not by
+the size of the input.
+
+Supported inputs (one tensor per row):
+- .csv:       9 columns (row-major 3x3) or 6 columns (Voigt)
+- .npy:       (N, 3, 3) or (N, 6), read through a memory map
+- .h5/.hdf5:  chunked dataset of the same shapes (requires h5py)
+
+Voigt input is only accepted for stresses; displacement gradients are not
+symmetric and need all 9 components.
+
+Supported outputs: .csv, .jsonl (one JSON object per tensor), .npy
+(structured array) and .h5/.hdf5. All outputs keep full float64
+precision.
+
+The same pipeline is available from the command line:
+
+    python -m biomech stress stresses.npy results.jsonl --quiet
+"""
+
+import itertools
+import json
+import os
+import struct
+
+import numpy as np
+
+from .failure import von_mises
+from .invariants import stress_invariants, tensor_to_voigt
+from .kinematics import Kinematics
+from .principal import principal_values
+from .strain import displacement_gradient_to_strain
+
+DEFAULT_CHUNK_SIZE = 100_000
+
+_HDF5_SUFFIXES = (".h5", ".hdf5")
+
+
+def _suffix(path):
+    return os.path.splitext(str(path))[1].lower()
+
+
+def _import_h5py():
+    try:
+        import h5py
+    except ImportError as error:
+        raise ImportError("HDF5 files require the optional h5py package") \
+            from error
+    return h5py
+
+
+def _rows_to_tensors(rows):
+    """Reshape (n, 9) rows to (n, 3, 3); (n, 6) Voigt rows pass through"""
+    rows = np.asarray(rows, dtype=float)
+    if rows.ndim == 1:
+        rows = rows[np.newaxis, :]
+    if rows.shape[-1] == 9:
+        return rows.reshape(-1, 3, 3)
+    if rows.shape[-1] == 6 or rows.shape[-2:] == (3, 3):
+        return rows
+    raise ValueError(f"Expected 9 or 6 components per tensor, got {rows.shape}")
+
+
+# =============================================================================
+# Readers
+# =============================================================================
+
+def _csv_rows(path, chunk_size, delimiter=","):
+    with open(path) as handle:
+        lines = (line for line in handle
+                 if line.strip() and not line.lstrip().startswith("#"))
+        while True:
+            block = list(itertools.islice(lines, chunk_size))
+            if not block:
+                return
+            yield np.loadtxt(block, delimiter=delimiter, ndmin=2)
+
+
+def _npy_rows(path, chunk_size):
+    data = np.load(path, mmap_mode="r")
+    for start in range(0, len(data), chunk_size):
+        yield data[start:start + chunk_size]
+
+
+def _hdf5_rows(path, chunk_size, dataset):
+    h5py = _import_h5py()
+    with h5py.File(path, "r") as handle:
+        data = handle[dataset]
+        for start in range(0, data.shape[0], chunk_size):
+            yield data[start:start + chunk_size]
+
+
+def iter_csv_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE, delimiter=","):
+    """Yield tensor chunks from a CSV file; lines starting with # are skipped"""
+    for rows in _csv_rows(path, chunk_size, delimiter):
+        yield _rows_to_tensors(rows)
+
+
+def iter_npy_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Yield tensor chunks from a .npy file through a read-only memory map"""
+    for rows in _npy_rows(path, chunk_size):
+        yield _rows_to_tensors(rows)
+
+
+def iter_hdf5_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE, dataset="tensors"):
+    """Yield tensor chunks from a dataset in an HDF5 file"""
+    for rows in _hdf5_rows(path, chunk_size, dataset):
+        yield _rows_to_tensors(rows)
+
+
+def iter_tensor_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE, dataset="tensors"):
+    """
+    Yield chunks of tensors from a result file, picking the reader by suffix
+
+    Parameters:
+    path: input file (.csv, .npy, .h5 or .hdf5)
+    chunk_size: maximum number of tensors per chunk
+    dataset: dataset name for HDF5 input
+
+    Returns:
+    generator of (n, 3, 3) or (n, 6) float arrays with n <= chunk_size
+    """
+    suffix = _suffix(path)
+    if suffix == ".csv":
+        return iter_csv_chunks(path, chunk_size)
+    if suffix == ".npy":
+        return iter_npy_chunks(path, chunk_size)
+    if suffix in _HDF5_SUFFIXES:
+        return iter_hdf5_chunks(path, chunk_size, dataset)
+    raise ValueError(f"Unsupported input format: {path}")
+
+
+def iter_row_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE, dataset="rows"):
+    """
+    Yield chunks of plain table rows, (n, k) float arrays, from a file
+
+    Same formats as iter_tensor_chunks(), without the tensor reshaping.
+    """
+    suffix = _suffix(path)
+    if suffix == ".csv":
+        rows = _csv_rows(path, chunk_size)
+    elif suffix == ".npy":
+        rows = _npy_rows(path, chunk_size)
+    elif suffix in _HDF5_SUFFIXES:
+        rows = _hdf5_rows(path, chunk_size, dataset)
+    else:
+        raise ValueError(f"Unsupported input format: {path}")
+    return (np.asarray(chunk, dtype=float).reshape(len(chunk), -1)
+            for chunk in rows)
+
+
+# =============================================================================
+# Chunk analyses
+# =============================================================================
+
+def _as_gradients(displacement_gradients):
+    """(n, 3, 3) gradients from (n, 3, 3) or (n, 9) input"""
+    gradients = np.asarray(displacement_gradients, dtype=float)
+    if gradients.ndim == 2 and gradients.shape[-1] == 9:
+        return gradients.reshape(-1, 3, 3)
+    if gradients.shape[-2:] != (3, 3):
+        raise ValueError(f"Displacement gradients need all 9 components, "
+                         f"(n, 3, 3) or 9 columns per row, got shape "
+                         f"{gradients.shape}; 6-column Voigt input is only "
+                         f"valid for stresses")
+    return gradients
+
+
+def stress_analysis(stresses):
+    """
+    Invariants, principal stresses and maximum shear (as in ex2.1.3.py)
+
+    Parameters:
+    stresses: (n, 3, 3) or (n, 6) array
+
+    Returns:
+    Dictionary of (n,) result columns
+    """
+    I1, I2, I3 = stress_invariants(stresses)
+    principal = principal_values(stresses)
+    return {
+        'I1': I1,
+        'I2': I2,
+        'I3': I3,
+        'sigma1': principal[:, 0],
+        'sigma2': principal[:, 1],
+        'sigma3': principal[:, 2],
+        'tau_max': 0.5 * (principal[:, 0] - principal[:, 2]),
+        'von_mises': von_mises(stresses),
+    }
+
+
+def strain_analysis(displacement_gradients):
+    """
+    Small-strain analysis of displacement gradients (as in ex3.1.2a.py)
+
+    Parameters:
+    displacement_gradients: (n, 3, 3) or (n, 9) array ∇u
+
+    Returns:
+    Dictionary of (n,) result columns
+    """
+    gradients = _as_gradients(displacement_gradients)
+    strain = tensor_to_voigt(displacement_gradient_to_strain(gradients))
+    I1, I2, I3 = stress_invariants(strain)
+    principal = principal_values(strain)
+    return {
+        'eps_11': strain[:, 0],
+        'eps_22': strain[:, 1],
+        'eps_33': strain[:, 2],
+        'gamma_12': 2 * strain[:, 5],
+        'gamma_23': 2 * strain[:, 3],
+        'gamma_13': 2 * strain[:, 4],
+        'eps1': principal[:, 0],
+        'eps2': principal[:, 1],
+        'eps3': principal[:, 2],
+        'I1': I1,
+        'I2': I2,
+        'I3': I3,
+        'volumetric_strain': I1 / 3,
+        'max_shear_strain': 0.5 * (principal[:, 0] - principal[:, 2]),
+    }
+
+
+def deformation_analysis(displacement_gradients):
+    """
+    Finite-strain analysis of displacement gradients (as in ex3.2.a.py)
+
+    Green-Lagrange strain E with shear strains γ = 2E, principal strains,
+    invariants, maximum shear strain E₁ - E₃ and volume ratio J.
+
+    Parameters:
+    displacement_gradients: (n, 3, 3) or (n, 9) array H = ∂u/∂X
+
+    Returns:
+    Dictionary of (n,) result columns
+    """
+    kinematics = Kinematics.from_displacement_gradient(
+        _as_gradients(displacement_gradients))
+    strain = tensor_to_voigt(kinematics.E)
+    I1, I2, I3 = stress_invariants(strain)
+    principal = principal_values(strain)
+    return {
+        'E_11': strain[:, 0],
+        'E_22': strain[:, 1],
+        'E_33': strain[:, 2],
+        'gamma_12': 2 * strain[:, 5],
+        'gamma_23': 2 * strain[:, 3],
+        'gamma_13': 2 * strain[:, 4],
+        'E1': principal[:, 0],
+        'E2': principal[:, 1],
+        'E3': principal[:, 2],
+        'I1': I1,
+        'I2': I2,
+        'I3': I3,
+        'max_shear_strain': principal[:, 0] - principal[:, 2],
+        'J': kinematics.J,
+    }
+
+
+ANALYSES = {
+    'deformation': deformation_analysis,
+    'stress': stress_analysis,
+    'strain': strain_analysis,
+}
+
+
+# =============================================================================
+# Writers
+# =============================================================================
+
+class CsvResultWriter:
+    """Append result columns to a CSV file, writing the header once"""
+
+    def __init__(self, path, fmt="%.17g"):
+        self.handle = open(path, "w")
+        self.fmt = fmt
+        self.columns = None
+
+    def write(self, results):
+        if self.columns is None:
+            self.columns = list(results)
+            self.handle.write(",".join(self.columns) + "\n")
+        table = np.column_stack([results[name] for name in self.columns])
+        np.savetxt(self.handle, table, fmt=self.fmt, delimiter=",")
+
+    def close(self):
+        self.handle.close()
+
+
+class JsonlResultWriter:
+    """
+    Append results as JSON Lines, one object per tensor
+
+    Floats are written with the shortest repr that round-trips exactly;
+    NaN and infinity are written as null. Rows are formatted through one
+    %-template per file rather than json.dumps() per value.
+    """
+
+    def __init__(self, path):
+        self.handle = open(path, "w")
+        self.columns = None
+        self.template = None
+
+    def write(self, results):
+        if self.columns is None:
+            self.columns = list(results)
+            self.template = "{" + ", ".join(
+                json.dumps(name).replace("%", "%%") + ": %r"
+                for name in self.columns) + "}\n"
+        table = np.column_stack([results[name] for name in self.columns])
+        template = self.template
+        if np.isfinite(table).all():
+            self.handle.write("".join(template % tuple(row)
+                                      for row in table.tolist()))
+            return
+        for row, finite in zip(table.tolist(), np.isfinite(table)):
+            values = [value if ok else None
+                      for value, ok in zip(row, finite)]
+            self.handle.write(json.dumps(dict(zip(self.columns, values)))
+                              + "\n")
+
+    def close(self):
+        self.handle.close()
+
+
+class NpyResultWriter:
+    """
+    Append rows of a structured array to a .npy file
+
+    The header is written with a fixed-width placeholder for the row count
+    and patched on close, so the data can be streamed without knowing the
+    final length in advance.
+    """
+
+    _ALIGNMENT = 64
+
+    def __init__(self, path, dtype=np.float64):
+        self.handle = open(path, "wb")
+        self.value_dtype = np.dtype(dtype)
+        self.dtype = None
+        self.count = 0
+        self.header_size = None
+
+    def _write_header(self):
+        header = ("{'descr': %r, 'fortran_order': False, 'shape': (%20d,), }"
+                  % (np.lib.format.dtype_to_descr(self.dtype), self.count))
+        prefix = b"\x93NUMPY\x01\x00"
+        if self.header_size is None:
+            # Sized once for the column names; the count has fixed width
+            needed = len(prefix) + 2 + len(header) + 1
+            self.header_size = -(-needed // self._ALIGNMENT) * self._ALIGNMENT
+        length = self.header_size - len(prefix) - 2
+        if length > 0xFFFF:
+            raise ValueError("Too many result columns for the .npy header")
+        header = header.ljust(length - 1) + "\n"
+        self.handle.seek(0)
+        self.handle.write(prefix + struct.pack("<H", length)
+                          + header.encode("latin1"))
+
+    def write(self, results):
+        if self.dtype is None:
+            self.dtype = np.dtype([(name, self.value_dtype) for name in results])
+            self._write_header()
+        n = len(next(iter(results.values())))
+        rows = np.empty(n, dtype=self.dtype)
+        for name in self.dtype.names:
+            rows[name] = results[name]
+        self.handle.seek(0, os.SEEK_END)
+        self.handle.write(rows.tobytes())
+        self.count += n
+
+    def close(self):
+        if self.dtype is None:
+            # Nothing written: leave a valid, empty array
+            self.dtype = self.value_dtype
+        self._write_header()
+        self.handle.close()
+
+
+class Hdf5ResultWriter:
+    """Append result columns to resizable datasets in an HDF5 file"""
+
+    def __init__(self, path, chunk_size=DEFAULT_CHUNK_SIZE):
+        h5py = _import_h5py()
+        self.handle = h5py.File(path, "w")
+        self.chunk_size = chunk_size
+        self.count = 0
+
+    def write(self, results):
+        n = len(next(iter(results.values())))
+        for name, values in results.items():
+            if name not in self.handle:
+                self.handle.create_dataset(
+                    name, shape=(0,), maxshape=(None,), dtype=np.float64,
+                    chunks=(min(self.chunk_size, max(n, 1)),))
+            data = self.handle[name]
+            data.resize((self.count + n,))
+            data[self.count:] = values
+        self.count += n
+
+    def close(self):
+        self.handle.close()
+
+
+def open_result_writer(path):
+    """Create a result writer for the output path, picked by suffix"""
+    suffix = _suffix(path)
+    if suffix == ".csv":
+        return CsvResultWriter(path)
+    if suffix == ".jsonl":
+        return JsonlResultWriter(path)
+    if suffix == ".npy":
+        return NpyResultWriter(path)
+    if suffix in _HDF5_SUFFIXES:
+        return Hdf5ResultWriter(path)
+    raise ValueError(f"Unsupported output format: {path}")
+
+
+# =============================================================================
+# Pipeline
+# =============================================================================
+
+def process_file(input_path, output_path, analysis="stress",
+                 chunk_size=DEFAULT_CHUNK_SIZE, dataset="tensors",
+                 progress=None):
+    """
+    Stream a tensor file through an analysis and write results incrementally
+
+    Parameters:
+    input_path: tensor file (.csv, .npy, .h5 or .hdf5)
+    output_path: result file (.csv, .jsonl, .npy, .h5 or .hdf5)
+    analysis: 'stress', 'strain' or 'deformation'
+    chunk_size: number of tensors held in memory at a time
+    dataset: dataset name for HDF5 input
+    progress: optional callable, called with the running tensor count
+              after each chunk
+
+    Returns:
+    Number of tensors processed
+    """
+    try:
+        analyze = ANALYSES[analysis]
+    except KeyError:
+        raise ValueError(f"Unknown analysis '{analysis}', "
+                         f"expected one of {sorted(ANALYSES)}") from None
+
+    writer = open_result_writer(output_path)
+    count = 0
+    try:
+        for chunk in iter_tensor_chunks(input_path, chunk_size, dataset):
+            writer.write(analyze(chunk))
+            count += len(chunk)
+            if progress is not None:
+                progress(count)
+        if count == 0:
+            # Empty input still gets the header / column layout
+            writer.write(analyze(np.empty((0, 3, 3))))
+    finally:
+        writer.close()
+    return count
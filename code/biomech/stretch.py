@@ -0,0 +1,98 @@
+"""
+Directional stretch λ(n) = |F n| for batches of F and directions
+
+λ(n)² = n · C n, so the stretch in any number of directions follows from
+C = FᵀF with one contraction. The extreme stretches are the square roots
+of the largest and smallest eigenvalues of C, attained along the
+corresponding eigenvectors, so they are found exactly instead of by
+sampling.
+"""
+
+import numpy as np
+
+from .polar import principal_stretches, right_cauchy_green
+from .principal import principal_frame
+
+
+def circle_directions(n, endpoint=False):
+    """
+    Unit directions in the plane, evenly spaced in angle over [0, 2π)
+
+    Returns:
+    theta: (n,) angles in radians
+    directions: (n, 2) unit vectors
+    """
+    theta = np.linspace(0, 2*np.pi, n, endpoint=endpoint)
+    return theta, np.column_stack([np.cos(theta), np.sin(theta)])
+
+
+def fibonacci_sphere(n):
+    """
+    Nearly uniform unit directions on the sphere from a Fibonacci lattice
+
+    Returns:
+    (n, 3) array of unit vectors
+    """
+    k = np.arange(n) + 0.5
+    z = 1 - 2 * k / n
+    radius = np.sqrt(1 - z*z)
+    azimuth = np.pi * (3 - np.sqrt(5)) * k
+    return np.column_stack([radius * np.cos(azimuth),
+                            radius * np.sin(azimuth), z])
+
+
+def directional_stretch(F, directions):
+    """
+    Stretch λ = |F n| / |n| for every F and every direction
+
+    Parameters:
+    F: (..., d, d) deformation gradients, d = 2 or 3
+    directions: (K, d) reference directions, not necessarily unit length
+
+    Returns:
+    (..., K) array of stretches
+    """
+    directions = np.asarray(directions, dtype=float)
+    C = right_cauchy_green(np.asarray(F, dtype=float))
+    squared = np.einsum('ki,...ij,kj->...k', directions, C, directions)
+    return np.sqrt(squared / np.einsum('ki,ki->k', directions, directions))
+
+
+def stretch_extrema(F):
+    """
+    Exact maximum and minimum stretch with their reference directions
+
+    Parameters:
+    F: (..., d, d) deformation gradients, d = 2 or 3
+
+    Returns:
+    Dictionary with
+    'max_stretch', 'min_stretch': (...) arrays
+    'max_direction', 'min_direction': (..., d) unit vectors, defined up to sign
+    'max_angle', 'min_angle': (...) angles in [0, π) with the X1 axis (2D only)
+    """
+    C = right_cauchy_green(np.asarray(F, dtype=float))
+    stretches = principal_stretches(C)
+
+    if C.shape[-1] == 2:
+        phi = 0.5 * np.arctan2(2 * C[..., 0, 1], C[..., 0, 0] - C[..., 1, 1])
+        max_angle = np.mod(phi, np.pi)
+        min_angle = np.mod(phi + np.pi/2, np.pi)
+        return {
+            'max_stretch': stretches[..., 0],
+            'min_stretch': stretches[..., -1],
+            'max_direction': np.stack([np.cos(max_angle), np.sin(max_angle)],
+                                      axis=-1),
+            'min_direction': np.stack([np.cos(min_angle), np.sin(min_angle)],
+                                      axis=-1),
+            'max_angle': max_angle,
+            'min_angle': min_angle,
+        }
+
+    _, N = principal_frame(C)
+    return {
+        'max_stretch': stretches[..., 0],
+        'min_stretch': stretches[..., -1],
+        'max_direction': N[..., :, 0],
+        'min_direction': N[..., :, -1],
+    }
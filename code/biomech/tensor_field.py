@@ -0,0 +1,231 @@
+"""
+Memory-mapped storage for symmetric tensor fields
+
+A tensor field file holds N symmetric tensors in Voigt form (N, 6),
+preceded by a fixed-size header:
+
+    bytes 0-7      magic b"\\x93TKTFLD"
+    bytes 8-4095   JSON header padded with spaces, e.g.
+                   {"version": 1, "dtype": "<f4", "count": N,
+                    "components": ["11", "22", "33", "23", "13", "12"],
+                    "quantity": "stress", "units": "MPa"}
+    bytes 4096-    raw little-endian float32/float64 data, row-major
+
+The data block starts on a page boundary, so it is opened with np.memmap
+and chunks of the field are zero-copy views. Results computed from a field
+are written to sibling .npy memory maps (femur.tfld -> femur.von_mises.npy),
+which lets fields far larger than RAM be post-processed chunk by chunk.
+"""
+
+import json
+import os
+
+import numpy as np
+
+from .invariants import VOIGT_ORDER, as_voigt
+from .streaming import DEFAULT_CHUNK_SIZE
+
+MAGIC = b"\x93TKTFLD"
+HEADER_SIZE = 4096
+FORMAT_VERSION = 1
+
+
+def _write_header(path, header):
+    text = json.dumps(header).encode("ascii")
+    if len(MAGIC) + len(text) + 1 > HEADER_SIZE:
+        raise ValueError("Tensor field header is too large")
+    padding = HEADER_SIZE - len(MAGIC) - len(text) - 1
+    with open(path, "wb") as handle:
+        handle.write(MAGIC + text + b" " * padding + b"\n")
+
+
+def _read_header(path):
+    with open(path, "rb") as handle:
+        block = handle.read(HEADER_SIZE)
+    if not block.startswith(MAGIC) or len(block) != HEADER_SIZE:
+        raise ValueError(f"{path} is not a tensor field file")
+    header = json.loads(block[len(MAGIC):].decode("ascii"))
+    if header.get("version") != FORMAT_VERSION:
+        raise ValueError(f"Unsupported tensor field version in {path}: "
+                         f"{header.get('version')}")
+    return header
+
+
+class TensorField:
+    """
+    A symmetric tensor field backed by a memory-mapped file
+
+    Use create_tensor_field() or open_tensor_field() rather than the
+    constructor.
+
+    Attributes:
+    path: file path
+    header: dictionary with dtype, count, components, quantity and units
+    data: (N, 6) np.memmap over the Voigt components
+    """
+
+    def __init__(self, path, header, mode):
+        self.path = str(path)
+        self.header = header
+        self.data = np.memmap(self.path, dtype=np.dtype(header["dtype"]),
+                              mode=mode, offset=HEADER_SIZE,
+                              shape=(header["count"], 6))
+
+    def __len__(self):
+        return self.header["count"]
+
+    @property
+    def units(self):
+        return self.header["units"]
+
+    @property
+    def quantity(self):
+        return self.header["quantity"]
+
+    @property
+    def components(self):
+        return tuple(self.header["components"])
+
+    def voigt(self, start=0, stop=None):
+        """
+        Voigt rows [start, stop) in VOIGT_ORDER
+
+        This is a zero-copy view when the file uses the standard component
+        order, and a reordered copy otherwise.
+        """
+        rows = self.data[start:stop]
+        if self.components == VOIGT_ORDER:
+            return rows
+        order = [self.components.index(name) for name in VOIGT_ORDER]
+        return rows[:, order]
+
+    def chunks(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Yield (start, stop, view) for consecutive chunks of the field"""
+        for start in range(0, len(self), chunk_size):
+            stop = min(start + chunk_size, len(self))
+            yield start, stop, self.voigt(start, stop)
+
+    def result_path(self, name):
+        """Path of the sibling result array called name"""
+        stem = os.path.splitext(self.path)[0]
+        return f"{stem}.{name}.npy"
+
+    def create_result(self, name, trailing_shape=(), dtype=None):
+        """
+        Create a sibling .npy memory map with one row per tensor
+
+        Parameters:
+        name: result name, used in the file name
+        trailing_shape: shape of each row, () for scalar results
+        dtype: defaults to the field dtype
+
+        Returns:
+        writable np.memmap of shape (N,) + trailing_shape
+        """
+        dtype = self.data.dtype if dtype is None else dtype
+        return np.lib.format.open_memmap(
+            self.result_path(name), mode="w+", dtype=dtype,
+            shape=(len(self),) + tuple(trailing_shape))
+
+    def open_result(self, name, mode="r"):
+        """Open an existing sibling result array as a memory map"""
+        return np.load(self.result_path(name), mmap_mode=mode)
+
+    def apply(self, kernel, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Run a batched kernel over the field and store its results on disk
+
+        The kernel gets (n, 6) Voigt views and returns a dictionary of
+        (n, ...) arrays, e.g. streaming.stress_analysis. Every key becomes
+        a sibling memory-mapped array filled chunk by chunk.
+
+        Returns:
+        Dictionary of the result memory maps
+        """
+        results = {}
+        for start, stop, view in self.chunks(chunk_size):
+            for name, values in kernel(view).items():
+                values = np.asarray(values)
+                if name not in results:
+                    results[name] = self.create_result(name, values.shape[1:])
+                results[name][start:stop] = values
+        for values in results.values():
+            values.flush()
+        return results
+
+    def flush(self):
+        if isinstance(self.data, np.memmap) and self.data.mode != "r":
+            self.data.flush()
+
+
+def create_tensor_field(path, count, dtype=np.float32, quantity="stress",
+                        units="MPa", components=VOIGT_ORDER):
+    """
+    Create a new tensor field file and open it for writing
+
+    Parameters:
+    path: output file, conventionally with suffix .tfld
+    count: number of tensors N
+    dtype: np.float32 or np.float64
+    quantity: free-text description, e.g. 'stress' or 'strain'
+    units: units of the components, e.g. 'MPa' or '-'
+    components: Voigt component order stored in the file
+
+    Returns:
+    TensorField with a writable (N, 6) memory map
+    """
+    dtype = np.dtype(dtype)
+    if dtype not in (np.dtype(np.float32), np.dtype(np.float64)):
+        raise ValueError(f"Tensor fields are float32 or float64, not {dtype}")
+    components = [str(name) for name in components]
+    if sorted(components) != sorted(VOIGT_ORDER):
+        raise ValueError(f"Components must be a permutation of {VOIGT_ORDER}")
+
+    header = {
+        "version": FORMAT_VERSION,
+        "dtype": dtype.newbyteorder("<").str,
+        "count": int(count),
+        "components": components,
+        "quantity": quantity,
+        "units": units,
+    }
+    _write_header(path, header)
+    with open(path, "r+b") as handle:
+        handle.truncate(HEADER_SIZE + int(count) * 6 * dtype.itemsize)
+    return TensorField(path, header, mode="r+")
+
+
+def open_tensor_field(path, mode="r"):
+    """
+    Open an existing tensor field file
+
+    Parameters:
+    path: tensor field file
+    mode: 'r' for read-only or 'r+' for in-place updates
+
+    Returns:
+    TensorField
+    """
+    return TensorField(path, _read_header(path), mode=mode)
+
+
+def write_tensor_field(path, tensors, chunk_size=DEFAULT_CHUNK_SIZE, **kwargs):
+    """
+    Copy a tensor array into a new field file, chunk by chunk
+
+    Parameters:
+    path: output file
+    tensors: (N, 3, 3) or (N, 6) array, e.g. a memory-mapped .npy file
+    chunk_size: rows copied at a time
+    kwargs: passed to create_tensor_field (dtype, quantity, units, ...)
+
+    Returns:
+    TensorField opened for writing
+    """
+    field = create_tensor_field(path, len(tensors), **kwargs)
+    order = [VOIGT_ORDER.index(name) for name in field.components]
+    for start in range(0, len(tensors), chunk_size):
+        stop = start + chunk_size
+        field.data[start:stop] = as_voigt(tensors[start:stop])[:, order]
+    field.flush()
+    return field
@@ -0,0 +1,241 @@
+"""
+Tractions, normal and shear stress on batches of planes
+
+For a stress tensor T and a unit plane normal n
+
+    t = T n,    σ_n = n · t,    τ_n = |t - σ_n n|
+
+τ_n is the length of the in-plane part of the traction. The shorter
+τ_n² = n · T² n - σ_n² subtracts two nearly equal numbers close to the
+principal planes and leaves a noise floor of about √eps |T|, so it is not
+used. For a block of tensors the tractions on all K normals are one
+(3·rows, 3) @ (3, K) matrix product; the blocks are small enough to keep
+the temporaries in cache. For large normal sets the K planes are
+processed in chunks so memory stays at O(M · chunk_size).
+
+The critical plane search evaluates a criterion on every candidate normal
+and keeps the running maximum per tensor:
+
+    'normal'   σ_n
+    'shear'    τ_n
+    'findley'  τ_n + k σ_n
+
+The maxima of σ_n and τ_n are known in closed form from the principal
+frame, n = n₁ with σ_n = σ₁ and n = (n₁ ± n₃)/√2 with τ_n = (σ₁ - σ₃)/2,
+so the grid search is only needed for Findley or for a given set of
+candidate normals.
+"""
+
+import numpy as np
+
+from .invariants import voigt_to_tensor
+from .principal import principal_frame
+from .stretch import fibonacci_sphere
+
+DEFAULT_PLANE_CHUNK = 1024
+# σ_n, τ_n values evaluated per block of tensors in _normal_shear
+_BLOCK_SIZE = 2**15
+CRITERIA = ('normal', 'shear', 'findley')
+
+
+def _as_tensors(stresses):
+    stresses = np.asarray(stresses, dtype=float)
+    if stresses.shape[-1] == 6:
+        stresses = voigt_to_tensor(stresses)
+    return stresses
+
+
+def _unit_normals(normals):
+    normals = np.asarray(normals, dtype=float).reshape(-1, 3)
+    return normals / np.linalg.norm(normals, axis=-1, keepdims=True)
+
+
+def hemisphere_normals(n):
+    """
+    Nearly uniform plane normals on the upper hemisphere
+
+    n and -n describe the same plane, so only half the sphere is needed.
+
+    Returns:
+    (n, 3) array of unit vectors with n₃ > 0
+    """
+    return fibonacci_sphere(2 * n)[:n]
+
+
+def tractions(stresses, normals):
+    """
+    Traction vectors t = T n for every tensor and every normal
+
+    Parameters:
+    stresses: (..., 3, 3) or (..., 6) stress tensors
+    normals: (K, 3) plane normals, normalised internally
+
+    Returns:
+    (..., K, 3) array
+    """
+    return np.einsum('...ij,kj->...ki', _as_tensors(stresses),
+                     _unit_normals(normals))
+
+
+def _normal_shear(stresses, normals):
+    """σ_n and τ_n of (..., 3, 3) tensors on (k, 3) unit normals"""
+    n = normals.T
+    k = n.shape[1]
+    flat = stresses.reshape(-1, 3, 3)
+    sigma_n = np.empty((len(flat), k))
+    tau_n = np.empty((len(flat), k))
+
+    # Blocks of tensors keep the (rows, 3, k) tractions in cache
+    rows = max(1, _BLOCK_SIZE // max(k, 1))
+    for start in range(0, len(flat), rows):
+        block = slice(start, start + rows)
+        traction = (flat[block].reshape(-1, 3) @ n).reshape(-1, 3, k)
+        sigma, tau = sigma_n[block], tau_n[block]
+        np.multiply(traction[:, 0], n[0], out=sigma)
+        sigma += traction[:, 1] * n[1]
+        sigma += traction[:, 2] * n[2]
+        tau[...] = 0.0
+        for i in range(3):
+            shear = traction[:, i]
+            shear -= sigma * n[i]
+            shear *= shear
+            tau += shear
+        np.sqrt(tau, out=tau)
+
+    shape = stresses.shape[:-2] + (k,)
+    return sigma_n.reshape(shape), tau_n.reshape(shape)
+
+
+def iter_normal_shear(stresses, normals, chunk_size=DEFAULT_PLANE_CHUNK):
+    """
+    Yield (start, sigma_n, tau_n) for consecutive chunks of the normals
+
+    sigma_n and tau_n have shape (..., k) for the k normals starting at
+    index start.
+    """
+    stresses = _as_tensors(stresses)
+    normals = _unit_normals(normals)
+    for start in range(0, len(normals), chunk_size):
+        yield (start,) + _normal_shear(stresses,
+                                       normals[start:start + chunk_size])
+
+
+def normal_shear(stresses, normals, chunk_size=None):
+    """
+    Normal stress σ_n and shear magnitude τ_n on every plane
+
+    Parameters:
+    stresses: (..., 3, 3) or (..., 6) symmetric stress tensors
+    normals: (K, 3) plane normals, normalised internally
+    chunk_size: process the normals in chunks of this size; None
+                evaluates all K planes in one contraction
+
+    Returns:
+    sigma_n, tau_n: (..., K) arrays, tau_n ≥ 0
+    """
+    if chunk_size is None:
+        return _normal_shear(_as_tensors(stresses), _unit_normals(normals))
+
+    normals = _unit_normals(normals)
+    sigma_n = tau_n = None
+    for start, sigma, tau in iter_normal_shear(stresses, normals, chunk_size):
+        if sigma_n is None:
+            shape = sigma.shape[:-1] + (len(normals),)
+            sigma_n, tau_n = np.empty(shape), np.empty(shape)
+        sigma_n[..., start:start + sigma.shape[-1]] = sigma
+        tau_n[..., start:start + tau.shape[-1]] = tau
+    return sigma_n, tau_n
+
+
+def _criterion_value(sigma_n, tau_n, criterion, k):
+    if criterion == 'normal':
+        return sigma_n
+    if criterion == 'shear':
+        return tau_n
+    if criterion == 'findley':
+        return tau_n + k * sigma_n
+    raise ValueError(f"Unknown criterion '{criterion}', "
+                     f"expected one of {CRITERIA}")
+
+
+def _principal_plane(stresses, criterion):
+    """Exact critical plane of the 'normal' or 'shear' criterion"""
+    values, directions = principal_frame(stresses)
+    n1, n3 = directions[..., :, 0], directions[..., :, 2]
+    if criterion == 'normal':
+        normal = n1
+        sigma_n = values[..., 0]
+        tau_n = np.zeros_like(sigma_n)
+        value = sigma_n
+    else:
+        normal = (n1 + n3) / np.sqrt(2.0)
+        sigma_n = 0.5 * (values[..., 0] + values[..., 2])
+        tau_n = 0.5 * (values[..., 0] - values[..., 2])
+        value = tau_n
+    # Same half-space as hemisphere_normals(); n and -n are one plane
+    normal = normal * np.where(normal[..., 2:] < 0, -1.0, 1.0)
+    return {
+        'value': value,
+        'normal': normal,
+        'sigma_n': sigma_n,
+        'tau_n': tau_n,
+    }
+
+
+def critical_plane(stresses, criterion='findley', k=0.3, normals=None,
+                   n_planes=5000, chunk_size=DEFAULT_PLANE_CHUNK):
+    """
+    Search the plane that maximises a criterion for every stress tensor
+
+    Parameters:
+    stresses: (..., 3, 3) or (..., 6) symmetric stress tensors
+    criterion: 'normal', 'shear' or 'findley'
+    k: normal stress sensitivity of the Findley criterion
+    normals: (K, 3) candidate normals; by default 'normal' and 'shear'
+             are solved exactly from the principal frame and 'findley'
+             searches n_planes normals on the hemisphere
+    n_planes: number of default candidate normals for 'findley'; the
+              angular resolution is roughly 2 / sqrt(n_planes) radians
+    chunk_size: candidate normals evaluated per contraction
+
+    Returns:
+    Dictionary with
+    'value': (...) maximum criterion value
+    'normal': (..., 3) unit normal of the critical plane
+    'sigma_n', 'tau_n': (...) normal and shear stress on that plane
+    """
+    _criterion_value(0.0, 0.0, criterion, k)
+    stresses = _as_tensors(stresses)
+    if normals is None and criterion in ('normal', 'shear'):
+        return _principal_plane(stresses, criterion)
+    if normals is None:
+        normals = hemisphere_normals(n_planes)
+    normals = _unit_normals(normals)
+
+    shape = stresses.shape[:-2]
+    best = np.full(shape, -np.inf)
+    index = np.zeros(shape, dtype=np.intp)
+    best_sigma = np.zeros(shape)
+    best_tau = np.zeros(shape)
+
+    for start, sigma_n, tau_n in iter_normal_shear(stresses, normals,
+                                                   chunk_size):
+        value = _criterion_value(sigma_n, tau_n, criterion, k)
+        local = np.argmax(value, axis=-1)[..., None]
+        local_value = np.take_along_axis(value, local, axis=-1)[..., 0]
+        better = local_value > best
+        best = np.where(better, local_value, best)
+        index = np.where(better, start + local[..., 0], index)
+        best_sigma = np.where(
+            better, np.take_along_axis(sigma_n, local, axis=-1)[..., 0],
+            best_sigma)
+        best_tau = np.where(
+            better, np.take_along_axis(tau_n, local, axis=-1)[..., 0],
+            best_tau)
+
+    return {
+        'value': best,
+        'normal': normals[index],
+        'sigma_n': best_sigma,
+        'tau_n': best_tau,
+    }
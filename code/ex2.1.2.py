@@ -1,11 +1,11 @@
 import numpy as np
 
+from biomech import stress_invariants
+
 T = np.array([[90, -30, 0], [-30, 120, -30], [0, -30, 90]])
 
 # Calculating the invariants
-I = np.trace(T)
-II = 0.5 * (I**2 - np.trace(np.dot(T, T)))
-III = np.linalg.det(T)
+I, II, III = stress_invariants(T)
 
 print("I={}".format(I))
 print("II={}".format(II))
@@ -13,6 +13,11 @@ This script performs comprehensive principal stress analysis including:
 import numpy as np
 import matplotlib.pyplot as plt
 
+from biomech import principal_frame, principal_values, stress_invariants
+from biomech.figure_templates import PrincipalDirectionsTemplate
+from biomech.rendering import finish_figure
+from biomech.traction import critical_plane, normal_shear
+
 # =============================================================================
 # SETUP - Define stress matrix and calculate invariants
 # =============================================================================
@@ -21,9 +26,7 @@ import matplotlib.pyplot as plt
 T = np.array([[90, -30, 0], [-30, 120, -30], [0, -30, 90]])
 
 # Calculate the stress invariants
-I1 = np.trace(T)
-I2 = 0.5 * (I1**2 - np.trace(np.dot(T, T)))
-I3 = np.linalg.det(T)
+I1, I2, I3 = stress_invariants(T)
 
 print("=" * 60)
 print("EXERCISE 2.1.3 - PRINCIPAL STRESS ANALYSIS")
@@ -56,10 +59,9 @@ polynomial_values = characteristic_polynomial(sigma_range)
 print("\nTASK 1.2.d) - Graphical determination of principal stresses")
 print("-" * 60)
 
-# Find the roots (principal stresses) using numpy
-coefficients = [1, -I1, I2, -I3]  # Coefficients for σ³ - I1*σ² + I2*σ - I3
-principal_stresses = np.roots(coefficients)
-principal_stresses = np.sort(principal_stresses)[::-1]  # Sort in descending order
+# Find the roots (principal stresses) of σ³ - I1*σ² + I2*σ - I3 using the
+# trigonometric closed form, already sorted in descending order
+principal_stresses = principal_values(T)
 
 print("Principal stresses from polynomial roots:")
 print(f"σ1 = {principal_stresses[0]:.1f} MPa")
@@ -96,7 +98,7 @@ plt.text(0.02, 0.98, textstr, transform=plt.gca().transAxes, fontsize=10,
          verticalalignment='top', bbox=props)
 
 plt.tight_layout()
-plt.show()
+finish_figure(plt.gcf(), 'ex2.1.3-plot.png')
 
 # =============================================================================
 # TASK 1.2.e) - Verify results using linear algebra
@@ -120,83 +122,21 @@ print(f"σ3 = {eigenvalues[2]:.1f} MPa")
 print("\nTASK 1.2.f) - Principal stresses and directions")
 print("-" * 60)
 
-# Use np.linalg.eig to get both eigenvalues and eigenvectors
-eigenvalues_eig, eigenvectors = np.linalg.eig(T)
-
-# Sort eigenvalues and eigenvectors in descending order
-sorted_indices = np.argsort(eigenvalues_eig)[::-1]
-eigenvalues_sorted = eigenvalues_eig[sorted_indices]
-eigenvectors_sorted = eigenvectors[:, sorted_indices]
+# Eigenvalues and a right-handed, sign-consistent set of eigenvectors,
+# sorted in descending order
+eigenvalues_sorted, eigenvectors_sorted = principal_frame(T)
 
-print("Principal stresses and directions using np.linalg.eig:")
+print("Principal stresses and directions using np.linalg.eigh:")
 for i in range(3):
     print(f"σ{i+1} = {eigenvalues_sorted[i]:.1f} MPa")
     n = eigenvectors_sorted[:, i]
     print(f"n{i+1} = [{n[0]:.3f}, {n[1]:.3f}, {n[2]:.3f}]")
     print()
 
-# Plot the principal direction vectors in 3D
-from mpl_toolkits.mplot3d import Axes3D
-
-# Create two 3D plots with different viewing angles
-fig1 = plt.figure(figsize=(12, 5))
-
-# First view
-ax1 = fig1.add_subplot(121, projection='3d')
-
-colors = ['red', 'blue', 'green']
-labels = ['n₁ (σ₁=150 MPa)', 'n₂ (σ₂=90 MPa)', 'n₃ (σ₃=60 MPa)']
-
-for i in range(3):
-    # Plot vector from origin to eigenvector
-    x_vals = [0, eigenvectors_sorted[0, i]]
-    y_vals = [0, eigenvectors_sorted[1, i]]
-    z_vals = [0, eigenvectors_sorted[2, i]]
-    
-    ax1.plot(x_vals, y_vals, z_vals,
-             color=colors[i], linewidth=3, marker='o',
-             markersize=8, label=labels[i])
-
-ax1.set_xlabel('x₁')
-ax1.set_ylabel('x₂')
-ax1.set_zlabel('x₃')
-ax1.set_title('Principal Directions - View 1')
-ax1.legend()
-ax1.grid(True)
-
-# Set equal aspect ratio
-max_range = 1.0
-ax1.set_xlim([-max_range, max_range])
-ax1.set_ylim([-max_range, max_range])
-ax1.set_zlim([-max_range, max_range])
-
-# Second view with different angle
-ax2 = fig1.add_subplot(122, projection='3d')
-
-for i in range(3):
-    x_vals = [0, eigenvectors_sorted[0, i]]
-    y_vals = [0, eigenvectors_sorted[1, i]]
-    z_vals = [0, eigenvectors_sorted[2, i]]
-    
-    ax2.plot(x_vals, y_vals, z_vals,
-             color=colors[i], linewidth=3, marker='o',
-             markersize=8, label=labels[i])
-
-ax2.set_xlabel('x₁')
-ax2.set_ylabel('x₂')
-ax2.set_zlabel('x₃')
-ax2.set_title('Principal Directions - View 2')
-ax2.legend()
-ax2.grid(True)
-ax2.view_init(elev=30, azim=45)  # Different viewing angle
-
-# Set equal aspect ratio
-ax2.set_xlim([-max_range, max_range])
-ax2.set_ylim([-max_range, max_range])
-ax2.set_zlim([-max_range, max_range])
-
-plt.tight_layout()
-plt.show()
+# Plot the principal direction vectors in 3D from two viewing angles
+directions_plot = PrincipalDirectionsTemplate(views=(None, (30, 45)))
+directions_plot.update(eigenvalues_sorted, eigenvectors_sorted)
+finish_figure(directions_plot.fig, 'ex2.1.3-directions.png')
 
 # Check orthogonality of eigenvectors
 print("Verification of orthogonality:")
@@ -258,89 +198,15 @@ s2 = shear_direction_2
 print(f"Shear direction 2: [{s2[0]:.3f}, {s2[1]:.3f}, {s2[2]:.3f}]")
 
 # Create 3D plot showing principal directions and maximum shear orientations
-fig2 = plt.figure(figsize=(15, 6))
-
-# First view
-ax1 = fig2.add_subplot(121, projection='3d')
-
-# Plot principal directions
-colors = ['red', 'blue', 'green']
-labels = ['n₁ (σ₁=150 MPa)', 'n₂ (σ₂=90 MPa)', 'n₃ (σ₃=60 MPa)']
-
-for i in range(3):
-    x_vals = [0, eigenvectors_sorted[0, i]]
-    y_vals = [0, eigenvectors_sorted[1, i]]
-    z_vals = [0, eigenvectors_sorted[2, i]]
-    
-    ax1.plot(x_vals, y_vals, z_vals,
-             color=colors[i], linewidth=3, marker='o',
-             markersize=8, label=labels[i])
-
-# Plot maximum shear stress directions
-shear_colors = ['orange', 'purple']
-shear_labels = ['Max shear dir 1', 'Max shear dir 2']
-
-for i, direction in enumerate([shear_direction_1, shear_direction_2]):
-    x_vals = [0, direction[0]]
-    y_vals = [0, direction[1]]
-    z_vals = [0, direction[2]]
-    
-    ax1.plot(x_vals, y_vals, z_vals,
-             color=shear_colors[i], linewidth=2, marker='s',
-             markersize=6, linestyle='--', label=shear_labels[i])
-
-ax1.set_xlabel('x₁')
-ax1.set_ylabel('x₂')
-ax1.set_zlabel('x₃')
-ax1.set_title(f'Principal Directions and Max Shear Orientations\n'
-              f'τ_max = {tau_max:.1f} MPa')
-ax1.legend()
-ax1.grid(True)
-
-# Set equal aspect ratio
-max_range = 1.0
-ax1.set_xlim([-max_range, max_range])
-ax1.set_ylim([-max_range, max_range])
-ax1.set_zlim([-max_range, max_range])
-
-# Second view with different angle
-ax2 = fig2.add_subplot(122, projection='3d')
-
-# Plot principal directions
-for i in range(3):
-    x_vals = [0, eigenvectors_sorted[0, i]]
-    y_vals = [0, eigenvectors_sorted[1, i]]
-    z_vals = [0, eigenvectors_sorted[2, i]]
-    
-    ax2.plot(x_vals, y_vals, z_vals,
-             color=colors[i], linewidth=3, marker='o',
-             markersize=8, label=labels[i])
-
-# Plot maximum shear stress directions
-for i, direction in enumerate([shear_direction_1, shear_direction_2]):
-    x_vals = [0, direction[0]]
-    y_vals = [0, direction[1]]
-    z_vals = [0, direction[2]]
-    
-    ax2.plot(x_vals, y_vals, z_vals,
-             color=shear_colors[i], linewidth=2, marker='s',
-             markersize=6, linestyle='--', label=shear_labels[i])
-
-ax2.set_xlabel('x₁')
-ax2.set_ylabel('x₂')
-ax2.set_zlabel('x₃')
-ax2.set_title('Different Viewing Angle')
-ax2.legend()
-ax2.grid(True)
-ax2.view_init(elev=20, azim=60)  # Different viewing angle
-
-# Set equal aspect ratio
-ax2.set_xlim([-max_range, max_range])
-ax2.set_ylim([-max_range, max_range])
-ax2.set_zlim([-max_range, max_range])
-
-plt.tight_layout()
-plt.show()
+shear_plot = PrincipalDirectionsTemplate(
+    views=(None, (20, 60)),
+    titles=['Principal Directions and Max Shear Orientations\n'
+            'τ_max = {tau_max:.1f} MPa',
+            'Different Viewing Angle'],
+    show_shear=True,
+    figsize=(15, 6))
+shear_plot.update(eigenvalues_sorted, eigenvectors_sorted)
+finish_figure(shear_plot.fig, 'ex2.1.3-shear.png')
 
 # =============================================================================
 # VERIFICATION AND SUMMARY
@@ -353,6 +219,16 @@ print("In 3D, the maximum shear stress is: τ_max = (σ_max - σ_min)/2")
 print("This occurs on planes that are 45° to the principal directions")
 print(f"The calculated value τ_max = {tau_max:.1f} MPa is correct.")
 
+# Traction check: normal and shear stress on the two max shear planes
+sigma_n, tau_n = normal_shear(T, [shear_direction_1, shear_direction_2])
+print("\nTraction on the planes with normals (n₁ ± n₃)/√2:")
+for k in range(2):
+    print(f"Plane {k + 1}: σ_n = {sigma_n[k]:.1f} MPa, τ_n = {tau_n[k]:.1f} MPa")
+
+# Critical plane of the shear criterion, exact from the principal frame
+critical = critical_plane(T, criterion='shear')
+print(f"Critical plane: τ_max = {critical['value']:.1f} MPa")
+
 print(f"\nSUMMARY OF RESULTS:")
 print(f"- Principal stresses: σ₁={sigma_1:.1f}, σ₂={eigenvalues_sorted[1]:.1f}, "
       f"σ₃={sigma_3:.1f} MPa")
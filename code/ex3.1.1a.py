@@ -18,6 +18,9 @@ import numpy as np
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
 
+from biomech.mohr import plot_mohr_circles
+from biomech.rendering import finish_figure
+
 # Given stress matrix (MPa)
 T = np.array([
     [-50, 35, 0],
@@ -196,12 +199,12 @@ ax3.grid(True, alpha=0.3)
 center_sigma = (sigma_xx + sigma_yy) / 2
 radius = np.sqrt(((sigma_xx - sigma_yy) / 2)**2 + tau_xy**2)
 
-# Draw Mohr's circle
-theta_circle = np.linspace(0, 2*np.pi, 1000)
-sigma_circle = center_sigma + radius * np.cos(theta_circle)
-tau_circle = radius * np.sin(theta_circle)
-
-ax3.plot(sigma_circle, tau_circle, 'b-', linewidth=2, label="Mohr's Circle")
+# Draw the three Mohr's circles of the 3D stress state. Sorted over all
+# three principal stresses (0, σ₁, σ₂), the in-plane circle through σ₁ and
+# σ₂ is the last one, drawn in blue
+circles = plot_mohr_circles(ax3, T, show_points=False,
+                            colors=('lightgray', 'lightgray', 'b'))
+circles.set_label("Mohr's Circles")
 
 # Mark principal stresses
 ax3.plot([sigma1, sigma2], [0, 0], 'ro', markersize=8, label='Principal Stresses')
@@ -255,9 +258,7 @@ ax4.text(0.05, 0.95, summary_text, transform=ax4.transAxes, fontsize=11,
          bbox=dict(boxstyle="round,pad=0.5", facecolor="lightgray", alpha=0.8))
 
 plt.tight_layout()
-plt.savefig('/Users/jan-oivindlima/Documents/arbeid/skole/9. semester/TKT4150 - Biomekanikk/Øvinger/images/ex3.1.1a-analysis.png', 
-            dpi=300, bbox_inches='tight')
-plt.show()
+finish_figure(fig, 'ex3.1.1a-analysis.png', always_save=True)
 
 # =============================================================================
 # 3D Visualization of principal directions
@@ -313,9 +314,7 @@ ax.set_xlim([-max_range, max_range])
 ax.set_ylim([-max_range, max_range])
 ax.set_zlim([-max_range, max_range])
 
-plt.savefig('/Users/jan-oivindlima/Documents/arbeid/skole/9. semester/TKT4150 - Biomekanikk/Øvinger/images/ex3.1.1a-3d.png', 
-            dpi=300, bbox_inches='tight')
-plt.show()
+finish_figure(fig, 'ex3.1.1a-3d.png', always_save=True)
 
 print("=== ANALYSIS COMPLETE ===")
 print(f"Results saved to images/ex3.1.1a-analysis.png and images/ex3.1.1a-3d.png")
@@ -12,79 +12,17 @@ Author: Generated for TKT4150 course
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
 
+from biomech import analyze_strain_tensor, displacement_gradient_to_strain
+from biomech.rendering import finish_figure
 
-def displacement_gradient_to_strain(displacement_gradient):
-    """
-    Convert displacement gradient tensor to strain tensor
-    
-    For small deformations: ε = 0.5 * (∇u + (∇u)^T)
-    
-    Parameters:
-    displacement_gradient: 3x3 numpy array - gradient tensor ∇u
-    
-    Returns:
-    strain_tensor: 3x3 numpy array - strain tensor
-    """
-    # Small strain assumption (most biomechanics applications)
-    grad_u = np.array(displacement_gradient)
-    strain_tensor = 0.5 * (grad_u + grad_u.T)
-    return strain_tensor
-
-
-def analyze_strain_tensor(strain_tensor):
-    """
-    Comprehensive analysis of strain tensor
-    
-    Parameters:
-    strain_tensor: 3x3 numpy array
-    
-    Returns:
-    Dictionary with strain analysis results
-    """
-    # Calculate principal strains and directions
-    eigenvalues, eigenvectors = np.linalg.eigh(strain_tensor)
-    
-    # Sort by magnitude (largest first)
-    idx = np.argsort(eigenvalues)[::-1]
-    principal_strains = eigenvalues[idx]
-    principal_directions = eigenvectors[:, idx]
-    
-    # Strain invariants
-    I1 = np.trace(strain_tensor)  # First invariant
-    I2 = 0.5 * (I1**2 - np.trace(strain_tensor @ strain_tensor))  # Second invariant
-    I3 = np.linalg.det(strain_tensor)  # Third invariant
-    
-    # Volumetric and deviatoric components
-    volumetric_strain = I1 / 3
-    deviatoric_strain = strain_tensor - volumetric_strain * np.eye(3)
-    
-    # Engineering strains (normal strains)
-    engineering_strains = np.diag(strain_tensor)
-    
-    # Shear strains (engineering definition: γ = 2ε)
-    shear_strains = 2 * np.array([strain_tensor[0,1], strain_tensor[1,2], strain_tensor[0,2]])
-    
-    # Maximum shear strain
-    max_shear_strain = 0.5 * (principal_strains[0] - principal_strains[2])
-    
-    return {
-        'strain_tensor': strain_tensor,
-        'principal_strains': principal_strains,
-        'principal_directions': principal_directions,
-        'invariants': {'I1': I1, 'I2': I2, 'I3': I3},
-        'volumetric_strain': volumetric_strain,
-        'deviatoric_strain': deviatoric_strain,
-        'engineering_strains': engineering_strains,
-        'shear_strains': shear_strains,
-        'max_shear_strain': max_shear_strain
-    }
 
 def plot_strain_analysis(strain_results):
     """
     Create visualization of strain analysis
     """
+    import matplotlib.pyplot as plt
+
     fig, axes = plt.subplots(2, 2, figsize=(12, 10))
     
     # 1. Principal strains bar plot
@@ -248,7 +186,7 @@ def main():
     
     # Create visualization
     fig = plot_strain_analysis(results)
-    plt.show()
+    finish_figure(fig, 'ex3.1.2a-strain-analysis.png')
     
     # Save results
     print("\n5. Results Summary")
@@ -12,6 +12,13 @@ import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 import numpy as np
 
+from biomech.rendering import (
+    FigureJob,
+    is_headless,
+    render_figures,
+    save_figure,
+)
+
 def create_free_body_diagram():
     """Create free body diagram for cylindrical pressure vessel axial stress analysis"""
     
@@ -261,24 +268,27 @@ def main():
     
     print("Creating free body diagrams for Exercise 3.1.3c...")
     
-    # Create the main free body diagram
-    fig1 = create_free_body_diagram()
-    
-    # Create the detailed force analysis
-    fig2 = create_force_analysis_diagram()
-    
-    # Save the figures
-    fig1.savefig('/Users/jan-oivindlima/Documents/arbeid/skole/9. semester/TKT4150 - Biomekanikk/Øvinger/images/ex3.1.3c-free-body-diagram.png', 
-                 dpi=300, bbox_inches='tight')
-    
-    fig2.savefig('/Users/jan-oivindlima/Documents/arbeid/skole/9. semester/TKT4150 - Biomekanikk/Øvinger/images/ex3.1.3c-force-analysis.png', 
-                 dpi=300, bbox_inches='tight')
-    
+    # The main free body diagram and the detailed force analysis
+    jobs = [
+        FigureJob(create_free_body_diagram, (),
+                  'ex3.1.3c-free-body-diagram.png'),
+        FigureJob(create_force_analysis_diagram, (),
+                  'ex3.1.3c-force-analysis.png'),
+    ]
+
+    if is_headless():
+        # The diagrams are independent, so render them in parallel
+        render_figures(jobs, processes=len(jobs))
+    else:
+        for job in jobs:
+            save_figure(job.builder(), job.filename)
+
     print("✓ Free body diagram saved as: ex3.1.3c-free-body-diagram.png")
     print("✓ Force analysis diagram saved as: ex3.1.3c-force-analysis.png")
-    
-    # Show the plots
-    plt.show()
+
+    # Show the plots (skipped when running headless)
+    if not is_headless():
+        plt.show()
     
     print("\nDiagram Features:")
     print("- Left panel: 3D view of cylinder showing cut plane")
@@ -7,7 +7,10 @@ Including visualization, stretch calculations, and strain analysis.
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
+
+from biomech import Kinematics, directional_stretch, stretch_extrema
+from biomech.deformation_sweep import deform_points, shear_deformation_gradient
+from biomech.rendering import finish_figure
 
 
 def homogeneous_deformation_analysis():
@@ -38,12 +41,9 @@ def homogeneous_deformation_analysis():
         [0., 1.]   # D
     ])
 
-    # Apply deformation mapping: x1 = X1 + a*X2, x2 = (1+a)*X2
-    deformed_corners = np.zeros_like(original_corners)
-    for i, (X1, X2) in enumerate(original_corners):
-        x1 = X1 + a * X2
-        x2 = (1 + a) * X2
-        deformed_corners[i] = [x1, x2]
+    # Apply deformation mapping: x1 = X1 + a*X2, x2 = (1+a)*X2, i.e. x = F X
+    deformed_corners = deform_points(shear_deformation_gradient(a),
+                                     original_corners)
     
     corner_labels = ['A', 'B', 'C', 'D']
     print("Original → Deformed corners:")
@@ -120,9 +120,8 @@ def homogeneous_deformation_analysis():
     print(F)
     print()
 
-    # Green-Lagrange strain tensor
-    identity = np.eye(2)
-    E = 0.5 * (F.T @ F - identity)
+    # Green-Lagrange strain tensor E = 0.5 * (F^T F - I)
+    E = Kinematics(F).E
     
     print("Green-Lagrange strain tensor E:")
     print(E)
@@ -160,18 +159,18 @@ def homogeneous_deformation_analysis():
     print("PART 6: Maximum and Minimum Stretch Directions")
     print("-" * 50)
 
-    # Calculate stretch for many angles
+    # Calculate stretch for many angles in one call (used for the plots)
     theta_range = np.linspace(0, 2*np.pi, 1000)
-    stretch_values = [stretch_ratio(theta) for theta in theta_range]
+    directions = np.column_stack([np.cos(theta_range), np.sin(theta_range)])
+    stretch_values = directional_stretch(F, directions)
 
-    # Find extrema
-    max_idx = np.argmax(stretch_values)
-    min_idx = np.argmin(stretch_values)
+    # Exact extrema from the eigen-system of C = F^T F
+    extrema = stretch_extrema(F)
 
-    theta_max = theta_range[max_idx]
-    theta_min = theta_range[min_idx]
-    lambda_max = stretch_values[max_idx]
-    lambda_min = stretch_values[min_idx]
+    theta_max = extrema['max_angle']
+    theta_min = extrema['min_angle']
+    lambda_max = extrema['max_stretch']
+    lambda_min = extrema['min_stretch']
 
     print("Maximum stretch:")
     print(f"  Direction: θ = {theta_max:.3f} rad "
@@ -234,6 +233,7 @@ def homogeneous_deformation_analysis():
 def create_visualization(original_corners, deformed_corners, corner_labels, 
                         theta_range, stretch_values, F, E, a):
     """Create comprehensive visualization of the deformation analysis"""
+    import matplotlib.pyplot as plt
     
     fig = plt.figure(figsize=(16, 12))
     
@@ -349,10 +349,7 @@ def create_visualization(original_corners, deformed_corners, corner_labels,
     ax6.set_ylim(0, max(stretch_values) * 1.1)
     
     plt.tight_layout()
-    plt.savefig('/Users/jan-oivindlima/Documents/arbeid/skole/9. semester/'
-                'TKT4150 - Biomekanikk/Øvinger/images/ex3.2.a-deformation.png',
-                dpi=300, bbox_inches='tight')
-    plt.show()
+    finish_figure(fig, 'ex3.2.a-deformation.png', always_save=True)
 
 
 if __name__ == "__main__":
@@ -7,10 +7,12 @@ and strain invariants for a given displacement gradient tensor.
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
 
+from biomech import analyze_deformation_measures
+from biomech.rendering import finish_figure
 
-def analyze_deformation_measures():
+
+def main():
     """
     Comprehensive analysis of deformation measures from displacement
     gradient tensor
@@ -39,8 +41,9 @@ def analyze_deformation_measures():
     print(H_T)
     print()
 
-    # Green-Lagrange strain: E = 1/2(H + H^T + H^T * H)
-    E = 0.5 * (H + H_T + H_T @ H)
+    # Green-Lagrange strain: E = 1/2(H + H^T + H^T * H) = 1/2(F^T F - I)
+    measures = analyze_deformation_measures(H)
+    E = measures['green_lagrange_strain']
 
     print("Green-Lagrange strain tensor E:")
     print(E)
@@ -50,7 +53,9 @@ def analyze_deformation_measures():
     print("STEP 2: Almansi Strain Tensor")
     print("-" * 40)
 
-    # Almansi strain: e = 1/2(H + H^T - H * H^T)
+    # Almansi strain as given in the exercise: e = 1/2(H + H^T - H * H^T),
+    # returned as 'almansi_strain_approx'. measures['almansi_strain'] keeps
+    # the exact e = 1/2(I - F^-T F^-1).
     e = 0.5 * (H + H_T - H @ H_T)
 
     print("Almansi strain tensor e:")
@@ -61,13 +66,9 @@ def analyze_deformation_measures():
     print("STEP 3: Principal Strain Analysis")
     print("-" * 40)
 
-    # Calculate eigenvalues and eigenvectors
-    eigenvalues, eigenvectors = np.linalg.eigh(E)
-
-    # Sort eigenvalues and eigenvectors in descending order
-    sorted_indices = np.argsort(eigenvalues)[::-1]
-    principal_strains = eigenvalues[sorted_indices]
-    principal_directions = eigenvectors[:, sorted_indices]
+    # Eigenvalues and eigenvectors, sorted in descending order
+    principal_strains = measures['principal_strains']
+    principal_directions = measures['principal_directions']
 
     print("Principal strains (sorted):")
     for i, strain in enumerate(principal_strains):
@@ -84,14 +85,8 @@ def analyze_deformation_measures():
     print("STEP 4: Strain Invariants")
     print("-" * 40)
 
-    # First invariant (trace)
-    I1 = np.trace(E)
-
-    # Second invariant
-    I2 = 0.5 * (I1**2 - np.trace(E @ E))
-
-    # Third invariant (determinant)
-    I3 = np.linalg.det(E)
+    # Trace, second invariant and determinant
+    I1, I2, I3 = measures['strain_invariants']
 
     print(f"First invariant (I₁):  {I1:.6f}")
     print(f"Second invariant (I₂): {I2:.6f}")
@@ -103,9 +98,7 @@ def analyze_deformation_measures():
     print("-" * 50)
 
     # Normal strains (diagonal elements of E)
-    epsilon_x = E[0, 0]
-    epsilon_y = E[1, 1]
-    epsilon_z = E[2, 2]
+    epsilon_x, epsilon_y, epsilon_z = measures['engineering_strains']['normal']
 
     print(f"Normal strain εₓ: {epsilon_x:.6f} ({epsilon_x*100:.3f}%)")
     print(f"Normal strain εᵧ: {epsilon_y:.6f} ({epsilon_y*100:.3f}%)")
@@ -113,9 +106,7 @@ def analyze_deformation_measures():
     print()
 
     # Shear strains (off-diagonal elements)
-    gamma_xy = 2 * E[0, 1]
-    gamma_yz = 2 * E[1, 2]
-    gamma_xz = 2 * E[0, 2]
+    gamma_xy, gamma_yz, gamma_xz = measures['engineering_strains']['shear']
 
     print(f"Shear strain γₓᵧ: {gamma_xy:.6f}")
     print(f"Shear strain γᵧᵧ: {gamma_yz:.6f}")
@@ -123,7 +114,7 @@ def analyze_deformation_measures():
     print()
 
     # Maximum shear strain
-    gamma_max = principal_strains[0] - principal_strains[2]
+    gamma_max = measures['engineering_strains']['max_shear']
     print(f"Maximum shear strain γₘₐₓ: {gamma_max:.6f} "
           f"({gamma_max*100:.3f}%)")
     print()
@@ -132,6 +123,8 @@ def analyze_deformation_measures():
     print("STEP 6: Creating Visualization")
     print("-" * 40)
 
+    import matplotlib.pyplot as plt
+
     # Create visualization
     fig = plt.figure(figsize=(15, 10))
 
@@ -213,10 +206,7 @@ def analyze_deformation_measures():
                  f'{value:.2e}', ha='center', va='bottom', rotation=45)
 
     plt.tight_layout()
-    plt.savefig('/Users/jan-oivindlima/Documents/arbeid/skole/9. semester/'
-                'TKT4150 - Biomekanikk/Øvinger/images/ex3.2.a-analysis.png',
-                dpi=300, bbox_inches='tight')
-    plt.show()
+    finish_figure(fig, 'ex3.2.a-analysis.png', always_save=True)
 
     # Summary
     print("SUMMARY")
@@ -233,20 +223,8 @@ def analyze_deformation_measures():
           "biomechanical analysis")
     print("="*60)
 
-    return {
-        'displacement_gradient': H,
-        'green_lagrange_strain': E,
-        'almansi_strain': e,
-        'principal_strains': principal_strains,
-        'principal_directions': principal_directions,
-        'strain_invariants': [I1, I2, I3],
-        'engineering_strains': {
-            'normal': [epsilon_x, epsilon_y, epsilon_z],
-            'shear': [gamma_xy, gamma_yz, gamma_xz],
-            'max_shear': gamma_max
-        }
-    }
+    return dict(measures, almansi_strain_approx=e)
 
 
 if __name__ == "__main__":
-    results = analyze_deformation_measures()
+    results = main()
@@ -0,0 +1,75 @@
+"""Cache keys of named and callable analyses and the on-disk tier"""
+
+import numpy as np
+import pytest
+
+from biomech.cache import AnalysisCache, tensor_key
+
+STRAINS = np.arange(9.0).reshape(1, 3, 3)
+
+
+def scaled(factor):
+    def analysis(tensors):
+        return {'x': factor * np.asarray(tensors)}
+    return analysis
+
+
+def doubled(tensors):
+    return {'x': 2 * np.asarray(tensors)}
+
+
+def test_lambdas_and_closures_need_a_name():
+    cache = AnalysisCache()
+    with pytest.raises(ValueError):
+        cache.analyze(lambda tensors: {'x': tensors}, STRAINS)
+    with pytest.raises(ValueError):
+        cache.wrap(scaled(2))
+
+
+def test_named_closures_do_not_collide():
+    cache = AnalysisCache()
+    twice = cache.analyze(scaled(2), STRAINS, name='twice')['x']
+    thrice = cache.analyze(scaled(3), STRAINS, name='thrice')['x']
+    np.testing.assert_array_equal(thrice, 1.5 * twice)
+
+
+def test_hits_and_read_only_results():
+    cache = AnalysisCache()
+    first = cache.analyze(doubled, STRAINS)
+    second = cache.wrap(doubled)(STRAINS.copy())
+    assert second is first
+    assert not first['x'].flags.writeable
+    assert cache.cache_info().hits == 1
+
+
+def test_version_changes_the_key():
+    assert (tensor_key('stress', STRAINS, a=1)
+            != tensor_key('stress', STRAINS, a=2))
+    assert (AnalysisCache()._key('stress', STRAINS, {})
+            != AnalysisCache(version='2')._key('stress', STRAINS, {}))
+
+
+def test_disk_tier_survives_and_clears_only_its_files(tmp_path):
+    other = tmp_path / "results.npz"
+    np.savez(other, x=np.ones(3))
+    AnalysisCache(directory=tmp_path).analyze('stress', STRAINS)
+
+    cache = AnalysisCache(directory=tmp_path)
+    cache.analyze('stress', STRAINS)
+    assert cache.cache_info().disk_hits == 1
+
+    cache.cache_clear(disk=True)
+    assert sorted(tmp_path.iterdir()) == [other]
+
+
+def test_large_array_options_hash_every_element():
+    weights = np.zeros(2000)
+    changed = weights.copy()
+    changed[1000] = 1.0
+    assert "..." in repr(weights)
+    assert (tensor_key('stress', STRAINS, weights=weights)
+            != tensor_key('stress', STRAINS, weights=changed))
+    assert (tensor_key('stress', STRAINS, weights=weights)
+            == tensor_key('stress', STRAINS, weights=list(weights)))
+    assert (tensor_key('stress', STRAINS, weights=weights)
+            != tensor_key('stress', STRAINS, weights=weights[:1000]))
@@ -0,0 +1,84 @@
+"""The python -m biomech batch runner"""
+
+import json
+
+import numpy as np
+import pytest
+
+from biomech.__main__ import main
+from biomech.streaming import (
+    deformation_analysis,
+    strain_analysis,
+    stress_analysis,
+)
+
+
+def random_tensors(n, scale=1.0, symmetric=True):
+    A = np.random.default_rng(0).normal(0.0, scale, size=(n, 3, 3))
+    return 0.5 * (A + np.swapaxes(A, -1, -2)) if symmetric else A
+
+
+def read_jsonl(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_stress_to_jsonl(tmp_path):
+    stresses = random_tensors(7, 50.0)
+    source = tmp_path / "stresses.npy"
+    np.save(source, stresses)
+    output = tmp_path / "stresses.jsonl"
+    assert main(["stress", str(source), "-o", str(output), "-q",
+                 "--chunk-size", "3"]) == 0
+
+    rows = read_jsonl(output)
+    expected = stress_analysis(stresses)
+    assert len(rows) == 7 and list(rows[0]) == list(expected)
+    for name, values in expected.items():
+        np.testing.assert_array_equal([row[name] for row in rows], values)
+
+
+@pytest.mark.parametrize("analysis, analyze", [
+    ("strain", strain_analysis),
+    ("deformation", deformation_analysis),
+])
+def test_gradient_analyses_from_csv(tmp_path, analysis, analyze):
+    gradients = random_tensors(5, 0.05, symmetric=False)
+    source = tmp_path / "gradients.csv"
+    np.savetxt(source, gradients.reshape(5, 9), delimiter=",")
+    output = tmp_path / "results.csv"
+    assert main([analysis, str(source), "-o", str(output), "-q"]) == 0
+
+    table = np.genfromtxt(output, delimiter=",", names=True)
+    for name, values in analyze(gradients).items():
+        np.testing.assert_allclose(table[name], values, rtol=1e-15)
+
+
+@pytest.mark.parametrize("analysis", ["strain", "deformation"])
+def test_gradient_analyses_reject_voigt_rows(tmp_path, capsys, analysis):
+    source = tmp_path / "voigt.csv"
+    np.savetxt(source, np.zeros((4, 6)), delimiter=",")
+    output = tmp_path / "results.jsonl"
+    assert main([analysis, str(source), "-o", str(output), "-q"]) == 1
+    assert "need all 9 components" in capsys.readouterr().err
+
+    with pytest.raises(ValueError, match="9 components"):
+        strain_analysis(np.zeros((4, 6)))
+
+
+def test_several_inputs_write_into_a_directory(tmp_path):
+    for name in ("a", "b"):
+        np.save(tmp_path / f"{name}.npy", random_tensors(3))
+    output = tmp_path / "results"
+    assert main(["stress", str(tmp_path / "a.npy"), str(tmp_path / "b.npy"),
+                 "-o", str(output), "-f", "npy", "-q"]) == 0
+    assert sorted(path.name for path in output.iterdir()) == [
+        "a.stress.npy", "b.stress.npy"]
+    assert len(np.load(output / "b.stress.npy")) == 3
+
+
+def test_empty_input_writes_empty_jsonl(tmp_path):
+    source = tmp_path / "stresses.npy"
+    np.save(source, np.empty((0, 6)))
+    output = tmp_path / "stresses.jsonl"
+    assert main(["stress", str(source), "-o", str(output), "-q"]) == 0
+    assert output.read_text() == ""
@@ -0,0 +1,41 @@
+"""Vectorized sweeps of the homogeneous plane deformation of exercise 3"""
+
+import numpy as np
+
+from biomech.deformation_sweep import (
+    deformation_sweep,
+    shear_deformation_gradient,
+    shear_parameter_sweep,
+)
+
+
+def test_exercise_values_for_a_equal_0_1():
+    table = shear_parameter_sweep([0.1])
+    np.testing.assert_allclose(
+        [table['x_C'][0], table['y_C'][0], table['x_D'][0], table['y_D'][0]],
+        [1.1, 1.1, 0.1, 1.1])
+    np.testing.assert_allclose(table['stretch_AC'], 1.1)
+    np.testing.assert_allclose(table['stretch_BD'], np.sqrt(1.01))
+    np.testing.assert_allclose(table['shear_strain'],
+                               np.arcsin(0.1 / np.sqrt(1.22)))
+    np.testing.assert_allclose(
+        [table['E11'][0], table['E12'][0], table['E22'][0]],
+        [0.0, 0.05, 0.11], atol=1e-15)
+
+
+def test_sweep_matches_one_case_at_a_time():
+    a_values = np.linspace(-0.5, 0.5, 11)
+    table = shear_parameter_sweep(a_values)
+    np.testing.assert_array_equal(table['a'], a_values)
+    for i, a in enumerate(a_values):
+        single = deformation_sweep(shear_deformation_gradient(a))
+        for name, values in single.items():
+            np.testing.assert_allclose(table[name][i], values[0],
+                                       atol=1e-15)
+
+
+def test_stretch_range_brackets_the_diagonals():
+    table = shear_parameter_sweep(np.linspace(-0.5, 0.5, 11))
+    for name in ('stretch_AC', 'stretch_BD'):
+        assert np.all(table['min_stretch'] <= table[name] + 1e-15)
+        assert np.all(table[name] <= table['max_stretch'] + 1e-15)
@@ -0,0 +1,136 @@
+"""Hooke's law in the three modes and the Bond rotation of Voigt arrays"""
+
+import numpy as np
+import pytest
+
+from biomech import (
+    AnisotropicElasticity,
+    IsotropicElasticity,
+    bond_matrix,
+    isotropic_stiffness,
+    rotate_stiffness,
+    tensor_to_voigt,
+)
+
+ETA, NU = 17e3, 0.3
+
+
+def random_symmetric(rng, shape=()):
+    A = rng.normal(size=shape + (3, 3))
+    return 0.5 * (A + np.swapaxes(A, -1, -2))
+
+
+def random_rotations(rng, n):
+    Q, R = np.linalg.qr(rng.normal(size=(n, 3, 3)))
+    Q = Q * np.sign(np.diagonal(R, axis1=-2, axis2=-1))[..., None, :]
+    return Q * np.sign(np.linalg.det(Q))[..., None, None]
+
+
+def hooke(E):
+    """T = η/(1+ν) (E + ν/(1-2ν) tr(E) I)"""
+    trace = np.trace(E, axis1=-2, axis2=-1)[..., None, None]
+    return ETA / (1 + NU) * (E + NU / (1 - 2*NU) * trace * np.eye(3))
+
+
+def test_3d_matches_hooke_and_inverts():
+    E = random_symmetric(np.random.default_rng(0), (10,))
+    law = IsotropicElasticity(ETA, NU)
+    T = law.stress(E)
+    np.testing.assert_allclose(T, hooke(E), rtol=1e-12, atol=1e-9)
+    np.testing.assert_allclose(law.strain(T), E, rtol=1e-12, atol=1e-12)
+    np.testing.assert_allclose(law.stress(tensor_to_voigt(E)),
+                               tensor_to_voigt(T), rtol=1e-12, atol=1e-9)
+
+
+def test_plane_stress_is_3d_with_free_out_of_plane_strain():
+    E = random_symmetric(np.random.default_rng(1), (10,))
+    law = IsotropicElasticity(ETA, NU, mode='plane_stress')
+    E[..., 2, :2] = E[..., :2, 2] = 0.0
+    E[..., 2, 2] = law.out_of_plane(E[..., :2, :2])
+    T = hooke(E)
+    np.testing.assert_allclose(T[..., 2, 2], 0.0, atol=1e-9)
+    np.testing.assert_allclose(law.stress(E[..., :2, :2]), T[..., :2, :2],
+                               rtol=1e-12, atol=1e-9)
+
+
+def test_plane_strain_is_3d_with_zero_out_of_plane_strain():
+    E = random_symmetric(np.random.default_rng(2), (10,))
+    E[..., 2, :] = E[..., :, 2] = 0.0
+    law = IsotropicElasticity(ETA, NU, mode='plane_strain')
+    T = hooke(E)
+    np.testing.assert_allclose(law.stress(E[..., :2, :2]), T[..., :2, :2],
+                               rtol=1e-12, atol=1e-9)
+    np.testing.assert_allclose(law.out_of_plane(E[..., :2, :2]),
+                               T[..., 2, 2], rtol=1e-12, atol=1e-9)
+
+
+def test_per_point_properties_match_homogeneous():
+    E = random_symmetric(np.random.default_rng(3), (4,))
+    ids = np.array([0, 1, 1, 0])
+    law = IsotropicElasticity([ETA, 2 * ETA], NU, material_ids=ids)
+    expected = np.where((ids == 1)[:, None, None], 2, 1) * hooke(E)
+    np.testing.assert_allclose(law.stress(E), expected, rtol=1e-12)
+
+
+@pytest.mark.parametrize("mode", ["3d", "plane_stress", "plane_strain"])
+def test_stiffness_is_symmetric_positive_definite(mode):
+    C = isotropic_stiffness(ETA, NU, mode)
+    np.testing.assert_allclose(C, C.T)
+    assert np.all(np.linalg.eigvalsh(C) > 0)
+
+
+@pytest.mark.parametrize("mode", ["plane_stress", "plane_strain"])
+def test_plane_modes_reject_3d_tensors(mode):
+    law = IsotropicElasticity(ETA, NU, mode=mode)
+    E = random_symmetric(np.random.default_rng(4))
+    with pytest.raises(ValueError, match="2, 2"):
+        law.stress(E)
+    voigt = E[[0, 1, 0], [0, 1, 1]]
+    np.testing.assert_array_equal(law.stress(np.stack([voigt] * 4)),
+                                  np.stack([law.stress(voigt)] * 4))
+    with pytest.raises(ValueError):
+        IsotropicElasticity(ETA, NU).stress(np.zeros((4, 2, 2)))
+
+
+def test_bond_matrix_rotates_tensors():
+    rng = np.random.default_rng(4)
+    A = random_symmetric(rng, (8,))
+    R = random_rotations(rng, 8)
+    rotated = R @ A @ np.swapaxes(R, -1, -2)
+    np.testing.assert_allclose(
+        np.einsum('...ij,...j->...i', bond_matrix(R), tensor_to_voigt(A)),
+        tensor_to_voigt(rotated), atol=1e-12)
+
+
+def test_rotated_isotropic_stiffness_is_unchanged():
+    R = random_rotations(np.random.default_rng(5), 8)
+    C = isotropic_stiffness(ETA, NU)
+    np.testing.assert_allclose(rotate_stiffness(C, R),
+                               np.broadcast_to(C, (8, 6, 6)),
+                               rtol=1e-12, atol=1e-8)
+
+
+def test_anisotropic_matches_isotropic():
+    rng = np.random.default_rng(6)
+    E = random_symmetric(rng, (8,))
+    law = AnisotropicElasticity(isotropic_stiffness(ETA, NU),
+                                rotations=random_rotations(rng, 8))
+    np.testing.assert_allclose(law.stress(E), hooke(E), rtol=1e-10,
+                               atol=1e-8)
+
+
+def test_material_ids_share_or_index_the_stiffness():
+    E = random_symmetric(np.random.default_rng(7), (4,))
+    ids = np.array([0, 1, 1, 0])
+    C = isotropic_stiffness(ETA, NU)
+    shared = AnisotropicElasticity(C, material_ids=ids)
+    np.testing.assert_allclose(shared.stress(E), hooke(E), rtol=1e-12,
+                               atol=1e-9)
+    stacked = AnisotropicElasticity(np.stack([C, 2 * C]), material_ids=ids)
+    expected = np.where((ids == 1)[:, None, None], 2, 1) * hooke(E)
+    np.testing.assert_allclose(stacked.stress(E), expected, rtol=1e-12,
+                               atol=1e-9)
+    with pytest.raises(ValueError):
+        AnisotropicElasticity(np.stack([[C, C]] * 4), material_ids=ids)
+    with pytest.raises(ValueError):
+        AnisotropicElasticity(C[:, :3])
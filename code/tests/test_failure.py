@@ -0,0 +1,54 @@
+"""Failure criteria and safety factors for stress fields"""
+
+import numpy as np
+
+from biomech import (
+    BONE_YIELD_STRENGTH,
+    evaluate_failure,
+    principal_values,
+    safety_factor,
+    tresca,
+    von_mises,
+    von_mises_principal,
+)
+
+
+def test_uniaxial_stress():
+    stress = np.zeros((1, 3, 3))
+    stress[0, 0, 0] = 100.0
+    results = evaluate_failure(stress)
+    np.testing.assert_allclose(results['von_mises'], 100.0)
+    np.testing.assert_allclose(results['tresca'], 100.0)
+    np.testing.assert_allclose(results['max_principal'], 100.0)
+    np.testing.assert_allclose(results['safety_factor']['von_mises'],
+                               BONE_YIELD_STRENGTH / 100.0)
+    assert results['safe'][0]
+
+
+def test_pure_shear():
+    stress = np.zeros((1, 6))
+    stress[0, 5] = 50.0
+    results = evaluate_failure(stress, yield_strength=80.0)
+    np.testing.assert_allclose(results['von_mises'], np.sqrt(3) * 50.0)
+    np.testing.assert_allclose(results['tresca'], 100.0)
+    assert not results['safe'][0]
+
+
+def test_principal_input_matches_tensor_input():
+    A = np.random.default_rng(0).normal(0.0, 50.0, size=(4, 5, 3, 3))
+    stresses = 0.5 * (A + np.swapaxes(A, -1, -2))
+    from_tensors = evaluate_failure(stresses)
+    from_principal = evaluate_failure(principal_values(stresses),
+                                      principal=True)
+    for name in ('von_mises', 'tresca', 'max_principal'):
+        assert from_tensors[name].shape == (4, 5)
+        np.testing.assert_allclose(from_principal[name], from_tensors[name])
+    np.testing.assert_allclose(
+        von_mises(stresses),
+        von_mises_principal(principal_values(stresses)))
+    np.testing.assert_allclose(tresca([[3.0, -1.0, 2.0]]), [4.0])
+
+
+def test_safety_factor_of_zero_stress_is_infinite():
+    np.testing.assert_array_equal(safety_factor([0.0, 65.0], 130.0),
+                                  [np.inf, 2.0])
@@ -0,0 +1,54 @@
+"""Principal direction figures reused across many stress states"""
+
+import numpy as np
+
+from biomech.figure_templates import (
+    PrincipalDirectionsTemplate,
+    max_shear_directions,
+)
+from biomech.principal import principal_frame
+
+
+def stress_states(n):
+    A = np.random.default_rng(0).normal(0.0, 50.0, size=(n, 3, 3))
+    return 0.5 * (A + np.swapaxes(A, -1, -2))
+
+
+def test_max_shear_directions_bisect_n1_and_n3():
+    _, directions = principal_frame(stress_states(5))
+    shear = max_shear_directions(directions)
+    np.testing.assert_allclose(np.linalg.norm(shear, axis=-2), 1.0)
+    np.testing.assert_allclose(
+        np.einsum('nik,ni->nk', shear, directions[..., :, 0]),
+        np.full((5, 2), np.sqrt(0.5)))
+
+
+def test_blitted_frame_matches_full_redraw():
+    import matplotlib.pyplot as plt
+
+    template = PrincipalDirectionsTemplate(
+        show_shear=True, figsize=(6, 3),
+        titles=['σ₁ = {sigma1:.1f}', 'τ = {tau_max:.1f}'])
+    values, directions = principal_frame(stress_states(2))
+    template.update(values[0], directions[0])
+    template.render()
+    template.update(values[1], directions[1])
+    blitted = template.render().copy()
+
+    assert template.axes[0].get_title() == f'σ₁ = {values[1, 0]:.1f}'
+    template.fig.canvas.draw()
+    redrawn = np.asarray(template.fig.canvas.buffer_rgba())
+    # Anti-aliased edges may differ by a few levels where artists overlap
+    assert np.mean(blitted != redrawn) < 0.01
+    plt.close(template.fig)
+
+
+def test_export_frames_writes_one_image_per_state(tmp_path):
+    import matplotlib.pyplot as plt
+
+    template = PrincipalDirectionsTemplate(figsize=(4, 2))
+    paths = template.export_frames(stress_states(3), output_dir=tmp_path)
+    assert [path.name for path in paths] == [
+        f'principal_directions_{k:05d}.png' for k in range(3)]
+    assert all(path.stat().st_size > 0 for path in paths)
+    plt.close(template.fig)
@@ -0,0 +1,59 @@
+"""Hydrostatic pressure fields and the vessel wall stresses they load"""
+
+import numpy as np
+
+from biomech.hydrostatic import (
+    STANDING,
+    SUPINE,
+    hydrostatic_pressure,
+    posture_gravity,
+    segment_midpoints,
+    vessel_wall_stress,
+)
+from biomech.pressure_vessel import vessel_stress
+
+# Exercise 4: the foot 1.2 m below the heart, venous and arterial
+# reference pressures of 10 kPa and 16 kPa
+FOOT = np.array([[0.0, 0.0, -1.2], [0.0, 0.0, -1.2]])
+P0 = np.array([10e3, 16e3])
+
+
+def test_foot_pressures_of_exercise_4():
+    np.testing.assert_allclose(hydrostatic_pressure(FOOT, p0=P0),
+                               [21.772e3, 27.772e3])
+
+
+def test_postures_evaluate_together():
+    np.testing.assert_allclose(posture_gravity([0, 90]), [STANDING, SUPINE],
+                               atol=1e-15)
+    pressure = hydrostatic_pressure(FOOT, posture_gravity([0, 90, 180]),
+                                    p0=P0)
+    assert pressure.shape == (3, 2)
+    np.testing.assert_allclose(pressure[0], [21.772e3, 27.772e3])
+    np.testing.assert_allclose(pressure[1], P0, atol=1e-9)
+    np.testing.assert_allclose(pressure[2], P0 - 11.772e3)
+
+
+def test_reference_point_and_unnormalised_gravity():
+    heart = np.array([0.1, 0.05, 1.3])
+    points = heart + np.array([[0.0, 0.0, 0.5], [0.2, 0.1, -0.7]])
+    pressure = hydrostatic_pressure(points, gravity=[0.0, 0.0, -2.0],
+                                    p0=13e3, reference_point=heart)
+    np.testing.assert_allclose(pressure, 13e3 + 9810 * np.array([-0.5, 0.7]))
+
+
+def test_wall_stress_of_centreline_segments():
+    centreline = np.column_stack([np.zeros(5), np.zeros(5),
+                                  np.linspace(0.0, -1.2, 5)])
+    midpoints, lengths = segment_midpoints(centreline)
+    np.testing.assert_allclose(lengths, 0.3)
+    np.testing.assert_allclose(midpoints[:, 2], [-0.15, -0.45, -0.75, -1.05])
+
+    gravity = posture_gravity([0, 90])
+    results = vessel_wall_stress(midpoints, 3e-3, 0.5e-3, gravity,
+                                 p0=16e3, method='lame')
+    assert results['hoop'].shape == (2, 4)
+    expected = vessel_stress(3e-3, 0.5e-3, results['pressure'],
+                             method='lame')
+    for name, values in expected.items():
+        np.testing.assert_allclose(results[name], values)
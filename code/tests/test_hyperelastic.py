@@ -0,0 +1,85 @@
+"""Hyperelastic stress and tangent against central finite differences"""
+
+import numpy as np
+import pytest
+
+from biomech import (
+    ENGINEERING_SHEAR,
+    HolzapfelGasserOgden,
+    MooneyRivlin,
+    NeoHookean,
+    tensor_to_voigt,
+    voigt_to_tensor,
+)
+from biomech.hyperelastic import Hyperelastic
+
+STEP = 1e-6
+
+MODELS = {
+    'neo_hookean': NeoHookean(mu=1.0, kappa=10.0),
+    'mooney_rivlin': MooneyRivlin(c10=0.3, c01=0.2, kappa=10.0),
+    'hgo': HolzapfelGasserOgden(mu=1.0, k1=2.0, k2=0.5, kappa=10.0,
+                                fibres=[[1., 1., 0.], [1., -1., 0.]],
+                                dispersion=0.1),
+}
+
+
+def stretch_from_strain(E):
+    """Right stretch U with Uᵀ U = 2E + I"""
+    values, vectors = np.linalg.eigh(2 * E + np.eye(3))
+    return (vectors * np.sqrt(values)[..., None, :]) @ np.swapaxes(
+        vectors, -1, -2)
+
+
+@pytest.fixture
+def strains():
+    rng = np.random.default_rng(0)
+    A = rng.normal(0.0, 0.1, size=(5, 3, 3))
+    # Net stretch in every direction so the fibres carry load
+    return 0.5 * (A + np.swapaxes(A, -1, -2)) + 0.1 * np.eye(3)
+
+
+@pytest.mark.parametrize("name", sorted(MODELS))
+def test_stress_is_energy_derivative(name, strains):
+    model = MODELS[name]
+    S = tensor_to_voigt(model.stress(stretch_from_strain(strains)))
+    for i in range(6):
+        dE = np.zeros(6)
+        dE[i] = STEP / ENGINEERING_SHEAR[i]
+        plus = model.evaluate(stretch_from_strain(
+            strains + voigt_to_tensor(dE))).energy
+        minus = model.evaluate(stretch_from_strain(
+            strains - voigt_to_tensor(dE))).energy
+        # dW = S : dE = S_v · (engineering dE_v)
+        np.testing.assert_allclose((plus - minus) / (2 * STEP), S[:, i],
+                                   rtol=1e-6, atol=1e-8)
+
+
+@pytest.mark.parametrize("name", sorted(MODELS))
+def test_tangent_is_stress_derivative(name, strains):
+    model = MODELS[name]
+    tangent = model.tangent(stretch_from_strain(strains))
+    for i in range(6):
+        dE = np.zeros(6)
+        dE[i] = STEP / ENGINEERING_SHEAR[i]
+        plus = model.stress(stretch_from_strain(
+            strains + voigt_to_tensor(dE)))
+        minus = model.stress(stretch_from_strain(
+            strains - voigt_to_tensor(dE)))
+        np.testing.assert_allclose(
+            tensor_to_voigt(plus - minus) / (2 * STEP), tangent[..., :, i],
+            rtol=1e-5, atol=1e-6)
+
+
+def test_reference_state_is_stress_free():
+    F = np.eye(3)[None]
+    for model in MODELS.values():
+        np.testing.assert_allclose(model.stress(F), 0.0, atol=1e-12)
+
+
+def test_models_must_implement_the_isochoric_energy():
+    class Incomplete(Hyperelastic):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete(kappa=10.0)
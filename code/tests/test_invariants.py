@@ -0,0 +1,39 @@
+"""Invariants and principal values, including integer and tiny inputs"""
+
+import numpy as np
+
+from biomech import as_voigt, stress_invariants, tensor_to_voigt, von_mises
+
+
+def random_symmetric(rng, shape=()):
+    A = rng.normal(size=shape + (3, 3))
+    return 0.5 * (A + np.swapaxes(A, -1, -2))
+
+
+def test_invariants_match_traces_and_determinant():
+    T = random_symmetric(np.random.default_rng(0), (20,))
+    I1, I2, I3 = stress_invariants(T)
+    trace = np.trace(T, axis1=-2, axis2=-1)
+    np.testing.assert_allclose(I1, trace)
+    np.testing.assert_allclose(
+        I2, 0.5 * (trace**2 - np.trace(T @ T, axis1=-2, axis2=-1)))
+    np.testing.assert_allclose(I3, np.linalg.det(T))
+
+
+def test_voigt_input_matches_tensor_input():
+    T = random_symmetric(np.random.default_rng(1), (4, 5))
+    for expected, actual in zip(stress_invariants(T),
+                                stress_invariants(tensor_to_voigt(T))):
+        np.testing.assert_allclose(actual, expected)
+    np.testing.assert_array_equal(as_voigt(tensor_to_voigt(T)),
+                                  tensor_to_voigt(T))
+
+
+def test_integer_tensors_give_float_results():
+    T = np.array([[[1, 2, 0], [2, 3, 0], [0, 0, 1]]])
+    I1, I2, I3 = stress_invariants(T)
+    assert I1.dtype == I2.dtype == I3.dtype == np.float64
+    np.testing.assert_allclose([I1[0], I2[0], I3[0]], [5.0, 3.0, -1.0])
+    assert as_voigt(T).dtype == np.float64
+    assert von_mises(T).dtype == np.float64
+    np.testing.assert_allclose(von_mises(T), [4.0])
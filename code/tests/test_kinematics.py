@@ -0,0 +1,60 @@
+"""Finite-strain measures of batches of deformation gradients"""
+
+import numpy as np
+import pytest
+
+from biomech import Kinematics
+
+
+def random_gradients(shape=(20,), dim=3):
+    H = np.random.default_rng(0).normal(0.0, 0.2, size=shape + (dim, dim))
+    return np.eye(dim) + H
+
+
+@pytest.mark.parametrize("dim", [2, 3])
+def test_strain_measures(dim):
+    F = random_gradients(dim=dim)
+    kinematics = Kinematics(F)
+    I = np.eye(dim)
+    Ft = np.swapaxes(F, -1, -2)
+    F_inv = np.linalg.inv(F)
+    np.testing.assert_allclose(kinematics.J, np.linalg.det(F))
+    np.testing.assert_allclose(kinematics.F_inv, F_inv, atol=1e-12)
+    np.testing.assert_allclose(kinematics.C, Ft @ F)
+    np.testing.assert_allclose(kinematics.b, F @ Ft)
+    np.testing.assert_allclose(kinematics.E, 0.5 * (Ft @ F - I),
+                               atol=1e-15)
+    np.testing.assert_allclose(
+        kinematics.e, 0.5 * (I - np.swapaxes(F_inv, -1, -2) @ F_inv),
+        atol=1e-12)
+
+
+@pytest.mark.parametrize("dim", [2, 3])
+def test_polar_factors(dim):
+    F = random_gradients(dim=dim)
+    kinematics = Kinematics(F)
+    R, U, V = kinematics.R, kinematics.U, kinematics.V
+    np.testing.assert_allclose(R @ U, F, atol=1e-12)
+    np.testing.assert_allclose(V @ R, F, atol=1e-12)
+    np.testing.assert_allclose(np.swapaxes(R, -1, -2) @ R,
+                               np.broadcast_to(np.eye(dim), F.shape),
+                               atol=1e-12)
+    np.testing.assert_allclose(U @ kinematics.U_inv,
+                               np.broadcast_to(np.eye(dim), F.shape),
+                               atol=1e-12)
+    np.testing.assert_allclose(np.sort(np.linalg.eigvalsh(U))[..., ::-1],
+                               kinematics.principal_stretches, atol=1e-12)
+
+
+def test_log_strain_and_displacement_gradient():
+    H = np.zeros((3, 3))
+    H[0, 0] = np.e - 1
+    kinematics = Kinematics.from_displacement_gradient(H)
+    np.testing.assert_allclose(kinematics.log_strain, np.diag([1., 0., 0.]),
+                               atol=1e-15)
+    np.testing.assert_allclose(kinematics.E[0, 0], 0.5 * (np.e**2 - 1))
+
+
+def test_non_square_input_is_rejected():
+    with pytest.raises(ValueError):
+        Kinematics(np.zeros((4, 3, 2)))
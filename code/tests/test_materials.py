@@ -0,0 +1,29 @@
+"""Material properties resolved per point from material IDs"""
+
+import numpy as np
+import pytest
+
+from biomech import MaterialTable, evaluate_failure, material_property
+
+
+def test_scalar_with_material_ids_is_shared():
+    ids = np.array([0, 2, 1, 2])
+    value = material_property(130.0, ids)
+    assert value.ndim == 0 and value == 130.0
+    failure = evaluate_failure(np.zeros((4, 6)), 130.0, material_ids=ids)
+    assert failure['von_mises'].shape == (4,)
+
+
+def test_per_material_values_are_indexed():
+    ids = np.array([0, 2, 1, 2])
+    np.testing.assert_array_equal(
+        material_property([1.0, 2.0, 3.0], ids), [1.0, 3.0, 2.0, 3.0])
+
+
+def test_table_needs_material_ids():
+    table = MaterialTable(names=['cortical', 'trabecular'],
+                          eta=[17e3, 1e3], nu=[0.3, 0.2])
+    np.testing.assert_array_equal(
+        material_property(table, [1, 0], 'eta'), [1e3, 17e3])
+    with pytest.raises(ValueError):
+        material_property(table, key='eta')
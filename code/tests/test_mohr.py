@@ -0,0 +1,70 @@
+"""Mohr circles, plane stresses and the LineCollection renderer"""
+
+import numpy as np
+
+from biomech.mohr import mohr_circles, mohr_points, plot_mohr_circles
+from biomech.principal import principal_frame
+from biomech.traction import hemisphere_normals, normal_shear
+
+
+def random_stresses(n, seed=0):
+    A = np.random.default_rng(seed).normal(0.0, 50.0, size=(n, 3, 3))
+    return 0.5 * (A + np.swapaxes(A, -1, -2))
+
+
+def test_circles_of_a_diagonal_stress():
+    centres, radii = mohr_circles(np.diag([30.0, -10.0, 20.0]))
+    np.testing.assert_allclose(centres, [10.0, 25.0, 5.0])
+    np.testing.assert_allclose(radii, [20.0, 5.0, 15.0])
+
+
+def test_coordinate_planes_of_a_diagonal_stress():
+    sigma_n, tau_n = mohr_points(np.diag([30.0, -10.0, 20.0]))
+    np.testing.assert_array_equal(sigma_n, [30.0, -10.0, 20.0])
+    np.testing.assert_array_equal(tau_n, 0.0)
+
+
+def test_no_shear_on_principal_planes():
+    stresses = random_stresses(200) + 1e4 * np.eye(3)
+    _, directions = principal_frame(stresses)
+    for T, frame in zip(stresses, directions):
+        _, tau_n = normal_shear(T, frame.T)
+        assert np.all(tau_n < 1e-11 * np.abs(T).max())
+
+
+def test_chunked_planes_match_one_contraction():
+    stresses = random_stresses(7)
+    normals = hemisphere_normals(50)
+    expected = normal_shear(stresses, normals)
+    for actual, reference in zip(normal_shear(stresses, normals, 16),
+                                 expected):
+        np.testing.assert_array_equal(actual, reference)
+
+    t = np.einsum('mij,kj->mki', stresses, normals)
+    np.testing.assert_allclose(expected[0],
+                               np.einsum('mki,ki->mk', t, normals))
+    np.testing.assert_allclose(
+        expected[1], np.sqrt(np.sum(t**2, axis=-1) - expected[0]**2))
+
+
+def test_plane_stresses_lie_in_the_admissible_region():
+    stresses = random_stresses(20)
+    centres, radii = mohr_circles(stresses)
+    sigma_n, tau_n = normal_shear(stresses, hemisphere_normals(300))
+    distance = np.hypot(sigma_n[:, None] - centres[..., None], tau_n[:, None])
+    tol = 1e-9 * radii[:, :1, None]
+    assert np.all(distance[:, 0] <= radii[:, 0, None] + tol)
+    assert np.all(distance[:, 1:] >= radii[:, 1:, None] - tol)
+
+
+def test_renderer_draws_three_circles_per_state():
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots()
+    collection = plot_mohr_circles(ax, random_stresses(4), n_points=50)
+    segments = collection.get_segments()
+    assert len(segments) == 12
+    assert all(segment.shape == (50, 2) for segment in segments)
+    points = ax.collections[-1].get_offsets()
+    assert len(points) == 2 * 4 * 3
+    plt.close(fig)
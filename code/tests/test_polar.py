@@ -0,0 +1,59 @@
+"""Polar decomposition against the SVD, including extreme stretches"""
+
+import warnings
+
+import numpy as np
+import pytest
+
+from biomech import Kinematics, polar_decomposition
+
+
+def random_rotations(rng, n, dim=3):
+    Q, R = np.linalg.qr(rng.normal(size=(n, dim, dim)))
+    Q = Q * np.sign(np.diagonal(R, axis1=-2, axis2=-1))[..., None, :]
+    Q[..., :, 0] *= np.sign(np.linalg.det(Q))[..., None]
+    return Q
+
+
+def stretched(ratio, dim=3, n=200):
+    """F = R U with known factors and stretch ratio λ1/λd"""
+    rng = np.random.default_rng(0)
+    R, V = random_rotations(rng, n, dim), random_rotations(rng, n, dim)
+    stretches = np.sqrt(ratio) ** rng.uniform(-1.0, 1.0, size=(n, dim))
+    stretches[:, 0], stretches[:, -1] = np.sqrt(ratio), 1 / np.sqrt(ratio)
+    U = (V * stretches[:, None, :]) @ np.swapaxes(V, -1, -2)
+    return R @ U, R, U, stretches
+
+
+@pytest.mark.parametrize("dim", [2, 3])
+@pytest.mark.parametrize("ratio", [1.5, 10.0, 1e4, 1e6])
+def test_factors_match_construction(dim, ratio):
+    F, R, U, stretches = stretched(ratio, dim)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        results = polar_decomposition(F)
+    np.testing.assert_allclose(results['R'], R, atol=1e-10)
+    np.testing.assert_allclose(results['U'], U, rtol=0,
+                               atol=1e-13 * np.sqrt(ratio))
+    np.testing.assert_allclose(results['stretches'],
+                               -np.sort(-stretches, axis=-1), rtol=1e-10,
+                               atol=1e-14 * np.sqrt(ratio))
+    np.testing.assert_allclose(Kinematics(F).R, R, atol=1e-10)
+
+
+def test_rotation_angle_and_axis():
+    angle = 0.3
+    F = np.array([[np.cos(angle), -np.sin(angle), 0.],
+                  [np.sin(angle), np.cos(angle), 0.],
+                  [0., 0., 1.]]) @ np.diag([2.0, 1.0, 0.5])
+    results = polar_decomposition(F)
+    np.testing.assert_allclose(results['rotation_angle'], angle)
+    np.testing.assert_allclose(results['rotation_axis'], [0., 0., 1.])
+    np.testing.assert_allclose(results['eulerian_directions'],
+                               results['R'] @ results['lagrangian_directions'])
+
+
+def test_single_extreme_gradient():
+    results = polar_decomposition(np.diag([1e3, 1.0, 1e-3]))
+    np.testing.assert_allclose(results['R'], np.eye(3), atol=1e-15)
+    np.testing.assert_allclose(results['stretches'], [1e3, 1.0, 1e-3])
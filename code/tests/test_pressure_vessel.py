@@ -0,0 +1,68 @@
+"""Laplace-law and Lamé wall stresses and the segment table pipeline"""
+
+import numpy as np
+import pytest
+
+from biomech.pressure_vessel import (
+    lame_stress,
+    process_vessel_file,
+    thin_wall_stress,
+    vessel_stress,
+)
+
+
+def test_laplace_law():
+    hoop, axial, radial = thin_wall_stress([10.0, 4.0], [1.0, 0.5], 0.02)
+    np.testing.assert_allclose(hoop, [0.2, 0.16])
+    np.testing.assert_allclose(axial, [0.1, 0.08])
+    np.testing.assert_array_equal(radial, 0.0)
+    hoop, axial, _ = thin_wall_stress(10.0, 1.0, 0.02, 0.005,
+                                      closed_ends=False)
+    assert hoop == pytest.approx(0.15)
+    assert axial == 0.0
+
+
+def test_lame_boundary_values_and_thin_limit():
+    a, t, p_i, p_o = 10.0, 2.0, 0.02, 0.005
+    _, _, inner = lame_stress(a, t, p_i, p_o, position='inner')
+    _, _, outer = lame_stress(a, t, p_i, p_o, position='outer')
+    assert inner == pytest.approx(-p_i)
+    assert outer == pytest.approx(-p_o)
+
+    thin = thin_wall_stress(a, 1e-3 * a, p_i)
+    lame = lame_stress(a, 1e-3 * a, p_i, position='mid')
+    np.testing.assert_allclose(lame[:2], thin[:2], rtol=1e-3)
+
+    with pytest.raises(ValueError):
+        lame_stress(a, t, p_i, position='centre')
+
+
+def test_segment_table_matches_direct_evaluation(tmp_path):
+    rng = np.random.default_rng(0)
+    segments = np.column_stack([rng.uniform(1.0, 15.0, 10),
+                                rng.uniform(0.1, 1.5, 10),
+                                rng.uniform(0.01, 0.03, 10),
+                                rng.integers(0, 2, 10)])
+    source = tmp_path / "segments.npy"
+    np.save(source, segments)
+    output = tmp_path / "vessels.npy"
+    assert process_vessel_file(source, output, chunk_size=3,
+                               method='lame',
+                               yield_strength=[1.0, 2.0]) == 10
+
+    expected = vessel_stress(*segments[:, :3].T, method='lame',
+                             yield_strength=[1.0, 2.0],
+                             material_ids=segments[:, 3].astype(np.intp))
+    table = np.load(output)
+    assert list(table.dtype.names) == list(expected)
+    for name, values in expected.items():
+        np.testing.assert_allclose(table[name], values)
+
+
+def test_empty_segment_table_writes_header(tmp_path):
+    source = tmp_path / "segments.csv"
+    source.write_text("")
+    output = tmp_path / "vessels.csv"
+    assert process_vessel_file(source, output,
+                               yield_strength=[100.0, 200.0]) == 0
+    assert output.read_text() == "hoop,axial,radial,von_mises,utilisation\n"
@@ -0,0 +1,61 @@
+"""Principal values and frames against the LAPACK eigensolver"""
+
+import numpy as np
+import pytest
+
+from biomech import principal_frame, principal_values, tensor_to_voigt
+
+
+def random_symmetric(rng, shape=()):
+    A = rng.normal(size=shape + (3, 3))
+    return 0.5 * (A + np.swapaxes(A, -1, -2))
+
+
+@pytest.mark.parametrize("scale", [1e-30, 1e-12, 1.0, 1e20])
+def test_principal_values_are_scale_invariant(scale):
+    T = scale * random_symmetric(np.random.default_rng(0), (50,))
+    expected = np.linalg.eigvalsh(T)[..., ::-1]
+    np.testing.assert_allclose(principal_values(T), expected,
+                               rtol=1e-9, atol=1e-9 * scale)
+
+
+def test_voigt_input_and_batch_shape():
+    T = random_symmetric(np.random.default_rng(1), (4, 5))
+    values = principal_values(tensor_to_voigt(T))
+    assert values.shape == (4, 5, 3)
+    np.testing.assert_allclose(values, np.linalg.eigvalsh(T)[..., ::-1],
+                               atol=1e-12)
+
+
+def test_hydrostatic_and_nearly_hydrostatic_tensors():
+    np.testing.assert_allclose(principal_values(-2.0 * np.eye(3)[None]),
+                               [[-2.0, -2.0, -2.0]])
+    T = 1e-12 * np.diag([1.0, 1.0 + 1e-9, 1.0])[None]
+    np.testing.assert_allclose(principal_values(T),
+                               np.linalg.eigvalsh(T)[..., ::-1], rtol=1e-12)
+
+
+def test_principal_frame_is_a_right_handed_eigenbasis():
+    T = random_symmetric(np.random.default_rng(2), (30,))
+    values, directions = principal_frame(T)
+    np.testing.assert_allclose(T @ directions,
+                               directions * values[..., None, :], atol=1e-12)
+    np.testing.assert_allclose(
+        np.swapaxes(directions, -1, -2) @ directions,
+        np.broadcast_to(np.eye(3), T.shape), atol=1e-12)
+    np.testing.assert_allclose(np.linalg.det(directions), 1.0)
+    assert np.all(np.diff(values, axis=-1) <= 0)
+
+
+def test_principal_frame_signs():
+    T = random_symmetric(np.random.default_rng(3), (30,))
+    _, directions = principal_frame(T)
+    for i in (0, 1):
+        n = directions[..., :, i]
+        largest = np.argmax(np.abs(n), axis=-1)[..., None]
+        assert np.all(np.take_along_axis(n, largest, axis=-1) > 0)
+
+    # Flipping the reference directions flips the frame with them
+    reference = -directions[0]
+    _, flipped = principal_frame(T[0], reference=reference)
+    np.testing.assert_allclose(flipped[:, :2], -directions[0][:, :2])
@@ -0,0 +1,47 @@
+"""Headless figure output and the parallel rendering pipeline"""
+
+import matplotlib
+import numpy as np
+import pytest
+
+from biomech.mohr import plot_mohr_circles
+from biomech.rendering import FigureJob, render_figures
+
+
+def plot_case(stresses, title=None):
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots()
+    plot_mohr_circles(ax, stresses)
+    ax.set_title(title)
+    return fig
+
+
+def load_cases():
+    A = np.random.default_rng(0).normal(0.0, 50.0, size=(2, 4, 3, 3))
+    return 0.5 * (A + np.swapaxes(A, -1, -2))
+
+
+def assert_png(path):
+    with open(path, "rb") as handle:
+        assert handle.read(8) == b"\x89PNG\r\n\x1a\n"
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_render_two_figures(tmp_path, processes):
+    jobs = [FigureJob(plot_case, (stresses,), f"case{k}.png",
+                      {'title': f"Load case {k}"})
+            for k, stresses in enumerate(load_cases())]
+    paths = render_figures(jobs, output_dir=tmp_path, processes=processes,
+                           dpi=50)
+    assert paths == [tmp_path / "case0.png", tmp_path / "case1.png"]
+    for path in paths:
+        assert_png(path)
+
+
+def test_serial_rendering_keeps_the_backend(tmp_path):
+    backend = matplotlib.get_backend()
+    render_figures([FigureJob(plot_case, (load_cases()[0],), "case.png")],
+                   output_dir=tmp_path, processes=1, dpi=50)
+    assert matplotlib.get_backend() == backend
+    assert_png(tmp_path / "case.png")
@@ -0,0 +1,76 @@
+"""Process and thread schedulers against the serial analyses"""
+
+import numpy as np
+import pytest
+
+from biomech.failure import evaluate_failure
+from biomech.principal import principal_values
+from biomech.scheduler import run_batch, run_threaded
+from biomech.strain import (
+    analyze_deformation_measures,
+    analyze_strain_tensor,
+)
+from biomech.streaming import stress_analysis
+
+
+def principal_rows(stresses):
+    return {'principal': principal_values(stresses)}
+
+
+def assert_results_equal(actual, expected):
+    assert actual.keys() == expected.keys()
+    for name, values in expected.items():
+        if isinstance(values, dict):
+            assert_results_equal(actual[name], values)
+        else:
+            assert actual[name].dtype == np.asarray(values).dtype
+            np.testing.assert_array_equal(actual[name], values)
+
+
+@pytest.fixture
+def stresses():
+    A = np.random.default_rng(0).normal(0.0, 50.0, size=(3, 40, 3, 3))
+    return 0.5 * (A + np.swapaxes(A, -1, -2))
+
+
+@pytest.mark.parametrize("analysis", [
+    'stress', evaluate_failure, principal_rows, analyze_strain_tensor])
+def test_run_batch_matches_serial(stresses, analysis):
+    expected = run_batch(stresses, analysis, processes=1)
+    actual = run_batch(stresses, analysis, processes=2, chunk_size=25)
+    assert_results_equal(actual, expected)
+
+
+def test_batch_shape_is_kept(stresses):
+    results = run_batch(stresses, principal_rows, processes=2,
+                        chunk_size=25)
+    assert results['principal'].shape == (3, 40, 3)
+
+
+def test_columns_keep_the_load_case_axes(stresses):
+    results = run_batch(stresses, 'stress', processes=2, chunk_size=25)
+    expected = stress_analysis(stresses.reshape(-1, 3, 3))
+    for name, values in expected.items():
+        assert results[name].shape == (3, 40)
+        np.testing.assert_array_equal(results[name].ravel(), values)
+
+
+@pytest.mark.parametrize("analysis", [
+    'stress', evaluate_failure, principal_rows, analyze_strain_tensor])
+@pytest.mark.parametrize("workers", [1, 2])
+def test_run_threaded_matches_serial(stresses, analysis, workers):
+    expected = run_batch(stresses, analysis, processes=1)
+    actual = run_threaded(stresses, analysis, workers=workers,
+                          chunk_size=25)
+    assert_results_equal(actual, expected)
+
+
+def test_run_threaded_nested_measures_and_single_chunk():
+    gradients = np.random.default_rng(1).normal(0.0, 0.05, size=(2, 9, 3, 3))
+    expected = analyze_deformation_measures(gradients)
+    for chunk_size in (4, 100):
+        actual = run_threaded(gradients, analyze_deformation_measures,
+                              workers=2, chunk_size=chunk_size)
+        assert_results_equal(actual, expected)
+    with pytest.raises(ValueError):
+        run_threaded(gradients, 'deformation', chunk_size=0)
@@ -0,0 +1,76 @@
+"""Strain analysis of displacement gradients and the lazy package import"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+
+from biomech import analyze_deformation_measures, analyze_strain_tensor
+
+CODE_DIR = Path(__file__).resolve().parents[1]
+
+# Displacement gradient of exercise 3, task 2.a
+H = np.array([[0.02, 0.01, 0.005],
+              [0.015, 0.03, 0.008],
+              [0.003, 0.012, 0.025]])
+
+
+def run_python(source, tmp_path):
+    env = dict(os.environ, MPLBACKEND="Agg", TKT4150_OUTPUT_DIR=str(tmp_path),
+               PYTHONPATH=str(CODE_DIR))
+    return subprocess.run([sys.executable, "-c", source], cwd=CODE_DIR,
+                          env=env, capture_output=True, text=True,
+                          check=True).stdout
+
+
+def test_deformation_measures_are_exact():
+    measures = analyze_deformation_measures(H)
+    F = np.eye(3) + H
+    F_inv = np.linalg.inv(F)
+    np.testing.assert_allclose(measures['green_lagrange_strain'],
+                               0.5 * (F.T @ F - np.eye(3)), atol=1e-15)
+    np.testing.assert_allclose(measures['almansi_strain'],
+                               0.5 * (np.eye(3) - F_inv.T @ F_inv),
+                               atol=1e-15)
+
+
+def test_batches_match_single_tensors():
+    rng = np.random.default_rng(0)
+    gradients = rng.normal(0.0, 0.05, size=(4, 3, 3))
+    batch = analyze_deformation_measures(gradients)
+    for k, gradient in enumerate(gradients):
+        single = analyze_deformation_measures(gradient)
+        for name in ('green_lagrange_strain', 'almansi_strain',
+                     'principal_strains', 'strain_invariants'):
+            np.testing.assert_allclose(batch[name][k], single[name],
+                                       atol=1e-15)
+
+    strains = 0.5 * (gradients + np.swapaxes(gradients, -1, -2))
+    analysis = analyze_strain_tensor(strains)
+    np.testing.assert_allclose(analysis['volumetric_strain'],
+                               np.trace(strains, axis1=-2, axis2=-1) / 3)
+    np.testing.assert_allclose(analysis['shear_strains'][:, 0],
+                               2 * strains[:, 0, 1])
+
+
+def test_package_import_leaves_matplotlib_unloaded(tmp_path):
+    output = run_python("import sys, biomech, biomech.rendering; "
+                        "print('matplotlib' in sys.modules)", tmp_path)
+    assert output.strip() == "False"
+
+
+def test_exercise_script_keeps_the_exact_almansi_strain(tmp_path):
+    output = run_python(
+        "import json, runpy\n"
+        "results = runpy.run_path('ex3.2.a.py')['main']()\n"
+        "print(json.dumps([results['almansi_strain'].tolist(),\n"
+        "                  results['almansi_strain_approx'].tolist()]))\n",
+        tmp_path)
+    exact, approximate = json.loads(output.splitlines()[-1])
+    np.testing.assert_allclose(
+        exact, analyze_deformation_measures(H)['almansi_strain'])
+    np.testing.assert_allclose(approximate, 0.5 * (H + H.T - H @ H.T))
+    assert (tmp_path / "ex3.2.a-analysis.png").exists()
@@ -0,0 +1,80 @@
+"""Chunked readers, result writers and the streaming pipeline"""
+
+import numpy as np
+import pytest
+
+from biomech.streaming import (
+    NpyResultWriter,
+    iter_tensor_chunks,
+    process_file,
+    stress_analysis,
+)
+
+
+def random_stresses(n):
+    A = np.random.default_rng(0).normal(0.0, 50.0, size=(n, 3, 3))
+    return 0.5 * (A + np.swapaxes(A, -1, -2))
+
+
+def test_csv_chunks_skip_comments(tmp_path):
+    stresses = random_stresses(5)
+    path = tmp_path / "stresses.csv"
+    with open(path, "w") as handle:
+        handle.write("# s11,s12,...\n")
+        np.savetxt(handle, stresses.reshape(5, 9), delimiter=",")
+    chunks = list(iter_tensor_chunks(path, chunk_size=2))
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    np.testing.assert_allclose(np.concatenate(chunks), stresses)
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".npy"])
+def test_chunked_results_match_one_batch(tmp_path, suffix):
+    stresses = random_stresses(10)
+    source = tmp_path / "stresses.npy"
+    np.save(source, stresses)
+    output = tmp_path / ("results" + suffix)
+    assert process_file(source, output, "stress", chunk_size=3) == 10
+
+    expected = stress_analysis(stresses)
+    if suffix == ".npy":
+        table = np.load(output)
+    else:
+        table = np.genfromtxt(output, delimiter=",", names=True)
+    columns = {name: table[name] for name in table.dtype.names}
+    assert list(columns) == list(expected)
+    for name, values in expected.items():
+        np.testing.assert_array_equal(columns[name], values)
+
+
+def test_npy_header_fits_many_columns(tmp_path):
+    path = tmp_path / "wide.npy"
+    names = [f"a_rather_long_result_column_{i}" for i in range(200)]
+    writer = NpyResultWriter(path)
+    for start in (0, 3):
+        writer.write({name: np.arange(start, start + 3.0) + i
+                      for i, name in enumerate(names)})
+    writer.close()
+    table = np.load(path)
+    assert table.dtype.names == tuple(names)
+    np.testing.assert_array_equal(table[names[5]], np.arange(6.0) + 5)
+
+
+def test_npy_without_rows_is_a_valid_empty_array(tmp_path):
+    path = tmp_path / "empty.npy"
+    NpyResultWriter(path).close()
+    assert np.load(path).shape == (0,)
+
+
+@pytest.mark.parametrize("suffix", [".csv", ".npy"])
+def test_empty_input_writes_result_layout(tmp_path, suffix):
+    source = tmp_path / "stresses.npy"
+    np.save(source, np.empty((0, 6)))
+    output = tmp_path / ("results" + suffix)
+    assert process_file(source, output, "stress") == 0
+    columns = list(stress_analysis(np.empty((0, 6))))
+    if suffix == ".npy":
+        table = np.load(output)
+        assert table.shape == (0,)
+        assert list(table.dtype.names) == columns
+    else:
+        assert output.read_text() == ",".join(columns) + "\n"
@@ -0,0 +1,59 @@
+"""Directional stretches and their exact extrema"""
+
+import numpy as np
+import pytest
+
+from biomech import (
+    circle_directions,
+    directional_stretch,
+    fibonacci_sphere,
+    stretch_extrema,
+)
+
+
+def random_gradients(dim, n=10):
+    H = np.random.default_rng(0).normal(0.0, 0.3, size=(n, dim, dim))
+    return np.eye(dim) + H
+
+
+def test_stretch_is_length_ratio():
+    F = random_gradients(3)
+    directions = 2.5 * fibonacci_sphere(50)
+    expected = (np.linalg.norm(np.einsum('nij,kj->nki', F, directions),
+                               axis=-1)
+                / np.linalg.norm(directions, axis=-1))
+    np.testing.assert_allclose(directional_stretch(F, directions), expected)
+
+
+def test_fibonacci_sphere_is_unit_and_balanced():
+    directions = fibonacci_sphere(1000)
+    np.testing.assert_allclose(np.linalg.norm(directions, axis=-1), 1.0)
+    np.testing.assert_allclose(directions.mean(axis=0), 0.0, atol=1e-2)
+
+
+@pytest.mark.parametrize("dim", [2, 3])
+def test_extrema_bound_sampled_stretches(dim):
+    F = random_gradients(dim)
+    if dim == 2:
+        _, directions = circle_directions(2000)
+    else:
+        directions = fibonacci_sphere(20000)
+    sampled = directional_stretch(F, directions)
+    extrema = stretch_extrema(F)
+    assert np.all(sampled.max(axis=-1) <= extrema['max_stretch'] + 1e-12)
+    assert np.all(sampled.min(axis=-1) >= extrema['min_stretch'] - 1e-12)
+    np.testing.assert_allclose(sampled.max(axis=-1), extrema['max_stretch'],
+                               rtol=1e-3)
+    # The extrema are attained along the returned directions
+    for name in ('max', 'min'):
+        attained = np.linalg.norm(
+            np.einsum('nij,nj->ni', F, extrema[f'{name}_direction']),
+            axis=-1)
+        np.testing.assert_allclose(attained, extrema[f'{name}_stretch'])
+
+
+def test_angles_of_a_stretched_square():
+    F = np.diag([2.0, 0.5])[None]
+    extrema = stretch_extrema(F)
+    np.testing.assert_allclose(extrema['max_angle'], [0.0])
+    np.testing.assert_allclose(extrema['min_angle'], [np.pi / 2])
@@ -0,0 +1,67 @@
+"""Round trips through memory-mapped tensor field files"""
+
+import numpy as np
+import pytest
+
+from biomech.invariants import tensor_to_voigt
+from biomech.streaming import stress_analysis
+from biomech.tensor_field import (
+    HEADER_SIZE,
+    open_tensor_field,
+    write_tensor_field,
+)
+
+
+def random_stresses(n):
+    A = np.random.default_rng(0).normal(0.0, 50.0, size=(n, 3, 3))
+    return 0.5 * (A + np.swapaxes(A, -1, -2))
+
+
+def test_round_trip_keeps_values_and_metadata(tmp_path):
+    stresses = random_stresses(25)
+    path = tmp_path / "femur.tfld"
+    write_tensor_field(path, stresses, chunk_size=7, dtype=np.float64,
+                       quantity="strain", units="-")
+    assert path.stat().st_size == HEADER_SIZE + 25 * 6 * 8
+
+    field = open_tensor_field(path)
+    assert len(field) == 25
+    assert (field.quantity, field.units) == ("strain", "-")
+    np.testing.assert_array_equal(field.voigt(), tensor_to_voigt(stresses))
+    # Chunks of a field in the standard order are views of the file
+    _, _, view = next(field.chunks(10))
+    assert np.shares_memory(view, field.data)
+
+
+def test_permuted_components_are_reordered(tmp_path):
+    stresses = random_stresses(5)
+    path = tmp_path / "permuted.tfld"
+    write_tensor_field(path, stresses, dtype=np.float64,
+                       components=("11", "22", "33", "12", "13", "23"))
+    field = open_tensor_field(path)
+    np.testing.assert_array_equal(field.data[:, 3], stresses[:, 0, 1])
+    np.testing.assert_array_equal(field.voigt(), tensor_to_voigt(stresses))
+
+
+def test_apply_writes_sibling_results(tmp_path):
+    stresses = random_stresses(25)
+    path = tmp_path / "femur.tfld"
+    write_tensor_field(path, stresses)
+    field = open_tensor_field(path)
+    results = field.apply(stress_analysis, chunk_size=10)
+    expected = stress_analysis(field.voigt())
+    assert (tmp_path / "femur.von_mises.npy").exists()
+    # Results are stored in the float32 dtype of the field
+    np.testing.assert_allclose(field.open_result("von_mises"),
+                               expected['von_mises'], rtol=1e-6)
+    assert set(results) == set(expected)
+
+
+def test_foreign_files_and_dtypes_are_rejected(tmp_path):
+    path = tmp_path / "other.tfld"
+    path.write_bytes(b"\x00" * HEADER_SIZE)
+    with pytest.raises(ValueError):
+        open_tensor_field(path)
+    with pytest.raises(ValueError):
+        write_tensor_field(tmp_path / "int.tfld", random_stresses(2),
+                           dtype=np.int32)
@@ -0,0 +1,49 @@
+"""Critical planes against the principal frame and the plane search"""
+
+import numpy as np
+
+from biomech.principal import principal_values
+from biomech.traction import critical_plane, hemisphere_normals
+
+
+def random_stresses(n):
+    A = np.random.default_rng(0).normal(0.0, 50.0, size=(n, 3, 3))
+    return 0.5 * (A + np.swapaxes(A, -1, -2))
+
+
+def test_exact_planes_match_principal_values():
+    stresses = random_stresses(20)
+    values = principal_values(stresses)
+    normal = critical_plane(stresses, 'normal')
+    shear = critical_plane(stresses, 'shear')
+    np.testing.assert_allclose(normal['value'], values[:, 0])
+    np.testing.assert_allclose(shear['value'],
+                               0.5 * (values[:, 0] - values[:, 2]))
+
+    for plane in (normal, shear):
+        np.testing.assert_allclose(np.linalg.norm(plane['normal'], axis=-1),
+                                   1.0)
+        t = np.einsum('...ij,...j->...i', stresses, plane['normal'])
+        sigma_n = np.sum(t * plane['normal'], axis=-1)
+        tau_n = np.linalg.norm(t - sigma_n[:, None] * plane['normal'],
+                               axis=-1)
+        np.testing.assert_allclose(sigma_n, plane['sigma_n'], atol=1e-10)
+        np.testing.assert_allclose(tau_n, plane['tau_n'], atol=1e-10)
+
+
+def test_exact_planes_bound_the_search():
+    stresses = random_stresses(20)
+    normals = hemisphere_normals(2000)
+    for criterion in ('normal', 'shear'):
+        exact = critical_plane(stresses, criterion)['value']
+        searched = critical_plane(stresses, criterion,
+                                  normals=normals)['value']
+        assert np.all(searched <= exact + 1e-9)
+        np.testing.assert_allclose(searched, exact, rtol=1e-2)
+
+
+def test_pure_shear_plane_is_exact():
+    stresses = np.zeros((1, 3, 3))
+    stresses[0, 0, 1] = stresses[0, 1, 0] = 45.0
+    plane = critical_plane(stresses, 'shear')
+    assert plane['value'][0] == 45.0